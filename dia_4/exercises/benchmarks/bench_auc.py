@@ -0,0 +1,103 @@
+"""
+Benchmark: AUC-ROC exacto por rangos vs AUC por histogramas en streaming.
+
+Genera n muestras (etiquetas int8, scores float32) y mide:
+- auc_roc: exacto (Mann-Whitney, un argsort) con todo el array en memoria
+- BinnedAUCAccumulator: por trozos, memoria O(chunk + n_bins), y su error
+- (--memmap) el acumulador leyendo los arrays de ficheros .npy con mmap
+- (n <= --legacy-max) la versión anterior: argsort + curva ROC + trapezoide
+
+Ejecutar:
+    uv run python benchmarks/bench_auc.py
+    uv run python benchmarks/bench_auc.py --samples 10000000 --bins 1000 100000 --memmap
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from exercises.bloque_4.helpers import auc_roc
+from exercises.bloque_4.streaming import BinnedAUCAccumulator
+
+
+def make_data(samples: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Labels (int8) and partially separated scores (float32), built in chunks."""
+    rng = np.random.default_rng(seed)
+    y_true = np.empty(samples, dtype=np.int8)
+    y_proba = np.empty(samples, dtype=np.float32)
+    step = 1 << 22
+    for start in range(0, samples, step):
+        stop = min(start + step, samples)
+        labels = rng.integers(0, 2, stop - start, dtype=np.int8)
+        y_true[start:stop] = labels
+        y_proba[start:stop] = np.clip(rng.normal(0.45 + 0.1 * labels, 0.2), 0, 1)
+    return y_true, y_proba
+
+
+def legacy_auc(y_true: np.ndarray, y_proba: np.ndarray) -> float:
+    """Previous implementation (ROC curve + trapezoid, ties in input order)."""
+    order = np.argsort(-y_proba)
+    y_sorted = y_true[order].astype(np.int64)
+    tps = np.cumsum(y_sorted)
+    fps = np.cumsum(1 - y_sorted)
+    return float(np.trapezoid(tps / tps[-1], fps / fps[-1]))
+
+
+def timed(func, *args):
+    """Return (result, seconds)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def binned(y_true, y_proba, n_bins: int, chunk_size: int) -> float:
+    accumulator = BinnedAUCAccumulator(n_bins=n_bins)
+    accumulator.update_chunked(y_true, y_proba, chunk_size=chunk_size)
+    return accumulator.auc()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark: AUC-ROC exacto por rangos vs AUC por histogramas en streaming"
+    )
+    parser.add_argument("--samples", type=int, default=100_000_000)
+    parser.add_argument("--bins", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    parser.add_argument("--chunk-size", type=int, default=1 << 20)
+    parser.add_argument("--legacy-max", type=int, default=10_000_000)
+    parser.add_argument("--memmap", action="store_true")
+    args = parser.parse_args()
+
+    y_true, y_proba = make_data(args.samples)
+    print(f"samples: {args.samples:,}  (labels int8, scores float32)")
+
+    exact, seconds = timed(auc_roc, y_true, y_proba)
+    print(f"{'auc_roc (exact)':>28}: {seconds:8.2f} s  auc={exact:.6f}")
+
+    if args.samples <= args.legacy_max:
+        legacy, seconds = timed(legacy_auc, y_true, y_proba)
+        print(f"{'legacy trapezoid':>28}: {seconds:8.2f} s  auc={legacy:.6f}")
+
+    for n_bins in args.bins:
+        approx, seconds = timed(binned, y_true, y_proba, n_bins, args.chunk_size)
+        name = f"binned n_bins={n_bins:,}"
+        print(f"{name:>28}: {seconds:8.2f} s  auc={approx:.6f}  error={abs(approx - exact):.2e}")
+
+    if args.memmap:
+        with tempfile.TemporaryDirectory() as tmp:
+            np.save(Path(tmp) / "y_true.npy", y_true)
+            np.save(Path(tmp) / "y_proba.npy", y_proba)
+            del y_true, y_proba
+            mapped_true = np.load(Path(tmp) / "y_true.npy", mmap_mode="r")
+            mapped_proba = np.load(Path(tmp) / "y_proba.npy", mmap_mode="r")
+            n_bins = args.bins[-1]
+            approx, seconds = timed(binned, mapped_true, mapped_proba, n_bins, args.chunk_size)
+            name = f"memmap n_bins={n_bins:,}"
+            error = abs(approx - exact)
+            print(f"{name:>28}: {seconds:8.2f} s  auc={approx:.6f}  error={error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: bootstrap con bucle de Python vs bootstrap vectorizado por bloques.
+
+Compara, para n muestras y B réplicas:
+- loop: remuestrear con índices y llamar a evaluate() B veces
+- vectorized: evaluate_bootstrap() (multinomial si todas las métricas salen
+  de la matriz de confusión; matriz de índices + bincount si hay AUC)
+
+Ejecutar:
+    uv run python benchmarks/bench_bootstrap.py
+    uv run python benchmarks/bench_bootstrap.py --samples 1000000 --resamples 1000 --workers 4
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from exercises.bloque_4.evaluation import (
+    AccuracyMetric,
+    AUCROCMetric,
+    ClassificationEvaluator,
+    F1Metric,
+    MCCMetric,
+    PrecisionMetric,
+    RecallMetric,
+)
+from exercises.bloque_4.protocols import ClassificationMetric, ProbabilisticMetric
+
+
+def loop_bootstrap(evaluator, y_true, y_pred, y_proba, n_resamples: int) -> None:
+    """Naive bootstrap: one evaluate() per resample."""
+    rng = np.random.default_rng(0)
+    for _ in range(n_resamples):
+        rows = rng.integers(0, y_true.size, y_true.size)
+        evaluator.evaluate(y_true[rows], y_pred[rows], None if y_proba is None else y_proba[rows])
+
+
+def timed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark: bootstrap con bucle de Python vs bootstrap vectorizado por bloques"
+    )
+    parser.add_argument("--samples", type=int, default=100_000)
+    parser.add_argument("--resamples", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, args.samples, dtype=np.int8)
+    y_pred = np.where(rng.random(args.samples) < 0.8, y_true, 1 - y_true).astype(np.int8)
+    y_proba = np.clip(0.3 + 0.4 * y_true + rng.normal(0, 0.2, args.samples), 0, 1)
+    metrics: list[ClassificationMetric] = [
+        AccuracyMetric(),
+        PrecisionMetric(),
+        RecallMetric(),
+        F1Metric(),
+        MCCMetric(),
+    ]
+    cases: list[tuple[str, list[ProbabilisticMetric], np.ndarray | None]] = [
+        ("confusion metrics", [], None),
+        ("confusion metrics + AUC", [AUCROCMetric()], y_proba),
+    ]
+
+    print(f"samples: {args.samples:,}  resamples: {args.resamples:,}")
+    for label, probabilistic, proba in cases:
+        evaluator = ClassificationEvaluator(metrics, probabilistic_metrics=probabilistic)
+        loop = timed(loop_bootstrap, evaluator, y_true, y_pred, proba, args.resamples)
+        vectorized = timed(
+            evaluator.evaluate_bootstrap,
+            y_true,
+            y_pred,
+            proba,
+            n_resamples=args.resamples,
+            seed=0,
+            max_workers=args.workers,
+        )
+        print(
+            f"{label:>26}: loop {loop:8.2f} s  vectorized {vectorized:8.2f} s  "
+            f"(x{loop / vectorized:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
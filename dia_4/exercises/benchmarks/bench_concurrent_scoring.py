@@ -0,0 +1,78 @@
+"""
+Benchmark: análisis en serie vs ConcurrentSentimentAnalyzer.
+
+Simula un analyzer remoto con latencia artificial (un round trip de red por
+llamada), en versión bloqueante (time.sleep) y asíncrona (asyncio.sleep), y
+mide reviews por segundo con distintos valores de max_in_flight.
+
+Ejecutar:
+    uv run python benchmarks/bench_concurrent_scoring.py
+    uv run python benchmarks/bench_concurrent_scoring.py --reviews 2000 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from exercises.bloque_3.concurrency import ConcurrentSentimentAnalyzer
+
+
+class FakeRemoteAnalyzer:
+    """Blocking analyzer that waits latency seconds per call."""
+
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+
+    def analyze(self, text: str) -> float:
+        time.sleep(self._latency)
+        return 0.0
+
+
+class AsyncFakeRemoteAnalyzer:
+    """Async analyzer that waits latency seconds per call."""
+
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+
+    async def analyze(self, text: str) -> float:
+        await asyncio.sleep(self._latency)
+        return 0.0
+
+
+def reviews_per_second(score_batch, texts: list[str]) -> float:
+    """Score texts with score_batch and return reviews per second."""
+    start = time.perf_counter()
+    score_batch(texts)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark: análisis en serie vs ConcurrentSentimentAnalyzer"
+    )
+    parser.add_argument("--reviews", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--in-flight", type=int, nargs="+", default=[8, 32, 128])
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    texts = [f"review {i}" for i in range(args.reviews)]
+    blocking = FakeRemoteAnalyzer(latency)
+
+    serial_texts = texts[: max(1, args.reviews // 10)]
+    serial = reviews_per_second(lambda batch: [blocking.analyze(t) for t in batch], serial_texts)
+    print(f"{'serial':>24}: {serial:10,.0f} reviews/s")
+
+    for in_flight in args.in_flight:
+        for label, analyzer in (
+            ("threads", blocking),
+            ("asyncio", AsyncFakeRemoteAnalyzer(latency)),
+        ):
+            with ConcurrentSentimentAnalyzer(analyzer, max_in_flight=in_flight) as concurrent:
+                rate = reviews_per_second(concurrent.analyze_batch, texts)
+            name = f"{label} in_flight={in_flight}"
+            print(f"{name:>24}: {rate:10,.0f} reviews/s  (x{rate / serial:.1f})")
+
+
+if __name__ == "__main__":
+    main()
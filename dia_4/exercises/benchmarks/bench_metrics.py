@@ -0,0 +1,317 @@
+"""
+Benchmark: tiempo y memoria de las métricas del Bloque 4, helper vs evaluador.
+
+Para cada tamaño, dtype y disposición en memoria mide:
+- helper: la función de helpers.py (accuracy, f1_binary, auc_roc, rmse, mae)
+- evaluator: la misma métrica dentro de ClassificationEvaluator /
+  RegressionEvaluator con una sola métrica. La diferencia es el coste del
+  despacho por Protocol (isinstance, EvaluationResult...); en f1 el
+  evaluador además usa la matriz de confusión (compute_from_confusion)
+
+Dimensiones:
+- etiquetas int8 o bool (accuracy, f1, auc)
+- scores float32 o float64 (auc, rmse, mae)
+- contiguous: arrays contiguos; strided: columna de una matriz (n, 2), paso
+  de 2 elementos (lo que llega al sacar una columna de un DataFrame o matriz)
+
+El tiempo es el mejor de --repeat repeticiones (con varias llamadas por
+repetición en tamaños pequeños). La memoria es el pico de tracemalloc en una
+llamada aparte (numpy registra sus buffers en tracemalloc). 10^8 muestras
+necesita varios GB: pásalo explícitamente con --sizes.
+
+Ejecutar:
+    uv run python benchmarks/bench_metrics.py
+    uv run python benchmarks/bench_metrics.py --sizes 1000000 --metrics auc_roc --layouts strided
+    uv run python benchmarks/bench_metrics.py --sizes 100000000 --output results.json
+    uv run python benchmarks/bench_metrics.py --output results.csv
+"""
+
+import argparse
+import csv
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+from exercises.bloque_4.evaluation import (
+    AccuracyMetric,
+    AUCROCMetric,
+    ClassificationEvaluator,
+    F1Metric,
+    MAEMetric,
+    RegressionEvaluator,
+    RMSEMetric,
+)
+from exercises.bloque_4.helpers import accuracy, auc_roc, f1_binary, mae, rmse
+
+LABEL_DTYPES = {"int8": np.int8, "bool": np.bool_}
+SCORE_DTYPES = {"float32": np.float32, "float64": np.float64}
+LAYOUTS = ("contiguous", "strided")
+METRIC_NAMES = ("accuracy", "f1", "auc_roc", "rmse", "mae")
+# Llamadas por repetición: unas 10^6 muestras procesadas, para que 10^3 no mida solo ruido
+_SAMPLES_PER_REPEAT = 1_000_000
+_GENERATION_CHUNK = 1 << 22
+
+
+@dataclass
+class Arrays:
+    """Datos de un caso. Las métricas de regresión usan y_true/y_pred de scores."""
+
+    y_true: np.ndarray
+    y_pred: np.ndarray
+    y_proba: np.ndarray | None = None
+
+
+@dataclass(frozen=True)
+class MetricCase:
+    """Una métrica: qué datos necesita y cómo llamarla por cada camino."""
+
+    name: str
+    uses_labels: bool
+    uses_scores: bool
+    paths: dict[str, Callable[[Arrays], float]]
+
+
+@dataclass
+class Record:
+    """Una fila de resultados (una métrica, un camino, un caso)."""
+
+    metric: str
+    path: str
+    samples: int
+    label_dtype: str
+    score_dtype: str
+    layout: str
+    seconds: float
+    peak_bytes: int
+    samples_per_second: float
+    overhead_seconds: float | None = None
+
+
+def build_cases() -> list[MetricCase]:
+    """Métricas medidas, con su evaluador creado una sola vez."""
+    evaluators = {
+        "accuracy": ClassificationEvaluator([AccuracyMetric()]),
+        "f1": ClassificationEvaluator([F1Metric()]),
+        "auc_roc": ClassificationEvaluator([], probabilistic_metrics=[AUCROCMetric()]),
+        "rmse": RegressionEvaluator([RMSEMetric()]),
+        "mae": RegressionEvaluator([MAEMetric()]),
+    }
+
+    def evaluator_path(name: str) -> Callable[[Arrays], float]:
+        evaluator = evaluators[name]
+        if name == "auc_roc":
+            return lambda d: evaluator.evaluate(d.y_true, d.y_pred, d.y_proba).metrics[name]
+        return lambda d: evaluator.evaluate(d.y_true, d.y_pred).metrics[name]
+
+    helpers = {
+        "accuracy": (lambda d: accuracy(d.y_true, d.y_pred), True, False),
+        "f1": (lambda d: f1_binary(d.y_true, d.y_pred), True, False),
+        "auc_roc": (lambda d: auc_roc(d.y_true, d.y_proba), True, True),
+        "rmse": (lambda d: rmse(d.y_true, d.y_pred), False, True),
+        "mae": (lambda d: mae(d.y_true, d.y_pred), False, True),
+    }
+    return [
+        MetricCase(
+            name=name,
+            uses_labels=uses_labels,
+            uses_scores=uses_scores,
+            paths={"helper": helper, "evaluator": evaluator_path(name)},
+        )
+        for name, (helper, uses_labels, uses_scores) in helpers.items()
+    ]
+
+
+def allocate(samples: int, dtype: type, layout: str) -> np.ndarray:
+    """Array vacío contiguo, o columna 0 de una matriz (samples, 2) si layout es strided."""
+    if layout == "contiguous":
+        return np.empty(samples, dtype=dtype)
+    return np.empty((samples, 2), dtype=dtype)[:, 0]
+
+
+def make_classification(
+    samples: int, label_dtype: type, score_dtype: type, layout: str, seed: int = 0
+) -> Arrays:
+    """Etiquetas 0/1, predicciones con un 20% de errores y scores parcialmente separados."""
+    rng = np.random.default_rng(seed)
+    y_true = allocate(samples, label_dtype, layout)
+    y_pred = allocate(samples, label_dtype, layout)
+    y_proba = allocate(samples, score_dtype, layout)
+    for start in range(0, samples, _GENERATION_CHUNK):
+        stop = min(start + _GENERATION_CHUNK, samples)
+        labels = rng.integers(0, 2, stop - start, dtype=np.int8)
+        y_true[start:stop] = labels
+        y_pred[start:stop] = np.where(rng.random(stop - start) < 0.8, labels, 1 - labels)
+        y_proba[start:stop] = np.clip(rng.normal(0.45 + 0.1 * labels, 0.2), 0, 1)
+    return Arrays(y_true=y_true, y_pred=y_pred, y_proba=y_proba)
+
+
+def make_regression(samples: int, score_dtype: type, layout: str, seed: int = 0) -> Arrays:
+    """Valores reales normales y predicciones con ruido."""
+    rng = np.random.default_rng(seed)
+    y_true = allocate(samples, score_dtype, layout)
+    y_pred = allocate(samples, score_dtype, layout)
+    for start in range(0, samples, _GENERATION_CHUNK):
+        stop = min(start + _GENERATION_CHUNK, samples)
+        values = rng.normal(0, 1, stop - start)
+        y_true[start:stop] = values
+        y_pred[start:stop] = values + rng.normal(0, 0.5, stop - start)
+    return Arrays(y_true=y_true, y_pred=y_pred)
+
+
+def best_time(func: Callable[[Arrays], float], data: Arrays, samples: int, repeat: int) -> float:
+    """Mejor tiempo por llamada de repeat repeticiones."""
+    number = max(1, _SAMPLES_PER_REPEAT // samples)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(data)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def peak_memory(func: Callable[[Arrays], float], data: Arrays) -> int:
+    """Pico de memoria (bytes) asignada durante una llamada, según tracemalloc."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        func(data)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(args: argparse.Namespace) -> list[Record]:
+    """Mide cada combinación pedida y devuelve las filas de resultados."""
+    cases = [case for case in build_cases() if case.name in args.metrics]
+    records = []
+    for samples in args.sizes:
+        for layout in args.layouts:
+            for label_name in args.label_dtypes:
+                for score_name in args.score_dtypes:
+                    # Cada métrica se mide solo en las dimensiones que usa
+                    selected = [
+                        case
+                        for case in cases
+                        if (case.uses_scores or score_name == args.score_dtypes[0])
+                        and (case.uses_labels or label_name == args.label_dtypes[0])
+                    ]
+                    datasets: dict[bool, Arrays] = {}
+                    for case in selected:
+                        if case.uses_labels not in datasets:
+                            datasets[case.uses_labels] = (
+                                make_classification(
+                                    samples,
+                                    LABEL_DTYPES[label_name],
+                                    SCORE_DTYPES[score_name],
+                                    layout,
+                                )
+                                if case.uses_labels
+                                else make_regression(samples, SCORE_DTYPES[score_name], layout)
+                            )
+                        records += measure(
+                            case,
+                            datasets[case.uses_labels],
+                            samples,
+                            label_name if case.uses_labels else "-",
+                            score_name if case.uses_scores else "-",
+                            layout,
+                            args.repeat,
+                        )
+    return records
+
+
+def measure(
+    case: MetricCase,
+    data: Arrays,
+    samples: int,
+    label_dtype: str,
+    score_dtype: str,
+    layout: str,
+    repeat: int,
+) -> list[Record]:
+    """Filas de una métrica en un caso: una por camino, el evaluador con su sobrecoste."""
+    records = []
+    for path, func in case.paths.items():
+        seconds = best_time(func, data, samples, repeat)
+        records.append(
+            Record(
+                metric=case.name,
+                path=path,
+                samples=samples,
+                label_dtype=label_dtype,
+                score_dtype=score_dtype,
+                layout=layout,
+                seconds=seconds,
+                peak_bytes=peak_memory(func, data),
+                samples_per_second=samples / seconds,
+            )
+        )
+    helper_seconds = records[0].seconds
+    for record in records[1:]:
+        record.overhead_seconds = record.seconds - helper_seconds
+    return records
+
+
+def print_table(records: list[Record]) -> None:
+    """Tabla legible en stdout."""
+    print(
+        f"{'metric':>9} {'path':>9} {'samples':>12} {'labels':>7} {'scores':>7} "
+        f"{'layout':>10} {'time':>11} {'peak MiB':>9} {'Msamples/s':>10} {'overhead':>11}"
+    )
+    for r in records:
+        overhead = "" if r.overhead_seconds is None else f"{r.overhead_seconds * 1e3:+9.3f}ms"
+        print(
+            f"{r.metric:>9} {r.path:>9} {r.samples:>12,} {r.label_dtype:>7} {r.score_dtype:>7} "
+            f"{r.layout:>10} {r.seconds * 1e3:9.3f}ms {r.peak_bytes / 2**20:9.1f} "
+            f"{r.samples_per_second / 1e6:10.1f} {overhead:>11}"
+        )
+
+
+def write_output(records: list[Record], path: Path) -> None:
+    """Escribe los resultados en JSON o CSV según la extensión de path."""
+    rows = [asdict(record) for record in records]
+    if path.suffix == ".json":
+        path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    else:
+        with path.open("w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]) if rows else [])
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark: tiempo y memoria de las métricas del Bloque 4, helper vs evaluador"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10**3, 10**4, 10**5, 10**6, 10**7]
+    )
+    parser.add_argument("--metrics", nargs="+", choices=METRIC_NAMES, default=list(METRIC_NAMES))
+    parser.add_argument(
+        "--label-dtypes", nargs="+", choices=LABEL_DTYPES, default=list(LABEL_DTYPES)
+    )
+    parser.add_argument(
+        "--score-dtypes", nargs="+", choices=SCORE_DTYPES, default=list(SCORE_DTYPES)
+    )
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=list(LAYOUTS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="fichero .json o .csv con los resultados")
+    args = parser.parse_args()
+    if args.output is not None and args.output.suffix not in (".json", ".csv"):
+        parser.error("--output must end in .json or .csv")
+
+    records = run(args)
+    print_table(records)
+    if args.output is not None:
+        write_output(records, args.output)
+        print(f"\n{len(records)} results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark de throughput: TextPreprocessingPipeline en serie vs en paralelo.
+
+Compara process_many() (un solo núcleo) con process_parallel() para varias
+combinaciones de número de procesos y tamaño de trozo.
+
+Ejecutar:
+    uv run python benchmarks/bench_pipeline_parallel.py
+    uv run python benchmarks/bench_pipeline_parallel.py --texts 1000000 --workers 2 4 8
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+from exercises.bloque_2.preprocessing import (
+    LowercaseNormalizer,
+    MinLengthFilter,
+    StopwordFilter,
+    TextPreprocessingPipeline,
+    WhitespaceTokenizer,
+)
+
+STOPWORDS = {"the", "is", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for"}
+WORDS = [
+    "The", "product", "is", "GREAT", "and", "the", "delivery", "was", "fast",
+    "but", "packaging", "a", "bit", "poor", "I", "love", "it", "for", "kids",
+]  # fmt: skip
+
+
+def generate_reviews(n_texts: int, seed: int = 0) -> list[str]:
+    """Generate n_texts synthetic reviews of 10 to 60 words."""
+    rng = random.Random(seed)
+    return ["  ".join(rng.choices(WORDS, k=rng.randint(10, 60))) for _ in range(n_texts)]
+
+
+def throughput(results, n_texts: int) -> float:
+    """Consume results and return texts per second."""
+    start = time.perf_counter()
+    deque(results, maxlen=0)
+    return n_texts / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark de throughput: TextPreprocessingPipeline en serie vs en paralelo"
+    )
+    parser.add_argument("--texts", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[500, 2000])
+    args = parser.parse_args()
+
+    pipeline = TextPreprocessingPipeline(
+        normalizer=LowercaseNormalizer(),
+        tokenizer=WhitespaceTokenizer(),
+        filters=[StopwordFilter(stopwords=STOPWORDS), MinLengthFilter(min_length=3)],
+    )
+    texts = generate_reviews(args.texts)
+
+    serial = throughput(pipeline.process_many(texts), len(texts))
+    print(f"{'serial':>22}: {serial:12,.0f} textos/s")
+    for workers in args.workers:
+        for chunk_size in args.chunk_sizes:
+            results = pipeline.process_parallel(
+                texts, max_workers=workers, chunk_size=chunk_size
+            )
+            rate = throughput(results, len(texts))
+            label = f"workers={workers} chunk={chunk_size}"
+            print(f"{label:>22}: {rate:12,.0f} textos/s  (x{rate / serial:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark de I/O de los loaders y savers CSV / SQLite del Bloque 3.
+
+Mide filas por segundo al:
+- Cargar y validar reviews desde CSV y desde SQLite (load_chunks)
+- Guardar resultados en SQLite con executemany en una transacción por lote
+  (SQLiteResultSaver) frente a un INSERT + commit por fila
+- Guardar resultados en CSV (CSVResultSaver)
+
+Ejecutar:
+    uv run python benchmarks/bench_review_storage.py
+    uv run python benchmarks/bench_review_storage.py --rows 1000000 --chunk-size 10000
+"""
+
+import argparse
+import csv
+import sqlite3
+import tempfile
+import time
+from collections import deque
+from contextlib import closing
+from dataclasses import astuple
+from pathlib import Path
+
+from exercises.bloque_3.scoring import ScoringResult
+from exercises.bloque_3.storage import (
+    CSVResultSaver,
+    CSVReviewLoader,
+    SQLiteResultSaver,
+    SQLiteReviewLoader,
+)
+
+
+def write_review_files(directory: Path, n_rows: int) -> tuple[Path, Path]:
+    """Write n_rows reviews to a CSV file and a SQLite table."""
+    rows = [(f"review {i} is great", i % 5 + 1, f"Widget {i % 100}") for i in range(n_rows)]
+    csv_path = directory / "reviews.csv"
+    with csv_path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["text", "rating", "product"])
+        writer.writerows(rows)
+    db_path = directory / "reviews.db"
+    with closing(sqlite3.connect(db_path)) as connection, connection:
+        connection.execute("CREATE TABLE reviews (text TEXT, rating INTEGER, product TEXT)")
+        connection.executemany("INSERT INTO reviews VALUES (?, ?, ?)", rows)
+    return csv_path, db_path
+
+
+def rows_per_second(fn, n_rows: int) -> float:
+    """Run fn once and return n_rows divided by the elapsed time."""
+    start = time.perf_counter()
+    fn()
+    return n_rows / (time.perf_counter() - start)
+
+
+def save_row_by_row(path: Path, results: list[ScoringResult]) -> None:
+    """Baseline: one INSERT and one commit per result."""
+    with closing(sqlite3.connect(path)) as connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS scoring_results "
+            "(review_text TEXT, sentiment_score REAL, label TEXT, scored_at TEXT)"
+        )
+        for result in results:
+            connection.execute("INSERT INTO scoring_results VALUES (?, ?, ?, ?)", astuple(result))
+            connection.commit()
+
+
+def save_in_chunks(saver, results: list[ScoringResult], chunk_size: int) -> None:
+    """Save results with one save() call per chunk, like run_streaming()."""
+    for start in range(0, len(results), chunk_size):
+        saver.save(results[start : start + chunk_size])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark de I/O de los loaders y savers CSV / SQLite del Bloque 3"
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=5_000)
+    parser.add_argument(
+        "--row-by-row-rows", type=int, default=5_000, help="filas para la línea base por fila"
+    )
+    args = parser.parse_args()
+
+    results = [
+        ScoringResult(f"review {i}", 0.5, "positive", "2024-01-01T00:00:00")
+        for i in range(args.rows)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        csv_path, db_path = write_review_files(directory, args.rows)
+
+        measurements = {
+            "load CSV": rows_per_second(
+                lambda: deque(CSVReviewLoader(csv_path).load_chunks(args.chunk_size), 0),
+                args.rows,
+            ),
+            "load SQLite": rows_per_second(
+                lambda: deque(SQLiteReviewLoader(db_path).load_chunks(args.chunk_size), 0),
+                args.rows,
+            ),
+            "save CSV (writerows)": rows_per_second(
+                lambda: save_in_chunks(
+                    CSVResultSaver(directory / "results.csv"), results, args.chunk_size
+                ),
+                args.rows,
+            ),
+            "save SQLite (executemany)": rows_per_second(
+                lambda: save_in_chunks(
+                    SQLiteResultSaver(directory / "bulk.db"), results, args.chunk_size
+                ),
+                args.rows,
+            ),
+            "save SQLite (row by row)": rows_per_second(
+                lambda: save_row_by_row(
+                    directory / "row_by_row.db", results[: args.row_by_row_rows]
+                ),
+                args.row_by_row_rows,
+            ),
+        }
+
+    for name, rate in measurements.items():
+        print(f"{name:>28}: {rate:12,.0f} filas/s")
+
+
+if __name__ == "__main__":
+    main()
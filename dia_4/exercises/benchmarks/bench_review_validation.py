@@ -0,0 +1,63 @@
+"""
+Benchmark de los caminos de validación de Review para cargas masivas.
+
+Compara, sobre las mismas filas:
+- Review(**row) fila a fila (lo que haría un loader ingenuo)
+- validate_reviews: TypeAdapter(list[Review]) una vez por lote
+- validate_reviews_json: validate_json directamente desde bytes JSON
+- construct_reviews: model_construct, sin validación (fuentes de confianza)
+
+Ejecutar:
+    uv run python benchmarks/bench_review_validation.py
+    uv run python benchmarks/bench_review_validation.py --rows 1000000
+"""
+
+import argparse
+import json
+import time
+
+from exercises.bloque_3.scoring import Review
+from exercises.bloque_3.storage import construct_reviews, validate_reviews, validate_reviews_json
+
+
+def best_time(fn, repeat: int) -> float:
+    """Return the best wall time of fn over repeat runs, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark de los caminos de validación de Review para cargas masivas"
+    )
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = [
+        {"text": f"review {i} is great", "rating": i % 5 + 1, "product": f"Widget {i % 100}"}
+        for i in range(args.rows)
+    ]
+    payload = json.dumps(rows).encode("utf-8")
+
+    candidates = {
+        "Review(**row) por fila": lambda: [Review(**row) for row in rows],
+        "TypeAdapter por lote": lambda: validate_reviews(rows),
+        "validate_json (bytes)": lambda: validate_reviews_json(payload),
+        "model_construct (trusted)": lambda: construct_reviews(rows),
+    }
+
+    baseline = None
+    for name, fn in candidates.items():
+        elapsed = best_time(fn, args.repeat)
+        baseline = baseline or elapsed
+        rate = args.rows / elapsed
+        print(f"{name:>28}: {rate:12,.0f} filas/s  (x{baseline / elapsed:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark: analyzer sin caché vs CachingSentimentAnalyzer en un feed sesgado.
+
+Genera un feed de reviews donde unos pocos textos se repiten muchísimo (ley
+de Zipf sobre un catálogo de textos distintos, con variaciones de mayúsculas
+y espacios) y mide reviews por segundo y tasa de aciertos con distintos
+tamaños de caché. El analyzer simula un modelo caro con una latencia fija
+por texto.
+
+Ejecutar:
+    uv run python benchmarks/bench_sentiment_cache.py
+    uv run python benchmarks/bench_sentiment_cache.py --reviews 200000 --zipf 1.2
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from exercises.bloque_3.caching import CachingSentimentAnalyzer
+
+WORDS = ["great", "product", "bad", "quality", "love", "it", "works", "broke", "fast", "slow"]
+
+
+class FakeModelAnalyzer:
+    """Analyzer that busy-waits cost seconds per text to mimic a model."""
+
+    def __init__(self, cost: float) -> None:
+        self._cost = cost
+
+    def analyze(self, text: str) -> float:
+        deadline = time.perf_counter() + self._cost
+        while time.perf_counter() < deadline:
+            pass
+        return (len(text) % 21 - 10) / 10
+
+    def analyze_batch(self, texts: list[str]) -> list[float]:
+        return [self.analyze(text) for text in texts]
+
+
+def skewed_feed(reviews: int, unique: int, zipf: float, seed: int) -> list[str]:
+    """Zipf-distributed feed over unique base texts with case/spacing noise."""
+    rng = random.Random(seed)
+    catalog = [" ".join(rng.choices(WORDS, k=rng.randint(2, 8))) for _ in range(unique)]
+    weights = [1 / rank**zipf for rank in range(1, unique + 1)]
+    feed = []
+    for text in rng.choices(catalog, weights=weights, k=reviews):
+        if rng.random() < 0.3:
+            text = text.upper() if rng.random() < 0.5 else text.replace(" ", "  ")
+        feed.append(text)
+    return feed
+
+
+def reviews_per_second(analyzer, feed: list[str], batch_size: int) -> float:
+    """Score the feed in batches and return reviews per second."""
+    start = time.perf_counter()
+    for i in range(0, len(feed), batch_size):
+        analyzer.analyze_batch(feed[i : i + batch_size])
+    return len(feed) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark: analyzer sin caché vs CachingSentimentAnalyzer en un feed sesgado"
+    )
+    parser.add_argument("--reviews", type=int, default=50_000)
+    parser.add_argument("--unique", type=int, default=20_000)
+    parser.add_argument("--zipf", type=float, default=1.1)
+    parser.add_argument("--cost-us", type=float, default=50.0)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--cache-sizes", type=int, nargs="+", default=[100, 1000, 10_000])
+    args = parser.parse_args()
+
+    feed = skewed_feed(args.reviews, args.unique, args.zipf, seed=0)
+    model = FakeModelAnalyzer(args.cost_us / 1e6)
+
+    baseline = reviews_per_second(model, feed, args.batch_size)
+    print(f"{'uncached':>24}: {baseline:10,.0f} reviews/s")
+
+    for max_size in args.cache_sizes:
+        cached = CachingSentimentAnalyzer(model, max_size=max_size)
+        rate = reviews_per_second(cached, feed, args.batch_size)
+        stats = cached.stats
+        name = f"cache max_size={max_size}"
+        print(
+            f"{name:>24}: {rate:10,.0f} reviews/s  (x{rate / baseline:.1f})  "
+            f"hit rate {stats.hit_rate:6.1%}  evictions {stats.evictions:,}"
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "scores.cache"
+        warm = CachingSentimentAnalyzer(model, max_size=max(args.cache_sizes), path=path)
+        warm.analyze_batch(feed)
+        start = time.perf_counter()
+        warm.save()
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        reloaded = CachingSentimentAnalyzer(model, max_size=max(args.cache_sizes), path=path)
+        loaded = time.perf_counter() - start
+        rate = reviews_per_second(reloaded, feed, args.batch_size)
+        print(
+            f"{'reloaded from disk':>24}: {rate:10,.0f} reviews/s  (x{rate / baseline:.1f})  "
+            f"hit rate {reloaded.stats.hit_rate:6.1%}  "
+            f"save {saved * 1000:.1f} ms / load {loaded * 1000:.1f} ms "
+            f"({path.stat().st_size / 1024:.0f} KiB, {len(reloaded):,} entries)"
+        )
+
+
+if __name__ == "__main__":
+    main()
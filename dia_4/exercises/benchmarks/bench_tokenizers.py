@@ -0,0 +1,78 @@
+"""
+Benchmark de tokenizadores regex sobre documentos largos.
+
+Compara:
+- split_by_pattern con el patrón como str (pasa por la caché de re)
+- RegexTokenizer.tokenize (patrón compilado una vez)
+- RegexTokenizer.tokenize_iter (perezoso, sin lista completa)
+- ScannerTokenizer.tokenize / tokenize_iter (el patrón describe el token)
+
+Ejecutar:
+    uv run python benchmarks/bench_tokenizers.py
+    uv run python benchmarks/bench_tokenizers.py --words 1000000 --repeat 5
+"""
+
+import argparse
+import random
+import string
+import time
+from collections import deque
+
+from exercises.bloque_2.helpers import split_by_pattern
+from exercises.bloque_2.preprocessing import RegexTokenizer, ScannerTokenizer
+
+SEPARATOR = r"[,\s]+"
+
+
+def generate_document(n_words: int, seed: int = 0) -> str:
+    """Generate a long document with words separated by spaces and commas."""
+    rng = random.Random(seed)
+    words = (
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10)))
+        for _ in range(n_words)
+    )
+    return "".join(word + rng.choice((" ", ", ", "  ")) for word in words)
+
+
+def best_time(fn, repeat: int) -> float:
+    """Return the best wall time of fn over repeat runs, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark de tokenizadores regex sobre documentos largos"
+    )
+    parser.add_argument("--words", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    document = generate_document(args.words)
+    regex_tokenizer = RegexTokenizer(pattern=SEPARATOR)
+    scanner_tokenizer = ScannerTokenizer(token_pattern=r"[^,\s]+")
+
+    candidates = {
+        "split_by_pattern(str)": lambda: split_by_pattern(document, SEPARATOR),
+        "RegexTokenizer.tokenize": lambda: regex_tokenizer.tokenize(document),
+        "RegexTokenizer.tokenize_iter": lambda: deque(
+            regex_tokenizer.tokenize_iter(document), maxlen=0
+        ),
+        "ScannerTokenizer.tokenize": lambda: scanner_tokenizer.tokenize(document),
+        "ScannerTokenizer.tokenize_iter": lambda: deque(
+            scanner_tokenizer.tokenize_iter(document), maxlen=0
+        ),
+    }
+
+    print(f"documento: {len(document) / 2**20:.1f} MiB, {args.words:,} palabras")
+    for name, fn in candidates.items():
+        elapsed = best_time(fn, args.repeat)
+        print(f"{name:>32}: {elapsed * 1e3:9.1f} ms  ({args.words / elapsed:12,.0f} tokens/s)")
+
+
+if __name__ == "__main__":
+    main()
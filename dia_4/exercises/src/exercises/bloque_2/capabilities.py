@@ -0,0 +1,25 @@
+"""
+Capacidades opcionales de las piezas del pipeline, además de los Protocols de protocols.py.
+
+Una pieza que cumple uno de estos Protocols sigue cumpliendo el Protocol base:
+el pipeline lo detecta con isinstance() y usa el camino rápido; si no, llama
+a filter_tokens() como siempre.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class FusableTokenFilter(Protocol):
+    """
+    TokenFilter que además sabe filtrar de forma perezosa.
+
+    filter_stream() recibe un iterable y devuelve un iterador, sin crear listas.
+    El pipeline encadena los filtros fusionables consecutivos para recorrer los
+    tokens UNA sola vez y construir UNA sola lista al final.
+    """
+
+    def filter_tokens(self, tokens: list[str]) -> list[str]: ...
+
+    def filter_stream(self, tokens: Iterable[str]) -> Iterator[str]: ...
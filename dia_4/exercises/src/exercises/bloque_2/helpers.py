@@ -5,6 +5,11 @@ YA ESTÁN IMPLEMENTADAS — no las modifiques, solo úsalas desde tus clases.
 """
 
 import re
+from collections.abc import Container, Iterable, Iterator
+from itertools import filterfalse
+
+# Compilado una sola vez al importar el módulo, no en cada llamada
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def to_lowercase(text: str) -> str:
@@ -14,7 +19,7 @@ def to_lowercase(text: str) -> str:
 
 def strip_whitespace(text: str) -> str:
     """Elimina espacios al inicio y final, y colapsa espacios múltiples."""
-    return re.sub(r"\s+", " ", text.strip())
+    return _WHITESPACE_RE.sub(" ", text.strip())
 
 
 def split_by_whitespace(text: str) -> list[str]:
@@ -22,12 +27,47 @@ def split_by_whitespace(text: str) -> list[str]:
     return text.split()
 
 
-def split_by_pattern(text: str, pattern: str) -> list[str]:
-    """Separa texto por un patrón regex. Filtra strings vacíos."""
-    return [token for token in re.split(pattern, text) if token]
+def split_by_pattern(text: str, pattern: str | re.Pattern[str]) -> list[str]:
+    """
+    Separa texto por un patrón regex. Filtra strings vacíos.
+
+    Acepta el patrón como str o ya compilado con re.compile(). Compilado
+    evita la búsqueda en la caché interna de re en cada llamada.
+    """
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    return [token for token in pattern.split(text) if token]
+
+
+def iter_split_by_pattern(text: str, pattern: re.Pattern[str]) -> Iterator[str]:
+    """
+    Versión perezosa de split_by_pattern: genera los tokens uno a uno.
+
+    Recorre los separadores con finditer() sin construir la lista completa.
+    Los grupos de captura del patrón NO se devuelven como tokens (re.split sí).
+    """
+    start = 0
+    for match in pattern.finditer(text):
+        if match.start() > start:
+            yield text[start : match.start()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
+def find_tokens(text: str, pattern: re.Pattern[str]) -> list[str]:
+    """Devuelve los fragmentos de texto que encajan con el patrón de token."""
+    if pattern.groups == 0:
+        return pattern.findall(text)
+    return [match.group() for match in pattern.finditer(text)]
 
 
-def remove_stopwords(tokens: list[str], stopwords: set[str]) -> list[str]:
+def iter_find_tokens(text: str, pattern: re.Pattern[str]) -> Iterator[str]:
+    """Versión perezosa de find_tokens: genera los tokens uno a uno."""
+    return (match.group() for match in pattern.finditer(text))
+
+
+def remove_stopwords(tokens: list[str], stopwords: Container[str]) -> list[str]:
     """Elimina tokens que están en el conjunto de stopwords."""
     return [token for token in tokens if token not in stopwords]
 
@@ -35,3 +75,15 @@ def remove_stopwords(tokens: list[str], stopwords: set[str]) -> list[str]:
 def remove_short_tokens(tokens: list[str], min_length: int) -> list[str]:
     """Elimina tokens más cortos que min_length."""
     return [token for token in tokens if len(token) >= min_length]
+
+
+def iter_without_stopwords(
+    tokens: Iterable[str], stopwords: Container[str]
+) -> Iterator[str]:
+    """Versión perezosa de remove_stopwords: no crea ninguna lista."""
+    return filterfalse(stopwords.__contains__, tokens)
+
+
+def iter_long_tokens(tokens: Iterable[str], min_length: int) -> Iterator[str]:
+    """Versión perezosa de remove_short_tokens: no crea ninguna lista."""
+    return (token for token in tokens if len(token) >= min_length)
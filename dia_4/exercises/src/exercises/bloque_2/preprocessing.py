@@ -9,9 +9,23 @@ Tu trabajo:
 5. Crear TextPreprocessingPipeline que COMPONE las piezas
 """
 
+import os
+import pickle
+import re
+import time
+from collections import deque
+from collections.abc import Callable, Container, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
 
+from .capabilities import FusableTokenFilter
 from .helpers import (
+    find_tokens,
+    iter_find_tokens,
+    iter_long_tokens,
+    iter_split_by_pattern,
+    iter_without_stopwords,
     remove_short_tokens,
     remove_stopwords,
     split_by_pattern,
@@ -19,8 +33,9 @@ from .helpers import (
     strip_whitespace,
     to_lowercase,
 )
+from .profiling import PipelineProfiler
 from .protocols import TextNormalizer, TokenFilter, Tokenizer
-
+from .stopwords import StopwordRegistry, default_registry
 
 # --- Estructura de datos: resultado del procesamiento ---
 
@@ -35,7 +50,10 @@ class PreprocessingResult:
       tokens (list[str]), filtered_tokens (list[str])
     """
 
-    ...
+    original_text: str
+    normalized_text: str
+    tokens: list[str]
+    filtered_tokens: list[str]
 
 
 # --- Piezas de normalización ---
@@ -52,7 +70,9 @@ class LowercaseNormalizer:
       ambos órdenes dan el mismo resultado aquí.
     """
 
-    ...
+    def normalize(self, text: str) -> str:
+        """Normaliza el texto a minúsculas sin espacios sobrantes."""
+        return to_lowercase(strip_whitespace(text))
 
 
 # --- Piezas de tokenización ---
@@ -67,7 +87,9 @@ class WhitespaceTokenizer:
     - Una línea.
     """
 
-    ...
+    def tokenize(self, text: str) -> list[str]:
+        """Separa el texto en tokens por espacios."""
+        return split_by_whitespace(text)
 
 
 class RegexTokenizer:
@@ -77,9 +99,42 @@ class RegexTokenizer:
     Hints:
     - Recibe pattern: str en __init__ y lo guarda.
     - El método tokenize() llama a split_by_pattern(text, self._pattern).
+
+    El patrón se compila una sola vez en __init__. tokenize_iter() ofrece una
+    tokenización perezosa que no construye la lista completa de tokens.
     """
 
-    ...
+    def __init__(self, pattern: str) -> None:
+        self._pattern = re.compile(pattern)
+
+    def tokenize(self, text: str) -> list[str]:
+        """Separa el texto en tokens por el patrón configurado."""
+        return split_by_pattern(text, self._pattern)
+
+    def tokenize_iter(self, text: str) -> Iterator[str]:
+        """Genera los tokens uno a uno, sin construir la lista."""
+        return iter_split_by_pattern(text, self._pattern)
+
+
+class ScannerTokenizer:
+    """
+    Cumple Tokenizer. Extrae los tokens que ENCAJAN con un patrón.
+
+    Al revés que RegexTokenizer, el patrón describe el token (p. ej. r"\\w+"),
+    no el separador: la puntuación desaparece sin pasos extra. El patrón se
+    compila una sola vez en __init__.
+    """
+
+    def __init__(self, token_pattern: str = r"\w+") -> None:
+        self._pattern = re.compile(token_pattern)
+
+    def tokenize(self, text: str) -> list[str]:
+        """Devuelve la lista de tokens encontrados en el texto."""
+        return find_tokens(text, self._pattern)
+
+    def tokenize_iter(self, text: str) -> Iterator[str]:
+        """Genera los tokens uno a uno, sin construir la lista."""
+        return iter_find_tokens(text, self._pattern)
 
 
 # --- Piezas de filtrado ---
@@ -92,9 +147,31 @@ class StopwordFilter:
     Hints:
     - Recibe stopwords: set[str] en __init__.
     - El método filter_tokens() llama a remove_stopwords() de helpers.py.
+
+    Guarda una referencia (no una copia): con for_language() todos los filtros
+    del mismo idioma comparten el frozenset del registro de stopwords.
     """
 
-    ...
+    def __init__(self, stopwords: Container[str]) -> None:
+        self._stopwords = stopwords
+
+    @classmethod
+    def for_language(
+        cls,
+        language: str,
+        registry: StopwordRegistry = default_registry,
+        compact: bool = False,
+    ) -> "StopwordFilter":
+        """Crea un filtro con las stopwords compartidas de un idioma registrado."""
+        return cls(stopwords=registry.get(language, compact=compact))
+
+    def filter_tokens(self, tokens: list[str]) -> list[str]:
+        """Elimina las stopwords de la lista de tokens."""
+        return remove_stopwords(tokens, self._stopwords)
+
+    def filter_stream(self, tokens: Iterable[str]) -> Iterator[str]:
+        """Versión perezosa de filter_tokens (cumple FusableTokenFilter)."""
+        return iter_without_stopwords(tokens, self._stopwords)
 
 
 class MinLengthFilter:
@@ -106,7 +183,79 @@ class MinLengthFilter:
     - El método filter_tokens() llama a remove_short_tokens() de helpers.py.
     """
 
-    ...
+    def __init__(self, min_length: int = 2) -> None:
+        self._min_length = min_length
+
+    def filter_tokens(self, tokens: list[str]) -> list[str]:
+        """Elimina los tokens más cortos que min_length."""
+        return remove_short_tokens(tokens, self._min_length)
+
+    def filter_stream(self, tokens: Iterable[str]) -> Iterator[str]:
+        """Versión perezosa de filter_tokens (cumple FusableTokenFilter)."""
+        return iter_long_tokens(tokens, self._min_length)
+
+
+# --- Fusión de filtros ---
+
+
+class FusedFilterStep:
+    """
+    Aplica varios FusableTokenFilter en una sola pasada sobre los tokens.
+
+    Encadena los filter_stream() de cada filtro, de modo que cada token
+    atraviesa todos los filtros antes de pasar al siguiente, y solo se crea
+    la lista final (en vez de una lista intermedia por filtro). Ahorra memoria
+    con documentos largos, pero no tiempo: las comprensiones de filter_tokens()
+    por separado son igual o más rápidas (ver benchmarks/bench_filter_fusion.py),
+    por eso el pipeline solo fusiona si se pide con fuse_filters=True.
+    """
+
+    def __init__(self, filters: list[FusableTokenFilter]) -> None:
+        self._filters = filters
+
+    @property
+    def name(self) -> str:
+        """Nombre de la etapa para el profiler: filtros unidos por '+'."""
+        return "+".join(type(token_filter).__name__ for token_filter in self._filters)
+
+    def __call__(self, tokens: list[str]) -> list[str]:
+        stream: Iterable[str] = tokens
+        for token_filter in self._filters:
+            stream = token_filter.filter_stream(stream)
+        return list(stream)
+
+
+def compile_filter_steps(
+    filters: list[TokenFilter], fuse: bool = False
+) -> list[Callable[[list[str]], list[str]]]:
+    """
+    Convierte una lista de filtros en los pasos que aplicará el pipeline.
+
+    Por defecto cada filtro es un paso (su filter_tokens()). Con fuse=True, los
+    filtros fusionables consecutivos se agrupan en un FusedFilterStep; los que
+    no cumplen FusableTokenFilter se aplican con su filter_tokens() de siempre,
+    en su posición, así que el orden de los filtros se respeta.
+    """
+    if not fuse:
+        return [token_filter.filter_tokens for token_filter in filters]
+    steps: list[Callable[[list[str]], list[str]]] = []
+    run: list[FusableTokenFilter] = []
+
+    def close_run() -> None:
+        if len(run) == 1:
+            steps.append(run[0].filter_tokens)
+        elif run:
+            steps.append(FusedFilterStep(list(run)))
+        run.clear()
+
+    for token_filter in filters:
+        if isinstance(token_filter, FusableTokenFilter):
+            run.append(token_filter)
+        else:
+            close_run()
+            steps.append(token_filter.filter_tokens)
+    close_run()
+    return steps
 
 
 # --- Pipeline: compone las piezas ---
@@ -126,6 +275,220 @@ class TextPreprocessingPipeline:
       2. Tokeniza el texto normalizado con self._tokenizer.tokenize(...)
       3. Aplica cada filter en orden sobre los tokens
       4. Devuelve PreprocessingResult con los 4 campos
+
+    Los filtros se compilan una vez en __init__ con compile_filter_steps().
+    Con fuse_filters=True los fusionables consecutivos se aplican en una sola
+    pasada: menos listas intermedias, a cambio de no ganar (o perder) tiempo.
+
+    Con profiler=PipelineProfiler() se mide cada etapa (ver profiling.py).
     """
 
-    ...
+    def __init__(
+        self,
+        normalizer: TextNormalizer,
+        tokenizer: Tokenizer,
+        filters: list[TokenFilter],
+        profiler: PipelineProfiler | None = None,
+        fuse_filters: bool = False,
+    ) -> None:
+        self._normalizer = normalizer
+        self._tokenizer = tokenizer
+        self._filters = filters
+        self._filter_steps = compile_filter_steps(filters, fuse=fuse_filters)
+        self._profiler = profiler
+
+    def process(self, text: str) -> PreprocessingResult:
+        """Procesa un texto: normaliza, tokeniza y aplica los filtros en orden."""
+        if self._profiler is not None:
+            return self._process_profiled(text, True, self._profiler)
+        normalized = self._normalizer.normalize(text)
+        tokens = self._tokenizer.tokenize(normalized)
+        filtered = tokens
+        for filter_step in self._filter_steps:
+            filtered = filter_step(filtered)
+        return PreprocessingResult(
+            original_text=text,
+            normalized_text=normalized,
+            tokens=tokens,
+            filtered_tokens=filtered,
+        )
+
+    def process_many(
+        self, texts: Iterable[str], keep_tokens: bool = True
+    ) -> Iterator[PreprocessingResult]:
+        """
+        Procesa un flujo de textos de forma perezosa (un resultado cada vez).
+
+        Resuelve los métodos de las piezas una sola vez para todo el lote, en
+        lugar de una vez por documento, y no materializa la lista de entrada:
+        sirve para generadores o ficheros de millones de líneas.
+
+        Args:
+            texts: Textos a procesar. Se consumen bajo demanda.
+            keep_tokens: Si es False, no se conserva la lista intermedia de
+                tokens: cada resultado lleva tokens=[] y solo filtered_tokens.
+
+        Yields:
+            Un PreprocessingResult por texto, en el mismo orden de entrada.
+        """
+        profiler = self._profiler
+        if profiler is not None:
+            for text in texts:
+                yield self._process_profiled(text, keep_tokens, profiler)
+            return
+
+        normalize = self._normalizer.normalize
+        tokenize = self._tokenizer.tokenize
+        filter_steps = self._filter_steps
+
+        for text in texts:
+            normalized = normalize(text)
+            tokens = tokenize(normalized)
+            filtered = tokens
+            for filter_step in filter_steps:
+                filtered = filter_step(filtered)
+            yield PreprocessingResult(
+                original_text=text,
+                normalized_text=normalized,
+                tokens=tokens if keep_tokens else [],
+                filtered_tokens=filtered,
+            )
+
+    def _process_profiled(
+        self, text: str, keep_tokens: bool, profiler: PipelineProfiler
+    ) -> PreprocessingResult:
+        """Igual que process(), pero registra cada etapa en profiler."""
+        record = profiler.record
+        clock = time.perf_counter
+
+        start = clock()
+        normalized = self._normalizer.normalize(text)
+        end = clock()
+        record("normalize", end - start, 0, 0)
+
+        start = end
+        tokens = self._tokenizer.tokenize(normalized)
+        end = clock()
+        record("tokenize", end - start, 0, len(tokens))
+
+        filtered = tokens
+        for filter_step in self._filter_steps:
+            start = clock()
+            step_output = filter_step(filtered)
+            record(_step_name(filter_step), clock() - start, len(filtered), len(step_output))
+            filtered = step_output
+
+        return PreprocessingResult(
+            original_text=text,
+            normalized_text=normalized,
+            tokens=tokens if keep_tokens else [],
+            filtered_tokens=filtered,
+        )
+
+    def process_parallel(
+        self,
+        texts: Iterable[str],
+        max_workers: int | None = None,
+        chunk_size: int = 1000,
+        keep_tokens: bool = True,
+    ) -> Iterator[PreprocessingResult]:
+        """
+        Procesa un flujo de textos en varios procesos, conservando el orden.
+
+        El pipeline se envía UNA vez a cada proceso (initializer) y después
+        solo viajan trozos de chunk_size textos. Los workers devuelven tuplas
+        planas (más baratas de serializar que dataclasses) sin el texto original,
+        y los resultados se reconstruyen aquí. Como mucho hay 2 * max_workers
+        trozos en vuelo, así que la memoria no crece con el tamaño de la entrada.
+
+        Solo compensa cuando el trabajo por texto supera el coste de enviarlo
+        entre procesos: con piezas muy baratas, process_many() puede ser más
+        rápido (ver benchmarks/bench_pipeline_parallel.py).
+
+        Args:
+            texts: Textos a procesar. Se consumen bajo demanda.
+            max_workers: Número de procesos. Por defecto, os.cpu_count().
+            chunk_size: Textos por trozo enviado a cada proceso.
+            keep_tokens: Igual que en process_many().
+
+        Yields:
+            Un PreprocessingResult por texto, en el mismo orden de entrada.
+
+        Raises:
+            ValueError: Si chunk_size es menor que 1.
+            TypeError: Si alguna pieza del pipeline no se puede serializar
+                con pickle (p. ej. lambdas o clases definidas dentro de funciones).
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        try:
+            pickle.dumps(self)
+        except (pickle.PicklingError, AttributeError, TypeError) as exc:
+            raise TypeError(
+                f"Pipeline components must be picklable to run in parallel: {exc}"
+            ) from exc
+
+        workers = max_workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self,)
+        )
+        try:
+            pending = deque()
+            for chunk in _chunked(texts, chunk_size):
+                future = executor.submit(_process_chunk, chunk, keep_tokens)
+                pending.append((chunk, future))
+                if len(pending) >= 2 * workers:
+                    yield from _rebuild_results(*pending.popleft())
+            while pending:
+                yield from _rebuild_results(*pending.popleft())
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+def _step_name(filter_step: Callable[[list[str]], list[str]]) -> str:
+    """Nombre de un paso de filtrado: la clase del filtro o los fusionados."""
+    if isinstance(filter_step, FusedFilterStep):
+        return filter_step.name
+    return type(getattr(filter_step, "__self__", filter_step)).__name__
+
+
+# --- Soporte para process_parallel (a nivel de módulo para poder serializarse) ---
+
+_worker_pipeline: TextPreprocessingPipeline | None = None
+
+
+def _init_worker(pipeline: TextPreprocessingPipeline) -> None:
+    """Guarda el pipeline en el proceso worker, una sola vez por proceso."""
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+
+def _process_chunk(
+    chunk: list[str], keep_tokens: bool
+) -> list[tuple[str, list[str], list[str]]]:
+    """Procesa un trozo en el worker. Devuelve (normalized, tokens, filtered)."""
+    pipeline = _worker_pipeline
+    if pipeline is None:
+        raise RuntimeError("Worker pipeline not initialized: run it through process_parallel()")
+    return [
+        (result.normalized_text, result.tokens, result.filtered_tokens)
+        for result in pipeline.process_many(chunk, keep_tokens=keep_tokens)
+    ]
+
+
+def _rebuild_results(chunk: list[str], future: Future) -> Iterator[PreprocessingResult]:
+    """Reconstruye los resultados de un trozo a partir de las tuplas del worker."""
+    for text, (normalized, tokens, filtered) in zip(chunk, future.result(), strict=True):
+        yield PreprocessingResult(
+            original_text=text,
+            normalized_text=normalized,
+            tokens=tokens,
+            filtered_tokens=filtered,
+        )
+
+
+def _chunked(texts: Iterable[str], chunk_size: int) -> Iterator[list[str]]:
+    """Agrupa un iterable en listas de chunk_size elementos (la última, menor)."""
+    iterator = iter(texts)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
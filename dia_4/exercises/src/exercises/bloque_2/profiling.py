@@ -0,0 +1,75 @@
+"""
+Instrumentación opcional por etapa para TextPreprocessingPipeline.
+
+Se activa pasando profiler=PipelineProfiler() al pipeline. Sin profiler, el
+pipeline no mide nada (el coste es una comprobación `is None` por llamada).
+
+Por cada etapa (normalize, tokenize y cada paso de filtrado) acumula:
+tiempo de reloj, número de llamadas y tokens de entrada y salida. Se exporta
+como dict o en formato de texto de Prometheus.
+"""
+
+from dataclasses import asdict, dataclass
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Contadores acumulados de una etapa del pipeline."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    tokens_in: int = 0
+    tokens_out: int = 0
+
+
+class PipelineProfiler:
+    """
+    Acumula StageStats por nombre de etapa.
+
+    Las etapas aparecen en el orden en que se registran por primera vez. Los
+    filtros fusionados (ver FusedFilterStep) se miden como UNA etapa, con los
+    nombres de sus filtros unidos por "+".
+
+    NOTA: con process_parallel() cada proceso worker mide sobre su propia
+    copia del profiler; esos datos no vuelven al proceso principal.
+    """
+
+    def __init__(self, metric_prefix: str = "text_pipeline") -> None:
+        self._metric_prefix = metric_prefix
+        self._stages: dict[str, StageStats] = {}
+
+    def record(self, stage: str, seconds: float, tokens_in: int, tokens_out: int) -> None:
+        """Suma una llamada a los contadores de una etapa."""
+        stats = self._stages.get(stage)
+        if stats is None:
+            stats = self._stages[stage] = StageStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.tokens_in += tokens_in
+        stats.tokens_out += tokens_out
+
+    def reset(self) -> None:
+        """Pone todos los contadores a cero."""
+        self._stages.clear()
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        """Devuelve {etapa: {calls, seconds, tokens_in, tokens_out}}."""
+        return {stage: asdict(stats) for stage, stats in self._stages.items()}
+
+    def to_prometheus(self) -> str:
+        """Devuelve los contadores en formato de exposición de texto de Prometheus."""
+        metrics = (
+            ("seconds", "Cumulative wall time spent in each stage."),
+            ("calls", "Number of calls to each stage."),
+            ("tokens_in", "Tokens received by each stage."),
+            ("tokens_out", "Tokens produced by each stage."),
+        )
+        lines = []
+        for field, description in metrics:
+            name = f"{self._metric_prefix}_stage_{field}_total"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            for stage, stats in self._stages.items():
+                label = stage.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{name}{{stage="{label}"}} {getattr(stats, field)}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,167 @@
+"""
+Registro de stopwords compartido entre pipelines.
+
+Cada lista de stopwords se carga UNA vez por idioma y se guarda como
+frozenset inmutable: todos los StopwordFilter que la pidan reciben el MISMO
+objeto, en lugar de una copia por pipeline.
+
+Para listas muy grandes existe CompactStopwordSet: guarda las palabras
+empaquetadas en un único bloque de bytes ordenado (búsqueda binaria) y usa
+un bitmap de hashes para descartar en O(1) casi todos los tokens que no son
+stopwords. Ocupa bastante menos que un frozenset a cambio de búsquedas algo
+más lentas.
+"""
+
+import threading
+import zlib
+from array import array
+from collections.abc import Callable, Container, Iterable, Iterator
+from pathlib import Path
+
+# Listas mínimas incluidas. Para listas completas, usa register_file().
+_BUILTIN_STOPWORDS = {
+    "en": (
+        "a an and are as at be but by for from has have in is it its of on or "
+        "that the this to was were will with"
+    ),
+    "es": (
+        "a al como con de del el en es la las lo los no o para pero por que se "
+        "su sus un una y"
+    ),
+}
+
+
+class CompactStopwordSet:
+    """
+    Conjunto de palabras de solo lectura y poca memoria.
+
+    - Palabras codificadas en UTF-8, ordenadas y concatenadas en un solo bytes,
+      con un array('I') de offsets: sin un objeto str por palabra.
+    - Bitmap de bits_per_word bits por palabra indexado por crc32: si el bit
+      de un token está a 0, el token seguro que NO está (sin búsqueda binaria).
+    """
+
+    def __init__(self, words: Iterable[str], bits_per_word: int = 8) -> None:
+        encoded = sorted({word.encode("utf-8") for word in words})
+        self._blob = b"".join(encoded)
+        self._offsets = array("I", [0])
+        for word in encoded:
+            self._offsets.append(self._offsets[-1] + len(word))
+        self._n_bits = max(64, len(encoded) * bits_per_word)
+        self._bitmap = bytearray(self._n_bits // 8 + 1)
+        for word in encoded:
+            bit = zlib.crc32(word) % self._n_bits
+            self._bitmap[bit >> 3] |= 1 << (bit & 7)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __iter__(self) -> Iterator[str]:
+        blob, offsets = self._blob, self._offsets
+        for i in range(len(self)):
+            yield blob[offsets[i] : offsets[i + 1]].decode("utf-8")
+
+    def __contains__(self, token: object) -> bool:
+        if not isinstance(token, str):
+            return False
+        word = token.encode("utf-8")
+        bit = zlib.crc32(word) % self._n_bits
+        if not self._bitmap[bit >> 3] & (1 << (bit & 7)):
+            return False
+
+        blob, offsets = self._blob, self._offsets
+        low, high = 0, len(offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            candidate = blob[offsets[middle] : offsets[middle + 1]]
+            if candidate < word:
+                low = middle + 1
+            elif candidate > word:
+                high = middle
+            else:
+                return True
+        return False
+
+
+class StopwordRegistry:
+    """
+    Registro de listas de stopwords por idioma, cargadas bajo demanda.
+
+    Registrar un idioma solo guarda CÓMO cargarlo. La primera llamada a get()
+    lo carga y cachea; las siguientes devuelven el mismo objeto. Es seguro
+    usarlo desde varios hilos.
+    """
+
+    def __init__(self) -> None:
+        self._loaders: dict[str, Callable[[], Iterable[str]]] = {}
+        self._loaded: dict[tuple[str, bool], Container[str]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, language: str, loader: Callable[[], Iterable[str]]) -> None:
+        """Registra (o reemplaza) la función que carga las stopwords de un idioma."""
+        with self._lock:
+            self._loaders[language] = loader
+            self._loaded.pop((language, False), None)
+            self._loaded.pop((language, True), None)
+
+    def register_file(self, language: str, path: str | Path) -> None:
+        """
+        Registra un fichero de texto con una stopword por línea.
+
+        Las líneas vacías y las que empiezan por '#' se ignoran. El fichero no
+        se lee hasta el primer get() de ese idioma.
+        """
+
+        def load() -> Iterator[str]:
+            with Path(path).open(encoding="utf-8") as file:
+                for line in file:
+                    word = line.strip()
+                    if word and not word.startswith("#"):
+                        yield word
+
+        self.register(language, load)
+
+    def languages(self) -> list[str]:
+        """Idiomas registrados, en orden alfabético."""
+        return sorted(self._loaders)
+
+    def get(self, language: str, compact: bool = False) -> Container[str]:
+        """
+        Devuelve las stopwords compartidas de un idioma.
+
+        Args:
+            language: Código del idioma registrado (p. ej. "en", "es").
+            compact: Si es True, devuelve un CompactStopwordSet en vez de un
+                frozenset (para listas muy grandes).
+
+        Raises:
+            KeyError: Si el idioma no está registrado.
+        """
+        key = (language, compact)
+        stopwords = self._loaded.get(key)
+        if stopwords is not None:
+            return stopwords
+
+        with self._lock:
+            if key not in self._loaded:
+                if language not in self._loaders:
+                    raise KeyError(f"No stopwords registered for language '{language}'")
+                words = self._loaders[language]()
+                self._loaded[key] = CompactStopwordSet(words) if compact else frozenset(words)
+            return self._loaded[key]
+
+
+def _create_default_registry() -> StopwordRegistry:
+    registry = StopwordRegistry()
+    for language, words in _BUILTIN_STOPWORDS.items():
+        registry.register(language, words.split)
+    return registry
+
+
+# Registro global que comparten todos los pipelines del proceso
+default_registry = _create_default_registry()
+
+
+def get_stopwords(language: str, compact: bool = False) -> Container[str]:
+    """Atajo para default_registry.get(language, compact)."""
+    return default_registry.get(language, compact=compact)
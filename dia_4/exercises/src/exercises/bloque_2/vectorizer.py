@@ -0,0 +1,214 @@
+"""
+Vectorizador bag-of-words / TF-IDF disperso para después del pipeline.
+
+Convierte los filtered_tokens de los PreprocessingResult en matrices
+dispersas en formato CSR (tres arrays de NumPy: indptr, indices, data).
+Trabaja por lotes: cada lote se agrega con UNA ordenación vectorizada
+(np.unique sobre claves documento*columnas + columna) en vez de un dict
+por documento.
+
+Dos modos de columnas:
+- Vocabulario (por defecto): usa Vocabulary, que crece con partial_fit().
+- Hashing trick (n_features=N): columna = crc32(token) % N. Sin memoria
+  de vocabulario y estable entre procesos (hash() de Python no lo es).
+"""
+
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from itertools import islice
+
+import numpy as np
+
+from .preprocessing import PreprocessingResult
+from .vocabulary import UNKNOWN_ID, Vocabulary
+
+
+@dataclass(frozen=True)
+class SparseMatrix:
+    """
+    Matriz dispersa en formato CSR.
+
+    La fila i ocupa las posiciones indptr[i]:indptr[i + 1] de indices
+    (columnas, ordenadas) y data (valores).
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    shape: tuple[int, int]
+
+    @property
+    def nnz(self) -> int:
+        """Número de valores distintos de cero."""
+        return len(self.data)
+
+    def to_dense(self) -> np.ndarray:
+        """Devuelve la matriz como array denso (solo para matrices pequeñas)."""
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        dense[rows, self.indices] = self.data
+        return dense
+
+
+class BagOfWordsVectorizer:
+    """
+    Vectorizador incremental de conteos o TF-IDF a matrices CSR.
+
+    - partial_fit(results): aprende vocabulario y frecuencias de documento
+      (document frequency) de un lote. Se puede llamar tantas veces como
+      lotes tenga el flujo.
+    - transform(results): vectoriza un lote con lo aprendido hasta ahora. En
+      modo vocabulario, los tokens desconocidos se ignoran.
+    - transform_batches(results, batch_size): vectoriza un flujo por lotes.
+
+    IDF suavizado, como en scikit-learn: idf = ln((1 + n) / (1 + df)) + 1.
+    """
+
+    def __init__(
+        self,
+        vocabulary: Vocabulary | None = None,
+        n_features: int | None = None,
+        use_idf: bool = False,
+        l2_normalize: bool = False,
+    ) -> None:
+        """
+        Args:
+            vocabulary: Vocabulario compartido. Si no se pasa, se crea uno vacío.
+            n_features: Si se indica, activa el hashing trick con N columnas
+                (y vocabulary se ignora).
+            use_idf: Pondera los conteos con IDF (requiere partial_fit previo).
+            l2_normalize: Normaliza cada fila a norma euclídea 1.
+
+        Raises:
+            ValueError: Si n_features es menor que 1.
+        """
+        if n_features is not None and n_features < 1:
+            raise ValueError(f"n_features must be >= 1, got {n_features}")
+        # Sin vocabulario (None) se está en modo hashing con _n_features columnas
+        self._n_features = n_features or 0
+        self._vocabulary: Vocabulary | None = None
+        if not n_features:
+            self._vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+        self._use_idf = use_idf
+        self._l2_normalize = l2_normalize
+        self._n_documents = 0
+        self._document_frequency = np.zeros(self._n_features, dtype=np.int64)
+
+    @property
+    def vocabulary(self) -> Vocabulary | None:
+        """Vocabulario en uso (None en modo hashing)."""
+        return self._vocabulary
+
+    @property
+    def n_columns(self) -> int:
+        """Número de columnas de las matrices producidas ahora mismo."""
+        if self._vocabulary is None:
+            return self._n_features
+        return len(self._vocabulary)
+
+    @property
+    def idf(self) -> np.ndarray:
+        """Peso IDF de cada columna según lo visto en partial_fit()."""
+        self._grow_document_frequency()
+        n_documents = self._n_documents
+        return np.log((1 + n_documents) / (1 + self._document_frequency)) + 1.0
+
+    def partial_fit(self, results: Iterable[PreprocessingResult]) -> "BagOfWordsVectorizer":
+        """Actualiza vocabulario y document frequency con un lote de resultados."""
+        ids, lengths = self._encode_batch(results, grow=True)
+        self._grow_document_frequency()
+        n_columns = self.n_columns
+        _, columns, _ = _aggregate_counts(ids, lengths, n_columns)
+        self._document_frequency += np.bincount(columns, minlength=n_columns)
+        self._n_documents += len(lengths)
+        return self
+
+    def transform(self, results: Iterable[PreprocessingResult]) -> SparseMatrix:
+        """
+        Vectoriza un lote de resultados.
+
+        Raises:
+            ValueError: Si use_idf=True y aún no se ha llamado a partial_fit().
+        """
+        if self._use_idf and self._n_documents == 0:
+            raise ValueError("use_idf=True requires partial_fit() before transform()")
+
+        ids, lengths = self._encode_batch(results, grow=False)
+        n_rows = len(lengths)
+        n_columns = self.n_columns
+        rows, columns, counts = _aggregate_counts(ids, lengths, n_columns)
+
+        data = counts.astype(np.float64)
+        if self._use_idf:
+            data *= self.idf[columns]
+        if self._l2_normalize:
+            norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=n_rows))
+            data /= norms[rows]
+
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+        return SparseMatrix(
+            indptr=indptr,
+            indices=columns.astype(np.int32),
+            data=data,
+            shape=(n_rows, n_columns),
+        )
+
+    def transform_batches(
+        self, results: Iterable[PreprocessingResult], batch_size: int = 1000
+    ) -> Iterator[SparseMatrix]:
+        """Vectoriza un flujo de resultados en matrices de batch_size filas."""
+        iterator = iter(results)
+        while batch := list(islice(iterator, batch_size)):
+            yield self.transform(batch)
+
+    def _grow_document_frequency(self) -> None:
+        """Amplía document frequency si el vocabulario (compartido) ha crecido."""
+        missing = self.n_columns - len(self._document_frequency)
+        if missing > 0:
+            self._document_frequency = np.concatenate(
+                [self._document_frequency, np.zeros(missing, dtype=np.int64)]
+            )
+
+    def _encode_batch(
+        self, results: Iterable[PreprocessingResult], grow: bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Concatena los ids de columna de todo el lote y la longitud de cada fila."""
+        ids = array("i")
+        lengths = array("q")
+        vocabulary = self._vocabulary
+        if vocabulary is None:
+            n_features = self._n_features
+            for result in results:
+                tokens = result.filtered_tokens
+                ids.extend(
+                    [zlib.crc32(token.encode("utf-8")) % n_features for token in tokens]
+                )
+                lengths.append(len(tokens))
+        else:
+            encode = vocabulary.encode
+            for result in results:
+                encoded = encode(result.filtered_tokens, grow=grow)
+                ids.extend(encoded)
+                lengths.append(len(encoded))
+        return np.frombuffer(ids, dtype=np.int32), np.frombuffer(lengths, dtype=np.int64)
+
+
+def _aggregate_counts(
+    ids: np.ndarray, lengths: np.ndarray, n_columns: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Cuenta cada par (fila, columna) del lote con una sola ordenación.
+
+    Returns:
+        rows, columns y counts, ordenados por fila y, dentro, por columna
+        (el orden que necesita CSR). Los UNKNOWN_ID se descartan.
+    """
+    rows = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+    known = ids != UNKNOWN_ID
+    keys = rows[known] * max(n_columns, 1) + ids[known]
+    unique_keys, counts = np.unique(keys, return_counts=True)
+    rows, columns = np.divmod(unique_keys, max(n_columns, 1))
+    return rows, columns, counts
@@ -0,0 +1,106 @@
+"""
+Vocabulario compartido: tokens → ids enteros compactos.
+
+Pieza OPCIONAL que se usa después de TextPreprocessingPipeline. En lugar de
+guardar cada documento como list[str] (un objeto str por token), se guarda
+como array('i') de ids (4 bytes por token) y cada token distinto existe UNA
+sola vez en memoria, dentro del vocabulario.
+"""
+
+import json
+from array import array
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+# Id que devuelve encode(grow=False) para tokens fuera del vocabulario
+UNKNOWN_ID = -1
+
+
+class Vocabulary:
+    """
+    Vocabulario creciente que asigna ids consecutivos (0, 1, 2...) a los tokens.
+
+    - encode() convierte tokens en array('i') y, por defecto, añade los nuevos.
+    - decode() devuelve las instancias canónicas de cada token (compartidas).
+    - save() / load() serializan el vocabulario a JSON, ordenado por id.
+    """
+
+    def __init__(self, tokens: Iterable[str] = ()) -> None:
+        self._token_to_id: dict[str, int] = {}
+        self._id_to_token: list[str] = []
+        for token in tokens:
+            self.add(token)
+
+    def __len__(self) -> int:
+        return len(self._id_to_token)
+
+    def __contains__(self, token: object) -> bool:
+        return token in self._token_to_id
+
+    def add(self, token: str) -> int:
+        """Añade un token si no existe y devuelve su id."""
+        token_id = self._token_to_id.get(token)
+        if token_id is None:
+            token_id = len(self._id_to_token)
+            self._token_to_id[token] = token_id
+            self._id_to_token.append(token)
+        return token_id
+
+    def token_id(self, token: str) -> int:
+        """Devuelve el id de un token, o UNKNOWN_ID si no está en el vocabulario."""
+        return self._token_to_id.get(token, UNKNOWN_ID)
+
+    def encode(self, tokens: Iterable[str], grow: bool = True) -> array:
+        """
+        Convierte tokens en un array('i') de ids.
+
+        Args:
+            tokens: Tokens a codificar (p. ej. result.filtered_tokens).
+            grow: Si es True, los tokens nuevos se añaden al vocabulario.
+                Si es False, se codifican como UNKNOWN_ID.
+
+        Returns:
+            Array compacto de ids, uno por token.
+        """
+        if not grow:
+            get = self._token_to_id.get
+            return array("i", [get(token, UNKNOWN_ID) for token in tokens])
+
+        token_to_id = self._token_to_id
+        add = self.add
+        ids = array("i")
+        for token in tokens:
+            token_id = token_to_id.get(token)
+            ids.append(add(token) if token_id is None else token_id)
+        return ids
+
+    def encode_many(
+        self, token_lists: Iterable[list[str]], grow: bool = True
+    ) -> Iterator[array]:
+        """Versión perezosa de encode() para un flujo de documentos."""
+        for tokens in token_lists:
+            yield self.encode(tokens, grow=grow)
+
+    def decode(self, ids: Iterable[int]) -> list[str]:
+        """
+        Convierte ids en tokens.
+
+        Los strings devueltos son los del vocabulario (no copias), así que
+        todos los documentos decodificados comparten las mismas instancias.
+
+        Raises:
+            IndexError: Si algún id no existe en el vocabulario.
+        """
+        id_to_token = self._id_to_token
+        return [id_to_token[token_id] for token_id in ids]
+
+    def save(self, path: str | Path) -> None:
+        """Guarda el vocabulario como JSON (lista de tokens ordenada por id)."""
+        payload = {"tokens": self._id_to_token}
+        Path(path).write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Vocabulary":
+        """Carga un vocabulario guardado con save(). Conserva los ids."""
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(payload["tokens"])
@@ -0,0 +1,222 @@
+"""
+Caché de scores para analyzers de sentimiento.
+
+Los feeds de reviews repiten mucho el mismo texto ("great product!",
+"Great  product!" con otras mayúsculas u otro espaciado...). CachingSentimentAnalyzer envuelve un
+analyzer y recuerda el score de cada texto ya visto:
+- La clave es un hash (blake2b, 16 bytes) del texto normalizado: minúsculas y
+  espacios colapsados. Ocupa lo mismo sea cual sea la longitud del texto y es
+  estable entre procesos (hash() de Python no lo es).
+- La caché tiene tamaño máximo y expulsa la entrada usada hace más tiempo
+  (LRU, con un OrderedDict).
+- Opcionalmente se guarda en disco (save()) y se recarga al crear el wrapper,
+  así que sobrevive a reinicios.
+
+El wrapper cumple SentimentAnalyzer y BatchSentimentAnalyzer: se inyecta en
+ScoringService sin tocar el servicio (DIP).
+
+OJO: la caché supone que el analyzer da el mismo score a dos textos con la
+misma forma normalizada (cierto para KeywordSentimentAnalyzer, que ya pasa el
+texto a minúsculas y lo separa por espacios). Un fichero de caché pertenece a
+UN analyzer con UNA configuración: si cambian las palabras clave o el modelo,
+usa otro fichero.
+"""
+
+import hashlib
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .capabilities import BatchSentimentAnalyzer
+from .protocols import SentimentAnalyzer
+
+_KEY_SIZE = 16
+
+
+def normalize_review_text(text: str) -> str:
+    """Normaliza un texto para la caché: minúsculas y espacios colapsados."""
+    return " ".join(text.lower().split())
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Contadores de uso de la caché."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fracción de consultas resueltas desde la caché (0.0 si no hubo ninguna)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachingSentimentAnalyzer:
+    """
+    Envuelve un analyzer y cachea sus scores con expulsión LRU.
+
+    En analyze_batch() los textos repetidos dentro del mismo lote se analizan
+    una sola vez, y los que faltan en la caché se envían al analyzer en UNA
+    llamada a analyze_batch() si lo soporta.
+
+    Es seguro usarlo desde varios hilos (p. ej. dentro de un
+    ConcurrentSentimentAnalyzer): el acceso a la caché va protegido con un
+    lock, pero el analyzer se llama fuera de él.
+    """
+
+    def __init__(
+        self,
+        analyzer: SentimentAnalyzer,
+        max_size: int = 100_000,
+        path: str | Path | None = None,
+        normalizer: Callable[[str], str] = normalize_review_text,
+    ) -> None:
+        """
+        Args:
+            analyzer: Analyzer cuyos scores se cachean.
+            max_size: Número máximo de entradas en memoria.
+            path: Fichero de la caché persistente. Si existe, se carga.
+            normalizer: Función que decide qué textos comparten score.
+
+        Raises:
+            ValueError: Si max_size es menor que 1.
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1, got {max_size}")
+        self._analyzer = analyzer
+        self._max_size = max_size
+        self._path = Path(path) if path is not None else None
+        self._normalizer = normalizer
+        self._scores: OrderedDict[bytes, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        if self._path is not None and self._path.exists():
+            self._load(self._path)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Aciertos, fallos, expulsiones y tamaño actual."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._scores))
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def analyze(self, text: str) -> float:
+        """Devuelve el score cacheado o lo calcula y lo guarda. Cumple SentimentAnalyzer."""
+        key = self._key(text)
+        with self._lock:
+            score = self._lookup(key)
+        if score is not None:
+            return score
+        score = self._analyzer.analyze(text)
+        with self._lock:
+            self._store(key, score)
+        return score
+
+    def analyze_batch(self, texts: list[str]) -> list[float]:
+        """
+        Devuelve un score por texto, en el mismo orden.
+
+        Solo se analiza un texto por cada clave que no esté en la caché.
+        """
+        keys = [self._key(text) for text in texts]
+        found: dict[bytes, float] = {}
+        pending: dict[bytes, str] = {}
+        with self._lock:
+            for key, text in zip(keys, texts, strict=True):
+                if key in found or key in pending:
+                    self._hits += 1
+                    continue
+                score = self._lookup(key)
+                if score is None:
+                    pending[key] = text
+                else:
+                    found[key] = score
+
+        if pending:
+            missing = list(pending.values())
+            if isinstance(self._analyzer, BatchSentimentAnalyzer):
+                scores = self._analyzer.analyze_batch(missing)
+            else:
+                scores = [self._analyzer.analyze(text) for text in missing]
+            with self._lock:
+                for key, score in zip(pending, scores, strict=True):
+                    self._store(key, score)
+                    found[key] = score
+
+        return [found[key] for key in keys]
+
+    def clear(self) -> None:
+        """Vacía la caché en memoria y pone los contadores a cero."""
+        with self._lock:
+            self._scores.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def save(self) -> None:
+        """
+        Escribe la caché en path (de la menos a la más usada recientemente).
+
+        Se escribe a un fichero temporal y se renombra: un fallo a mitad no
+        deja un fichero corrupto.
+
+        Raises:
+            ValueError: Si el wrapper se creó sin path.
+        """
+        if self._path is None:
+            raise ValueError("This cache has no path to save to")
+        with self._lock:
+            keys = b"".join(self._scores)
+            scores = array("d", self._scores.values())
+        count = array("Q", [len(scores)])
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        with tmp_path.open("wb") as file:
+            count.tofile(file)
+            file.write(keys)
+            scores.tofile(file)
+        os.replace(tmp_path, self._path)
+
+    def _load(self, path: Path) -> None:
+        """Carga el fichero de path; si tiene más de max_size entradas, quedan las recientes."""
+        with path.open("rb") as file:
+            count = array("Q")
+            count.fromfile(file, 1)
+            total = count[0]
+            keys = file.read(total * _KEY_SIZE)
+            scores = array("d")
+            scores.fromfile(file, total)
+        first = max(0, total - self._max_size)
+        for i in range(first, total):
+            self._scores[keys[i * _KEY_SIZE : (i + 1) * _KEY_SIZE]] = scores[i]
+
+    def _key(self, text: str) -> bytes:
+        """Hash de 16 bytes del texto normalizado."""
+        normalized = self._normalizer(text).encode("utf-8")
+        return hashlib.blake2b(normalized, digest_size=_KEY_SIZE).digest()
+
+    def _lookup(self, key: bytes) -> float | None:
+        """Busca una clave y la marca como usada. Llamar con el lock tomado."""
+        score = self._scores.get(key)
+        if score is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._scores.move_to_end(key)
+        return score
+
+    def _store(self, key: bytes, score: float) -> None:
+        """Guarda un score y expulsa la entrada más antigua si sobra. Llamar con el lock tomado."""
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        if len(self._scores) > self._max_size:
+            self._scores.popitem(last=False)
+            self._evictions += 1
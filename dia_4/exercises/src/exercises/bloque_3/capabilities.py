@@ -0,0 +1,47 @@
+"""
+Capacidades opcionales de las piezas del scoring, además de los Protocols de protocols.py.
+
+Un loader, analyzer o saver que cumple uno de estos Protocols sigue cumpliendo
+el Protocol base: ScoringService lo detecta con isinstance() y usa el camino
+rápido (por trozos, por lotes, columnar); si no, usa load(), analyze() o
+save() como siempre.
+"""
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from .scoring import Review, ScoringResult, ScoringResultBatch
+
+
+@runtime_checkable
+class ChunkedReviewLoader(Protocol):
+    """ReviewLoader que además puede entregar las reviews por trozos."""
+
+    def load(self) -> list["Review"]: ...
+
+    def load_chunks(self, chunk_size: int) -> Iterator[list["Review"]]: ...
+
+
+class AsyncSentimentAnalyzer(Protocol):
+    """SentimentAnalyzer asíncrono (p. ej. un modelo servido por red)."""
+
+    async def analyze(self, text: str) -> float: ...
+
+
+@runtime_checkable
+class BatchSentimentAnalyzer(Protocol):
+    """SentimentAnalyzer que además puede puntuar muchos textos en una llamada."""
+
+    def analyze(self, text: str) -> float: ...
+
+    def analyze_batch(self, texts: list[str]) -> list[float]: ...
+
+
+@runtime_checkable
+class ColumnarResultSaver(Protocol):
+    """ResultSaver que además puede guardar un ScoringResultBatch directamente."""
+
+    def save(self, results: list["ScoringResult"]) -> None: ...
+
+    def save_batch(self, batch: "ScoringResultBatch") -> None: ...
@@ -0,0 +1,169 @@
+"""
+Análisis de sentimiento concurrente para analyzers remotos.
+
+ConcurrentSentimentAnalyzer envuelve un analyzer (síncrono o asíncrono) y
+mantiene hasta max_in_flight llamadas en vuelo a la vez:
+- Analyzer async (analyze es una corutina): asyncio directamente.
+- Analyzer bloqueante: cada llamada va a un pool de hilos desde asyncio.
+
+El wrapper cumple SentimentAnalyzer y BatchSentimentAnalyzer, así que se
+inyecta en ScoringService sin tocar el servicio (DIP): run() y
+run_streaming() usarán analyze_batch() y los scores llegan en el mismo orden
+que los textos.
+"""
+
+import asyncio
+import inspect
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Self, cast
+
+from .capabilities import AsyncSentimentAnalyzer
+from .protocols import SentimentAnalyzer
+
+
+class ConcurrentSentimentAnalyzer:
+    """
+    Ejecuta las llamadas a un analyzer de forma concurrente, con timeout y reintentos.
+
+    Cada llamada tiene timeout segundos (None = sin límite). Si falla o vence el
+    timeout, se reintenta hasta retries veces, esperando backoff * 2**intento
+    segundos entre intentos. Si se agotan los reintentos, se propaga el error.
+
+    NOTA: un hilo no se puede interrumpir. Si una llamada bloqueante vence el
+    timeout, su hilo sigue ocupado hasta que la llamada termina y sigue contando
+    como en vuelo: su hueco no se libera hasta entonces. El pool de hilos es uno
+    por analyzer, con max_in_flight hilos, y lo comparten analyze() y todas las
+    llamadas a analyze_batch(); el timeout incluye la espera en su cola.
+    close() (o usar el analyzer en un with) libera esos hilos.
+    """
+
+    def __init__(
+        self,
+        analyzer: SentimentAnalyzer | AsyncSentimentAnalyzer,
+        max_in_flight: int = 8,
+        timeout: float | None = None,
+        retries: int = 0,
+        backoff: float = 0.1,
+    ) -> None:
+        """
+        Raises:
+            ValueError: Si max_in_flight es menor que 1 o retries es negativo.
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+        if retries < 0:
+            raise ValueError(f"retries must be >= 0, got {retries}")
+        self._analyzer = analyzer
+        self._is_async = inspect.iscoroutinefunction(analyzer.analyze)
+        self._max_in_flight = max_in_flight
+        self._timeout = timeout
+        self._retries = retries
+        self._backoff = backoff
+        # Los hilos se crean bajo demanda, en las primeras llamadas
+        self._pool = None if self._is_async else ThreadPoolExecutor(max_in_flight)
+
+    def close(self) -> None:
+        """
+        Cierra el pool de hilos: espera a las llamadas en curso y descarta las encoladas.
+
+        Después, el analyzer ya no acepta llamadas bloqueantes. Con un analyzer
+        async no hace nada (no hay pool).
+        """
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def analyze(self, text: str) -> float:
+        """
+        Analiza un texto (con timeout y reintentos). Cumple SentimentAnalyzer.
+
+        Un analyzer bloqueante se llama en el pool de hilos, sin event loop. Uno
+        async necesita un event loop: desde código async, usa analyze_batch_async().
+        """
+        pool = self._pool
+        if pool is None:
+            return self.analyze_batch([text])[0]
+        analyze = cast(SentimentAnalyzer, self._analyzer).analyze
+        for attempt in range(self._retries + 1):
+            future = pool.submit(analyze, text)
+            try:
+                return future.result(self._timeout)
+            except Exception:
+                future.cancel()
+                if attempt == self._retries:
+                    raise
+            time.sleep(self._backoff * 2**attempt)
+        raise AssertionError("unreachable")
+
+    def analyze_batch(self, texts: list[str]) -> list[float]:
+        """
+        Analiza todos los textos de forma concurrente.
+
+        Crea su propio event loop: desde código async, usa analyze_batch_async().
+
+        Returns:
+            Un score por texto, en el mismo orden que texts.
+        """
+        return asyncio.run(self.analyze_batch_async(texts))
+
+    async def analyze_batch_async(self, texts: list[str]) -> list[float]:
+        """Versión async de analyze_batch() para usar dentro de un event loop."""
+        semaphore = asyncio.Semaphore(self._max_in_flight)
+        return await asyncio.gather(
+            *(self._analyze_with_retry(text, semaphore, self._pool) for text in texts)
+        )
+
+    async def _analyze_with_retry(
+        self, text: str, semaphore: asyncio.Semaphore, pool: ThreadPoolExecutor | None
+    ) -> float:
+        """
+        Una llamada al analyzer, con su timeout y sus reintentos.
+
+        El hueco del semáforo se libera cuando la llamada termina de verdad, no
+        cuando vence el timeout (shield evita que wait_for la dé por acabada).
+        """
+        for attempt in range(self._retries + 1):
+            await semaphore.acquire()
+            call, stop = self._start(text, pool)
+            call.add_done_callback(lambda _: semaphore.release())
+            try:
+                return await asyncio.wait_for(asyncio.shield(call), self._timeout)
+            except asyncio.CancelledError:
+                stop()
+                raise
+            except Exception:
+                stop()
+                if attempt == self._retries:
+                    raise
+            await asyncio.sleep(self._backoff * 2**attempt)
+        raise AssertionError("unreachable")
+
+    def _start(
+        self, text: str, pool: ThreadPoolExecutor | None
+    ) -> tuple[asyncio.Future[float], Callable[[], bool]]:
+        """
+        Lanza la llamada: corutina del analyzer o tarea en el pool de hilos.
+
+        Returns:
+            El future de la llamada y cómo cancelarla. En el pool se cancela el
+            future del pool, no su envoltorio asyncio: si el hilo ya ha empezado,
+            la llamada sigue y el envoltorio no acaba hasta que ella acabe.
+        """
+        if pool is None:
+            task = asyncio.ensure_future(cast(AsyncSentimentAnalyzer, self._analyzer).analyze(text))
+            return task, task.cancel
+        future = pool.submit(cast(SentimentAnalyzer, self._analyzer).analyze, text)
+        return asyncio.wrap_future(future), future.cancel
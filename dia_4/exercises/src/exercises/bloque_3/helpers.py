@@ -4,6 +4,9 @@ Funciones helper para análisis de sentimiento.
 YA ESTÁN IMPLEMENTADAS — úsalas desde tus clases.
 """
 
+from collections.abc import Iterable
+from itertools import repeat
+
 
 def compute_keyword_sentiment(
     text: str,
@@ -27,6 +30,45 @@ def compute_keyword_sentiment(
     return max(-1.0, min(1.0, raw_score))
 
 
+def build_polarity_lookup(
+    positive_words: set[str],
+    negative_words: set[str],
+) -> dict[str, int]:
+    """
+    Combina ambos conjuntos en un único dict palabra → polaridad.
+
+    +1 si es positiva, -1 si es negativa y 0 si está en los dos conjuntos
+    (igual que compute_keyword_sentiment, que la contaría en ambos).
+    """
+    polarity = dict.fromkeys(positive_words, 1)
+    for word in negative_words:
+        polarity[word] = polarity.get(word, 0) - 1
+    return polarity
+
+
+def compute_keyword_sentiment_batch(
+    texts: Iterable[str],
+    polarity: dict[str, int],
+) -> list[float]:
+    """
+    Versión por lotes de compute_keyword_sentiment. Mismos scores exactos.
+
+    Recorre las palabras UNA vez con una sola búsqueda en el dict de
+    polaridades (build_polarity_lookup) por palabra, en lugar de dos pasadas
+    con dos búsquedas en sets.
+    """
+    lookup = polarity.get
+    scores = []
+    for text in texts:
+        words = text.lower().split()
+        if not words:
+            scores.append(0.0)
+            continue
+        raw_score = sum(map(lookup, words, repeat(0))) / len(words)
+        scores.append(max(-1.0, min(1.0, raw_score)))
+    return scores
+
+
 def sentiment_label(score: float) -> str:
     """
     Convierte un score numérico a etiqueta.
@@ -8,15 +8,23 @@ Tu trabajo:
 4. Los datos fluyen como argumentos entre las piezas
 """
 
+from array import array
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 
 from pydantic import BaseModel, Field
 
-from .helpers import compute_keyword_sentiment, sentiment_label
+from .capabilities import BatchSentimentAnalyzer, ChunkedReviewLoader, ColumnarResultSaver
+from .helpers import (
+    build_polarity_lookup,
+    compute_keyword_sentiment,
+    compute_keyword_sentiment_batch,
+    sentiment_label,
+)
 from .protocols import ResultSaver, ReviewLoader, SentimentAnalyzer
 
-
 # --- Modelos de datos ---
 
 
@@ -29,10 +37,17 @@ class Review(BaseModel):
     - Usa Field() para restricciones de rating.
     """
 
-    ...
+    text: str = Field(min_length=1)
+    rating: int = Field(ge=1, le=5)
+    product: str
+
+
+# Etiquetas posibles; en ScoringResultBatch se guarda su posición (uint8)
+LABELS = ("negative", "neutral", "positive")
+_LABEL_CODES = {label: code for code, label in enumerate(LABELS)}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoringResult:
     """
     Resultado del análisis de una review.
@@ -40,9 +55,99 @@ class ScoringResult:
     Hints:
     - Campos: review_text (str), sentiment_score (float),
       label (str), scored_at (str con timestamp ISO).
+
+    Con slots=True cada instancia no lleva __dict__.
+    """
+
+    review_text: str
+    sentiment_score: float
+    label: str
+    scored_at: str
+
+
+class ScoringResultBatch:
+    """
+    Resultados de un lote de reviews en formato columnar.
+
+    En lugar de un ScoringResult por review, guarda una columna por campo:
+    - review_indices: array('q') con la posición de cada review en reviews
+      (el texto no se copia, se referencia)
+    - scores: array('d') con los scores en float64
+    - label_codes: array('B') con la etiqueta codificada como uint8 (índice
+      en LABELS)
+    - scored_at: UN timestamp ISO compartido por todo el lote
+
+    Los ScoringResult se construyen solo cuando se piden (batch[i], iterar o
+    to_results()).
     """
 
-    ...
+    __slots__ = ("label_codes", "review_indices", "reviews", "scored_at", "scores")
+
+    def __init__(
+        self,
+        reviews: Sequence[Review],
+        review_indices: array,
+        scores: array,
+        label_codes: array,
+        scored_at: str,
+    ) -> None:
+        if not len(review_indices) == len(scores) == len(label_codes):
+            raise ValueError("review_indices, scores and label_codes must have the same length")
+        self.reviews = reviews
+        self.review_indices = review_indices
+        self.scores = scores
+        self.label_codes = label_codes
+        self.scored_at = scored_at
+
+    @classmethod
+    def from_scores(
+        cls, reviews: Sequence[Review], scores: Sequence[float], scored_at: str | None = None
+    ) -> "ScoringResultBatch":
+        """
+        Construye el lote a partir de los scores de cada review (mismo orden).
+
+        Args:
+            reviews: Reviews puntuadas.
+            scores: Score de cada review.
+            scored_at: Timestamp ISO del lote. Por defecto, el momento actual.
+        """
+        scores = array("d", scores)
+        if len(scores) != len(reviews):
+            raise ValueError(f"Expected {len(reviews)} scores, got {len(scores)}")
+        label_codes = array("B", (_LABEL_CODES[sentiment_label(score)] for score in scores))
+        return cls(
+            reviews,
+            array("q", range(len(reviews))),
+            scores,
+            label_codes,
+            scored_at or datetime.now().isoformat(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def __getitem__(self, position: int) -> ScoringResult:
+        """Construye el ScoringResult de la posición indicada."""
+        return ScoringResult(
+            review_text=self.reviews[self.review_indices[position]].text,
+            sentiment_score=self.scores[position],
+            label=LABELS[self.label_codes[position]],
+            scored_at=self.scored_at,
+        )
+
+    def __iter__(self) -> Iterator[ScoringResult]:
+        for position in range(len(self)):
+            yield self[position]
+
+    def rows(self) -> Iterator[tuple[str, float, str, str]]:
+        """Genera cada resultado como tupla (mismo orden de campos que ScoringResult)."""
+        reviews, scored_at = self.reviews, self.scored_at
+        for index, score, code in zip(self.review_indices, self.scores, self.label_codes):
+            yield reviews[index].text, score, LABELS[code], scored_at
+
+    def to_results(self) -> list[ScoringResult]:
+        """Convierte todo el lote a una lista de ScoringResult."""
+        return list(self)
 
 
 # --- Pieza 1: Carga de datos (responsabilidad: ¿DE DÓNDE vienen las reviews?) ---
@@ -60,7 +165,17 @@ class InMemoryReviewLoader:
       simple para tests y desarrollo.
     """
 
-    ...
+    def __init__(self, reviews: list[Review]) -> None:
+        self._reviews = reviews
+
+    def load(self) -> list[Review]:
+        """Devuelve las reviews guardadas en memoria."""
+        return self._reviews
+
+    def load_chunks(self, chunk_size: int) -> Iterator[list[Review]]:
+        """Devuelve las reviews en trozos de chunk_size (cumple ChunkedReviewLoader)."""
+        for start in range(0, len(self._reviews), chunk_size):
+            yield self._reviews[start : start + chunk_size]
 
 
 # --- Pieza 2: Análisis (responsabilidad: ¿CÓMO se calcula el sentimiento?) ---
@@ -74,9 +189,23 @@ class KeywordSentimentAnalyzer:
     - Recibe positive_words: set[str] y negative_words: set[str] en __init__.
     - analyze(text) llama a compute_keyword_sentiment() de helpers.py.
     - UNA línea en el método analyze().
+
+    También cumple BatchSentimentAnalyzer: analyze_batch() puntúa una lista
+    de textos con un dict de polaridades construido una sola vez.
     """
 
-    ...
+    def __init__(self, positive_words: set[str], negative_words: set[str]) -> None:
+        self._positive_words = positive_words
+        self._negative_words = negative_words
+        self._polarity = build_polarity_lookup(positive_words, negative_words)
+
+    def analyze(self, text: str) -> float:
+        """Devuelve el score de sentimiento del texto (-1.0 a 1.0)."""
+        return compute_keyword_sentiment(text, self._positive_words, self._negative_words)
+
+    def analyze_batch(self, texts: list[str]) -> list[float]:
+        """Devuelve el score de cada texto, idéntico al de analyze()."""
+        return compute_keyword_sentiment_batch(texts, self._polarity)
 
 
 # --- Pieza 3: Guardado (responsabilidad: ¿DÓNDE se guardan los resultados?) ---
@@ -92,7 +221,12 @@ class InMemoryResultSaver:
     - ¿Por qué público? Para poder verificar en tests qué se guardó.
     """
 
-    ...
+    def __init__(self) -> None:
+        self.results: list[ScoringResult] = []
+
+    def save(self, results: list[ScoringResult]) -> None:
+        """Añade los resultados a la lista en memoria."""
+        self.results.extend(results)
 
 
 # --- Orquestador (responsabilidad: ¿EN QUÉ ORDEN se ejecuta el flujo?) ---
@@ -117,6 +251,114 @@ class ScoringService:
     IMPORTANTE: ScoringService NO importa compute_keyword_sentiment.
     Solo usa self._analyzer.analyze() — no sabe qué implementación es.
     Eso es DIP.
+
+    Si el analyzer cumple BatchSentimentAnalyzer, run() puntúa todas las
+    reviews con una sola llamada a analyze_batch().
+
+    run_streaming() hace lo mismo por trozos: carga, analiza y guarda cada
+    trozo antes de pasar al siguiente (memoria acotada, progreso parcial).
+
+    run_columnar() devuelve un ScoringResultBatch en vez de una lista de
+    ScoringResult; si el saver cumple ColumnarResultSaver, lo guarda sin
+    crear un objeto por review.
     """
 
-    ...
+    def __init__(
+        self,
+        loader: ReviewLoader,
+        analyzer: SentimentAnalyzer,
+        saver: ResultSaver,
+    ) -> None:
+        self._loader = loader
+        self._analyzer = analyzer
+        self._saver = saver
+
+    def run(self) -> list[ScoringResult]:
+        """Carga, analiza y guarda todas las reviews. Devuelve los resultados."""
+        results = self._score(self._loader.load())
+        self._saver.save(results)
+        return results
+
+    def run_streaming(self, chunk_size: int = 1000, resume_from: int = 0) -> int:
+        """
+        Procesa las reviews por trozos y guarda cada trozo al terminarlo.
+
+        Solo hay un trozo en memoria a la vez. Si el proceso se interrumpe, lo
+        ya guardado queda guardado: se puede reanudar con resume_from igual al
+        número de reviews que ya se guardaron.
+
+        Si el loader no cumple ChunkedReviewLoader, se trocea el resultado de
+        load() (el análisis y el guardado siguen siendo por trozos, pero la
+        carga inicial no está acotada).
+
+        Args:
+            chunk_size: Reviews por trozo.
+            resume_from: Número de reviews iniciales que se saltan.
+
+        Returns:
+            Número de reviews procesadas y guardadas en esta llamada.
+
+        Raises:
+            ValueError: Si chunk_size es menor que 1 o resume_from es negativo.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        if resume_from < 0:
+            raise ValueError(f"resume_from must be >= 0, got {resume_from}")
+
+        processed = 0
+        for chunk in _skip_reviews(self._load_chunks(chunk_size), resume_from):
+            results = self._score(chunk)
+            self._saver.save(results)
+            processed += len(results)
+        return processed
+
+    def run_columnar(self) -> ScoringResultBatch:
+        """Carga, analiza y guarda todas las reviews. Devuelve un lote columnar."""
+        reviews = self._loader.load()
+        batch = ScoringResultBatch.from_scores(reviews, self._analyze_texts(reviews))
+        if isinstance(self._saver, ColumnarResultSaver):
+            self._saver.save_batch(batch)
+        else:
+            self._saver.save(batch.to_results())
+        return batch
+
+    def _load_chunks(self, chunk_size: int) -> Iterator[list[Review]]:
+        """Trozos del loader: nativos si los soporta, si no, troceando load()."""
+        if isinstance(self._loader, ChunkedReviewLoader):
+            yield from self._loader.load_chunks(chunk_size)
+            return
+        reviews = iter(self._loader.load())
+        while chunk := list(islice(reviews, chunk_size)):
+            yield chunk
+
+    def _score(self, reviews: list[Review]) -> list[ScoringResult]:
+        """Analiza una lista de reviews y construye sus ScoringResult."""
+        results = []
+        for review, score in zip(reviews, self._analyze_texts(reviews), strict=True):
+            results.append(
+                ScoringResult(
+                    review_text=review.text,
+                    sentiment_score=score,
+                    label=sentiment_label(score),
+                    scored_at=datetime.now().isoformat(),
+                )
+            )
+        return results
+
+    def _analyze_texts(self, reviews: Sequence[Review]) -> list[float]:
+        """Scores de las reviews: en una llamada si el analyzer admite lotes."""
+        texts = [review.text for review in reviews]
+        if isinstance(self._analyzer, BatchSentimentAnalyzer):
+            return self._analyzer.analyze_batch(texts)
+        return [self._analyzer.analyze(text) for text in texts]
+
+
+def _skip_reviews(chunks: Iterator[list[Review]], count: int) -> Iterator[list[Review]]:
+    """Descarta las primeras count reviews de un flujo de trozos."""
+    for chunk in chunks:
+        if count >= len(chunk):
+            count -= len(chunk)
+            continue
+        yield chunk[count:] if count else chunk
+        count = 0
@@ -0,0 +1,244 @@
+"""
+Loaders y savers respaldados por ficheros CSV y SQLite.
+
+Son las versiones "de producción" que menciona InMemoryReviewLoader. Cumplen
+los mismos Protocols (ReviewLoader / ChunkedReviewLoader / ResultSaver), así
+que ScoringService no cambia al usarlos.
+
+- Los loaders leen las filas en streaming (csv.DictReader / fetchmany /
+  líneas JSON) y validan los modelos Review por lotes, con UNA llamada a
+  TypeAdapter(list[Review]) por lote. Con validation="trusted" se usa
+  model_construct() y no se valida nada (solo para fuentes ya validadas).
+- Los savers escriben cada lote de golpe: writerows() en CSV y executemany()
+  dentro de UNA transacción en SQLite. También cumplen ColumnarResultSaver:
+  save_batch() escribe un ScoringResultBatch fila a fila sin crear
+  ScoringResult intermedios.
+"""
+
+import csv
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import closing
+from dataclasses import fields
+from itertools import islice
+from pathlib import Path
+from typing import Literal
+
+from pydantic import TypeAdapter
+
+from .scoring import Review, ScoringResult, ScoringResultBatch
+
+Validation = Literal["full", "trusted"]
+
+_REVIEW_COLUMNS = ("text", "rating", "product")
+_RESULT_COLUMNS = tuple(field.name for field in fields(ScoringResult))
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Construido una sola vez: el esquema de validación se compila al crearlo
+_REVIEW_LIST_ADAPTER = TypeAdapter(list[Review])
+
+
+def validate_reviews(rows: Iterable[dict]) -> list[Review]:
+    """
+    Valida un lote de filas como Review con una sola llamada al validador.
+
+    Raises:
+        ValidationError: Si alguna fila no es válida (indica su posición).
+    """
+    return _REVIEW_LIST_ADAPTER.validate_python(list(rows))
+
+
+def validate_reviews_json(data: str | bytes) -> list[Review]:
+    """
+    Valida directamente un array JSON de reviews, sin pasar por dicts de Python.
+
+    Raises:
+        ValidationError: Si el JSON no es válido o alguna review tampoco.
+    """
+    return _REVIEW_LIST_ADAPTER.validate_json(data)
+
+
+def construct_reviews(rows: Iterable[dict]) -> list[Review]:
+    """
+    Crea Review SIN validar ni convertir tipos (model_construct).
+
+    Solo para fuentes de confianza con tipos ya correctos: un rating "5"
+    leído de CSV se quedaría como str.
+
+    OJO: en pydantic v2 la validación corre en pydantic-core (Rust) y suele
+    ser igual o MÁS rápida que model_construct, que se ejecuta en Python.
+    Mide con benchmarks/bench_review_validation.py antes de elegir este modo.
+    """
+    return [Review.model_construct(**row) for row in rows]
+
+
+def _build_reviews(rows: Iterable[dict], validation: Validation) -> list[Review]:
+    """Aplica el modo de validación elegido a un lote de filas."""
+    if validation == "trusted":
+        return construct_reviews(rows)
+    return validate_reviews(rows)
+
+
+def _check_identifier(name: str) -> str:
+    """Evita SQL injection en nombres de tabla (no se pueden parametrizar)."""
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL table name: {name!r}")
+    return name
+
+
+# --- CSV ---
+
+
+class CSVReviewLoader:
+    """
+    Carga reviews de un CSV con cabecera text,rating,product.
+
+    Cumple ReviewLoader y ChunkedReviewLoader. load_chunks() solo mantiene en
+    memoria un lote de filas a la vez.
+    """
+
+    def __init__(
+        self, path: str | Path, encoding: str = "utf-8", validation: Validation = "full"
+    ) -> None:
+        self._path = Path(path)
+        self._encoding = encoding
+        self._validation: Validation = validation
+
+    def load(self) -> list[Review]:
+        """Carga y valida todas las reviews del fichero."""
+        return [review for chunk in self.load_chunks(10_000) for review in chunk]
+
+    def load_chunks(self, chunk_size: int) -> Iterator[list[Review]]:
+        """Genera lotes de chunk_size reviews validadas."""
+        with self._path.open(newline="", encoding=self._encoding) as file:
+            reader = csv.DictReader(file)
+            while rows := list(islice(reader, chunk_size)):
+                yield _build_reviews(rows, self._validation)
+
+
+class CSVResultSaver:
+    """
+    Añade resultados a un CSV. Cumple ResultSaver.
+
+    Escribe la cabecera solo si el fichero no existe o está vacío, así que se
+    puede llamar a save() una vez por lote (ScoringService.run_streaming).
+    """
+
+    def __init__(self, path: str | Path, encoding: str = "utf-8") -> None:
+        self._path = Path(path)
+        self._encoding = encoding
+
+    def save(self, results: list[ScoringResult]) -> None:
+        """Añade los resultados al final del fichero."""
+        self._write_rows(
+            (r.review_text, r.sentiment_score, r.label, r.scored_at) for r in results
+        )
+
+    def save_batch(self, batch: ScoringResultBatch) -> None:
+        """Añade un lote columnar al final del fichero (cumple ColumnarResultSaver)."""
+        self._write_rows(batch.rows())
+
+    def _write_rows(self, rows: Iterable[tuple]) -> None:
+        """Escribe la cabecera si hace falta y después las filas."""
+        write_header = not self._path.exists() or self._path.stat().st_size == 0
+        with self._path.open("a", newline="", encoding=self._encoding) as file:
+            writer = csv.writer(file)
+            if write_header:
+                writer.writerow(_RESULT_COLUMNS)
+            writer.writerows(rows)
+
+
+# --- JSON Lines ---
+
+
+class JSONLReviewLoader:
+    """
+    Carga reviews de un fichero JSON Lines (un objeto JSON por línea).
+
+    Cumple ReviewLoader y ChunkedReviewLoader. Cada lote de líneas se une en
+    un array JSON y se valida con validate_json(): el parseo y la validación
+    ocurren en pydantic-core sin crear dicts intermedios en Python.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+
+    def load(self) -> list[Review]:
+        """Carga y valida todas las reviews del fichero."""
+        return [review for chunk in self.load_chunks(10_000) for review in chunk]
+
+    def load_chunks(self, chunk_size: int) -> Iterator[list[Review]]:
+        """Genera lotes de chunk_size reviews validadas."""
+        with self._path.open("rb") as file:
+            lines = (line for line in file if line.strip())
+            while batch := list(islice(lines, chunk_size)):
+                yield validate_reviews_json(b"[" + b",".join(batch) + b"]")
+
+
+# --- SQLite ---
+
+
+class SQLiteReviewLoader:
+    """
+    Carga reviews de una tabla SQLite con columnas text, rating, product.
+
+    Cumple ReviewLoader y ChunkedReviewLoader. Lee con fetchmany(), en el
+    orden de inserción (rowid).
+    """
+
+    def __init__(
+        self, path: str | Path, table: str = "reviews", validation: Validation = "full"
+    ) -> None:
+        self._path = Path(path)
+        self._table = _check_identifier(table)
+        self._validation: Validation = validation
+
+    def load(self) -> list[Review]:
+        """Carga y valida todas las reviews de la tabla."""
+        return [review for chunk in self.load_chunks(10_000) for review in chunk]
+
+    def load_chunks(self, chunk_size: int) -> Iterator[list[Review]]:
+        """Genera lotes de chunk_size reviews validadas."""
+        query = f"SELECT text, rating, product FROM {self._table} ORDER BY rowid"
+        with closing(sqlite3.connect(self._path)) as connection:
+            cursor = connection.execute(query)
+            while rows := cursor.fetchmany(chunk_size):
+                batch = (dict(zip(_REVIEW_COLUMNS, row, strict=True)) for row in rows)
+                yield _build_reviews(batch, self._validation)
+
+
+class SQLiteResultSaver:
+    """
+    Guarda resultados en una tabla SQLite. Cumple ResultSaver.
+
+    Crea la tabla si no existe. Cada save() inserta el lote completo con
+    executemany() en una sola transacción: o se guarda todo el lote o nada.
+    """
+
+    def __init__(self, path: str | Path, table: str = "scoring_results") -> None:
+        self._path = Path(path)
+        self._table = _check_identifier(table)
+        with closing(sqlite3.connect(self._path)) as connection, connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._table} ("
+                "review_text TEXT NOT NULL, sentiment_score REAL NOT NULL, "
+                "label TEXT NOT NULL, scored_at TEXT NOT NULL)"
+            )
+
+    def save(self, results: list[ScoringResult]) -> None:
+        """Inserta todos los resultados en una transacción."""
+        self._insert_rows(
+            (r.review_text, r.sentiment_score, r.label, r.scored_at) for r in results
+        )
+
+    def save_batch(self, batch: ScoringResultBatch) -> None:
+        """Inserta un lote columnar en una transacción (cumple ColumnarResultSaver)."""
+        self._insert_rows(batch.rows())
+
+    def _insert_rows(self, rows: Iterable[tuple]) -> None:
+        """Inserta las filas con executemany() en una sola transacción."""
+        placeholders = ", ".join("?" for _ in _RESULT_COLUMNS)
+        query = f"INSERT INTO {self._table} VALUES ({placeholders})"
+        with closing(sqlite3.connect(self._path)) as connection, connection:
+            connection.executemany(query, rows)
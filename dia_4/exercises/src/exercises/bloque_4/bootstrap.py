@@ -0,0 +1,218 @@
+"""
+Intervalos de confianza bootstrap vectorizados.
+
+En lugar de un bucle de Python que remuestrea y llama a evaluate() 1000
+veces, las réplicas se generan por bloques:
+- Se sortea de golpe una matriz de índices (réplicas × n) por bloque.
+- Las matrices de confusión de TODAS las réplicas del bloque salen de UN
+  np.bincount sobre los códigos de celda remuestreados, desplazados por
+  réplica (fila r → celdas r*K² ... r*K² + K² - 1).
+- Las celdas solo se calculan si alguna métrica necesita la matriz (ver
+  capabilities.shared_confusion_matrix); si no, todas usan compute().
+- Si todas las métricas salen de la matriz de confusión (ConfusionMatrixMetric)
+  ni siquiera hacen falta índices: las celdas de una réplica siguen una
+  multinomial(n, cm / n), así que se sortean directamente en O(K²) por
+  réplica, con la misma distribución que remuestrear las muestras.
+- Las métricas probabilísticas que cumplen ResampledProbabilisticMetric (AUC)
+  reciben la matriz de índices entera y ordenan los scores UNA vez por bloque
+  en lugar de una vez por réplica.
+
+Los bloques acotan la memoria (chunk_size réplicas a la vez) y se pueden
+repartir entre procesos. Cada bloque tiene su propia semilla derivada de
+seed, así que el resultado no depende de max_workers.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from .capabilities import (
+    ConfusionMatrixMetric,
+    ResampledProbabilisticMetric,
+    shared_confusion_matrix,
+)
+from .helpers import confusion_codes
+from .protocols import ClassificationMetric, ProbabilisticMetric
+
+# Entradas máximas de la matriz de índices de un bloque (64 MiB con intp)
+_MAX_INDEX_ENTRIES = 1 << 23
+
+
+def bootstrap_confusion_matrices(
+    codes: np.ndarray, n_classes: int, indices: np.ndarray
+) -> np.ndarray:
+    """
+    Matrices de confusión de varias réplicas con un solo np.bincount.
+
+    Args:
+        codes: Celda de cada muestra (ver helpers.confusion_codes).
+        n_classes: Número de clases K.
+        indices: Matriz (réplicas, n) con los índices de cada réplica.
+
+    Returns:
+        Array (réplicas, K, K) de conteos.
+    """
+    n_resamples = indices.shape[0]
+    cells = n_classes * n_classes
+    offsets = np.arange(n_resamples, dtype=np.intp)[:, None] * cells
+    shifted = codes[indices]
+    shifted += offsets
+    counts = np.bincount(shifted.ravel(), minlength=n_resamples * cells)
+    return counts.reshape(n_resamples, n_classes, n_classes)
+
+
+def percentile_interval(samples: np.ndarray, confidence: float = 0.95) -> tuple[float, float]:
+    """
+    Intervalo de confianza por percentiles de las réplicas.
+
+    Raises:
+        ValueError: Si confidence no está entre 0 y 1.
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(samples, [alpha, 1 - alpha])
+    return float(low), float(high)
+
+
+@dataclass(frozen=True)
+class _BootstrapTask:
+    """Datos y métricas de un bootstrap; se envía UNA vez a cada worker."""
+
+    y_true: np.ndarray
+    y_pred: np.ndarray
+    y_proba: np.ndarray | None
+    metrics: list[ClassificationMetric]
+    probabilistic_metrics: list[ProbabilisticMetric]
+    codes: np.ndarray | None
+    n_classes: int
+
+    def _uses_confusion(self, metric: ClassificationMetric) -> bool:
+        """True si la métrica se calcula desde las matrices de confusión remuestreadas."""
+        return self.codes is not None and isinstance(metric, ConfusionMatrixMetric)
+
+    @property
+    def needs_indices(self) -> bool:
+        """True si alguna métrica necesita las muestras remuestreadas, no solo la matriz."""
+        plain = any(not self._uses_confusion(m) for m in self.metrics)
+        return plain or (self.y_proba is not None and bool(self.probabilistic_metrics))
+
+    def run_block(self, seed: np.random.SeedSequence, n_resamples: int) -> dict[str, np.ndarray]:
+        """Calcula cada métrica en n_resamples réplicas."""
+        rng = np.random.default_rng(seed)
+        n = len(self.y_true)
+        indices = np.empty((0, n), dtype=np.intp)
+        matrices = np.empty((0, self.n_classes, self.n_classes), dtype=np.intp)
+        if self.needs_indices:
+            indices = rng.integers(0, n, size=(n_resamples, n))
+            if self.codes is not None:
+                matrices = bootstrap_confusion_matrices(self.codes, self.n_classes, indices)
+        elif self.codes is not None:
+            cells = np.bincount(self.codes, minlength=self.n_classes * self.n_classes)
+            matrices = rng.multinomial(n, cells / n, size=n_resamples).reshape(
+                n_resamples, self.n_classes, self.n_classes
+            )
+
+        values = {}
+        for m in self.metrics:
+            if self.codes is not None and isinstance(m, ConfusionMatrixMetric):
+                values[m.name] = m.compute_from_confusions(matrices)
+            else:
+                values[m.name] = np.array(
+                    [m.compute(self.y_true[row], self.y_pred[row]) for row in indices]
+                )
+        if self.y_proba is not None:
+            for m in self.probabilistic_metrics:
+                if isinstance(m, ResampledProbabilisticMetric):
+                    values[m.name] = m.compute_resampled(self.y_true, self.y_proba, indices)
+                else:
+                    values[m.name] = np.array(
+                        [m.compute(self.y_true[row], self.y_proba[row]) for row in indices]
+                    )
+        return values
+
+
+def bootstrap_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    metrics: list[ClassificationMetric],
+    probabilistic_metrics: list[ProbabilisticMetric] | None = None,
+    y_proba: np.ndarray | None = None,
+    n_resamples: int = 1000,
+    seed: int | None = None,
+    chunk_size: int | None = None,
+    max_workers: int = 1,
+) -> dict[str, np.ndarray]:
+    """
+    Valor de cada métrica en n_resamples réplicas bootstrap.
+
+    Args:
+        y_true, y_pred, y_proba: Datos a remuestrear (las mismas filas para todos).
+        metrics, probabilistic_metrics: Métricas, como en ClassificationEvaluator.
+        n_resamples: Número de réplicas.
+        seed: Semilla; con la misma semilla el resultado es idéntico.
+        chunk_size: Réplicas por bloque. Por defecto, las que caben en una
+            matriz de índices de 2**23 entradas.
+        max_workers: Procesos para repartir los bloques (1 = sin procesos).
+
+    Returns:
+        Dict nombre de métrica → array de n_resamples valores.
+
+    Raises:
+        ValueError: Si n_resamples, chunk_size o max_workers son menores que
+            1, o si no hay muestras.
+    """
+    if n_resamples < 1:
+        raise ValueError(f"n_resamples must be >= 1, got {n_resamples}")
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    y_true = np.asarray(y_true)
+    if y_true.size == 0:
+        raise ValueError("Cannot bootstrap an empty sample")
+    if chunk_size is None:
+        chunk_size = max(1, _MAX_INDEX_ENTRIES // len(y_true))
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
+    build, n_classes = shared_confusion_matrix(metrics, y_true, y_pred)
+    codes = None
+    if build:
+        codes, n_classes = confusion_codes(y_true, y_pred, n_classes)
+    task = _BootstrapTask(
+        y_true=y_true,
+        y_pred=np.asarray(y_pred),
+        y_proba=None if y_proba is None else np.asarray(y_proba),
+        metrics=list(metrics),
+        probabilistic_metrics=list(probabilistic_metrics or []),
+        codes=codes,
+        n_classes=n_classes or 2,
+    )
+    sizes = [min(chunk_size, n_resamples - start) for start in range(0, n_resamples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if max_workers == 1:
+        blocks = [task.run_block(block_seed, size) for block_seed, size in zip(seeds, sizes)]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(task,)
+        ) as executor:
+            blocks = list(executor.map(_run_block, seeds, sizes))
+
+    return {name: np.concatenate([block[name] for block in blocks]) for name in blocks[0]}
+
+
+_worker_task: _BootstrapTask | None = None
+
+
+def _init_worker(task: _BootstrapTask) -> None:
+    """Guarda la tarea en el proceso worker, una sola vez por proceso."""
+    global _worker_task
+    _worker_task = task
+
+
+def _run_block(seed: np.random.SeedSequence, n_resamples: int) -> dict[str, np.ndarray]:
+    """Ejecuta un bloque en el worker."""
+    if _worker_task is None:
+        raise RuntimeError("Bootstrap worker used before _init_worker()")
+    return _worker_task.run_block(seed, n_resamples)
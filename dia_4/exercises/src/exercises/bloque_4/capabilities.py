@@ -0,0 +1,127 @@
+"""
+Capacidades opcionales de las métricas, además de los Protocols de protocols.py.
+
+Una métrica que cumple uno de estos Protocols sigue siendo una
+ClassificationMetric, ProbabilisticMetric o RegressionMetric normal: los
+evaluadores lo detectan con isinstance() y usan el camino rápido; si no, se
+llama a compute() como siempre. Así añadir una capacidad no cambia el
+contrato base (ISP).
+"""
+
+from collections.abc import Iterable
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+
+from .helpers import binary_labels
+from .protocols import ClassificationMetric
+from .streaming import RegressionAccumulator
+
+
+@runtime_checkable
+class ConfusionMatrixMetric(Protocol):
+    """
+    ClassificationMetric que además sabe calcularse desde la matriz de confusión.
+
+    - confusion_classes: 2 si compute_from_confusion() espera la matriz binaria
+      2x2 (etiquetas 0/1); None si vale cualquier número de clases.
+    - compute_from_confusions(): lo mismo para una pila (R, K, K) de matrices,
+      un valor por matriz y sin bucle de Python (bootstrap, grupos, modelos).
+    - needs_confusion: True si compute() construiría la matriz de todas formas.
+      Solo estas métricas hacen que el evaluador la calcule (ver
+      shared_confusion_matrix); las demás la reutilizan si ya existe.
+    """
+
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def confusion_classes(self) -> int | None: ...
+
+    @property
+    def needs_confusion(self) -> bool: ...
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float: ...
+
+    def compute_from_confusion(self, cm: np.ndarray) -> float: ...
+
+    def compute_from_confusions(self, cms: np.ndarray) -> np.ndarray: ...
+
+
+@runtime_checkable
+class StreamingRegressionMetric(Protocol):
+    """
+    RegressionMetric que además sabe calcularse desde un RegressionAccumulator.
+
+    Permite a RegressionEvaluator evaluar por trozos (o combinando los
+    acumuladores de varios workers) sin tener los arrays enteros en memoria.
+    """
+
+    @property
+    def name(self) -> str: ...
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float: ...
+
+    def compute_from_accumulator(self, accumulator: RegressionAccumulator) -> float: ...
+
+
+@runtime_checkable
+class ResampledProbabilisticMetric(Protocol):
+    """
+    ProbabilisticMetric que además calcula muchas réplicas bootstrap de golpe.
+
+    indices es una matriz (réplicas, n) con las muestras de cada réplica.
+    Devuelve un valor por réplica.
+    """
+
+    @property
+    def name(self) -> str: ...
+
+    def compute(self, y_true: np.ndarray, y_proba: np.ndarray) -> float: ...
+
+    def compute_resampled(
+        self, y_true: np.ndarray, y_proba: np.ndarray, indices: np.ndarray
+    ) -> np.ndarray: ...
+
+
+@runtime_checkable
+class ColumnwiseProbabilisticMetric(Protocol):
+    """
+    ProbabilisticMetric que además evalúa varios modelos a la vez.
+
+    y_proba es una matriz (n, modelos) con una columna por modelo; devuelve
+    un valor por columna.
+    """
+
+    @property
+    def name(self) -> str: ...
+
+    def compute(self, y_true: np.ndarray, y_proba: np.ndarray) -> float: ...
+
+    def compute_columns(self, y_true: np.ndarray, y_proba: np.ndarray) -> np.ndarray: ...
+
+
+def shared_confusion_matrix(
+    metrics: Iterable[ClassificationMetric], y_true: np.ndarray, y_pred: np.ndarray
+) -> tuple[bool, int | None]:
+    """
+    Decide si se construye UNA matriz de confusión compartida, y con cuántas clases.
+
+    Solo se construye si alguna métrica la necesita (needs_confusion); en ese
+    caso la usan todas las ConfusionMatrixMetric. Si alguna es binaria
+    (confusion_classes == 2), la matriz es 2x2 y las etiquetas deben ser 0/1.
+    Si TODAS son binarias y las etiquetas no son 0/1 (-1/1, float con
+    decimales...), no se construye: compute() las cuenta con máscaras (ver
+    helpers.binary_confusion_matrix).
+
+    Returns:
+        (build, n_classes): build es False si ninguna métrica la necesita;
+        n_classes es None si se deduce de las etiquetas.
+    """
+    capable = [m for m in metrics if isinstance(m, ConfusionMatrixMetric)]
+    if not any(m.needs_confusion for m in capable):
+        return False, None
+    binary = [m.confusion_classes == 2 for m in capable]
+    if all(binary) and not binary_labels(y_true, y_pred):
+        return False, None
+    return True, 2 if any(binary) else None
@@ -0,0 +1,277 @@
+"""
+Comparación de muchos modelos sobre el mismo y_true.
+
+Las predicciones llegan como matrices con una columna por modelo:
+- y_pred (n, modelos): las matrices de confusión de TODOS los modelos salen
+  de UN np.bincount sobre modelo*K² + K*y_true + y_pred.
+- y_proba (n, modelos): las métricas ColumnwiseProbabilisticMetric (AUC)
+  ordenan todas las columnas con un solo np.argsort.
+
+El resultado es una ComparisonTable con un EvaluationResult por modelo,
+ordenada por una métrica. Con y_proba se añade el test de DeLong: p-valor de
+la diferencia de AUC de cada modelo frente al primero de la tabla, usando la
+covarianza de los AUC (pareados: mismas muestras) de todos los modelos.
+"""
+
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .capabilities import (
+    ColumnwiseProbabilisticMetric,
+    ConfusionMatrixMetric,
+    shared_confusion_matrix,
+)
+from .evaluation import EvaluationResult
+from .helpers import confusion_codes, midranks
+from .protocols import ClassificationMetric, ProbabilisticMetric
+
+
+@dataclass(frozen=True)
+class DeLongResult:
+    """
+    AUC de varios modelos y su matriz de covarianza (DeLong et al., 1988).
+
+    Se calcula con el algoritmo rápido de Sun y Xu (2014): solo rangos medios
+    de positivos, negativos y de todas las muestras, para todos los modelos
+    a la vez.
+    """
+
+    aucs: np.ndarray
+    covariance: np.ndarray
+
+    def test(self, a: int, b: int) -> tuple[float, float]:
+        """
+        Test pareado de H0: AUC[a] == AUC[b].
+
+        Returns:
+            (z, p_value) con p-valor bilateral. Si la varianza de la diferencia
+            es 0, z = 0.0 y p = 1.0.
+        """
+        variance = (
+            self.covariance[a, a] + self.covariance[b, b] - 2 * self.covariance[a, b]
+        )
+        if variance <= 0:
+            return 0.0, 1.0
+        z = float((self.aucs[a] - self.aucs[b]) / math.sqrt(variance))
+        return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+def delong(y_true: np.ndarray, y_proba: np.ndarray) -> DeLongResult:
+    """
+    AUC y covarianza de DeLong de cada columna de y_proba (n, modelos).
+
+    Raises:
+        ValueError: Si y_true no tiene positivos (1) y negativos a la vez.
+    """
+    positives = np.asarray(y_true) == 1
+    y_proba = np.asarray(y_proba, dtype=np.float64)
+    if y_proba.ndim == 1:
+        y_proba = y_proba[:, None]
+    scores_pos = y_proba[positives]
+    scores_neg = y_proba[~positives]
+    n_pos, n_neg = len(scores_pos), len(scores_neg)
+    if n_pos == 0 or n_neg == 0:
+        raise ValueError("DeLong test needs both positive and negative samples")
+
+    ranks_all = midranks(np.concatenate([scores_pos, scores_neg]))
+    ranks_pos = ranks_all[:n_pos]
+    aucs = ranks_pos.sum(axis=0) / (n_pos * n_neg) - (n_pos + 1) / (2 * n_neg)
+
+    # Componentes estructurales: por cada positivo, fracción de negativos por debajo;
+    # por cada negativo, fracción de positivos por encima
+    v_pos = (ranks_pos - midranks(scores_pos)) / n_neg
+    v_neg = 1 - (ranks_all[n_pos:] - midranks(scores_neg)) / n_pos
+    covariance = (
+        np.atleast_2d(np.cov(v_pos, rowvar=False)) / n_pos
+        + np.atleast_2d(np.cov(v_neg, rowvar=False)) / n_neg
+    )
+    return DeLongResult(aucs=aucs, covariance=covariance)
+
+
+@dataclass(frozen=True)
+class ComparisonTable:
+    """
+    Resultados de varios modelos, ordenados del mejor al peor según rank_by.
+
+    p_values: p-valor de DeLong de la diferencia de AUC entre cada modelo y
+    el primero de la tabla (vacío si no se pasaron probabilidades).
+    """
+
+    results: list[EvaluationResult]
+    rank_by: str
+    p_values: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def model_names(self) -> list[str]:
+        """Nombres de los modelos, en el orden de la tabla."""
+        return [result.model_name for result in self.results]
+
+    def to_text(self, digits: int = 4) -> str:
+        """Tabla de texto alineada (una fila por modelo)."""
+        metric_names = list(self.results[0].metrics) if self.results else []
+        header = ["rank", "model", *metric_names]
+        if self.p_values:
+            header.append("p_value")
+        rows = [header]
+        for rank, result in enumerate(self.results, start=1):
+            row = [str(rank), result.model_name]
+            row += [f"{result.metrics[name]:.{digits}f}" for name in metric_names]
+            if self.p_values:
+                p_value = self.p_values.get(result.model_name)
+                row.append("-" if p_value is None else f"{p_value:.{digits}f}")
+            rows.append(row)
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        return "\n".join(
+            "  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows
+        )
+
+
+class ModelComparator:
+    """
+    Evalúa N modelos a la vez con las mismas métricas y los ordena.
+
+    Mismas métricas que ClassificationEvaluator (OCP: el comparador solo
+    itera). Las ConfusionMatrixMetric (cuando alguna necesita la matriz, como
+    en evaluate()) y las ColumnwiseProbabilisticMetric usan los kernels
+    vectorizados; el resto se calcula columna a columna con compute().
+    """
+
+    def __init__(
+        self,
+        metrics: list[ClassificationMetric] | None = None,
+        probabilistic_metrics: list[ProbabilisticMetric] | None = None,
+        rank_by: str | None = None,
+        higher_is_better: bool = True,
+    ) -> None:
+        """
+        Args:
+            rank_by: Métrica para ordenar. Por defecto, la primera.
+            higher_is_better: False para métricas donde menos es mejor.
+
+        Raises:
+            ValueError: Si no se pasa ninguna métrica.
+        """
+        self._metrics = metrics or []
+        self._probabilistic_metrics = probabilistic_metrics or []
+        all_names = [m.name for m in [*self._metrics, *self._probabilistic_metrics]]
+        if not all_names:
+            raise ValueError("At least one metric is required")
+        self._rank_by = rank_by or all_names[0]
+        self._higher_is_better = higher_is_better
+
+    def compare(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray | None = None,
+        y_proba: np.ndarray | None = None,
+        model_names: list[str] | None = None,
+        significance: bool = True,
+    ) -> ComparisonTable:
+        """
+        Calcula todas las métricas de todos los modelos y devuelve la tabla ordenada.
+
+        Args:
+            y_true: Etiquetas reales, (n,).
+            y_pred: Predicciones, (n, modelos). Necesario para `metrics`.
+            y_proba: Probabilidades, (n, modelos). Necesario para
+                `probabilistic_metrics` y para el test de DeLong.
+            model_names: Nombre de cada columna. Por defecto "model_0", ...
+            significance: Si hay y_proba, añade los p-valores de DeLong.
+
+        Raises:
+            ValueError: Si las matrices no tienen forma (n, modelos) coherente
+                o rank_by no es una de las métricas calculadas.
+        """
+        y_true = np.asarray(y_true)
+        n_models = _check_matrices(y_true, y_pred, y_proba)
+        names = model_names or [f"model_{k}" for k in range(n_models)]
+        if len(names) != n_models:
+            raise ValueError(f"Expected {n_models} model names, got {len(names)}")
+
+        columns: dict[str, np.ndarray] = {}
+        if y_pred is not None and self._metrics:
+            columns.update(self._classification_columns(y_true, np.asarray(y_pred)))
+        if y_proba is not None:
+            for m in self._probabilistic_metrics:
+                if isinstance(m, ColumnwiseProbabilisticMetric):
+                    columns[m.name] = np.asarray(m.compute_columns(y_true, y_proba))
+                else:
+                    columns[m.name] = np.array(
+                        [m.compute(y_true, y_proba[:, k]) for k in range(n_models)]
+                    )
+        if self._rank_by not in columns:
+            raise ValueError(f"rank_by metric {self._rank_by!r} was not computed")
+
+        key = columns[self._rank_by]
+        ranking = np.argsort(-key if self._higher_is_better else key, kind="stable")
+        results = [
+            EvaluationResult(
+                metrics={name: float(values[k]) for name, values in columns.items()},
+                model_name=names[k],
+            )
+            for k in ranking
+        ]
+
+        p_values = {}
+        if significance and y_proba is not None and n_models > 1:
+            try:
+                test = delong(y_true, y_proba)
+            except ValueError:
+                test = None
+            if test is not None:
+                best = int(ranking[0])
+                for k in ranking[1:]:
+                    p_values[names[k]] = test.test(best, int(k))[1]
+        return ComparisonTable(results=results, rank_by=self._rank_by, p_values=p_values)
+
+    def _classification_columns(
+        self, y_true: np.ndarray, y_pred: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """Valores de las métricas de clasificación, una entrada por modelo."""
+        n_models = y_pred.shape[1]
+        build, n_classes = shared_confusion_matrix(self._metrics, y_true, y_pred)
+        confusion = _confusion_matrices(y_true, y_pred, n_classes) if build else None
+        columns = {}
+        for m in self._metrics:
+            if confusion is not None and isinstance(m, ConfusionMatrixMetric):
+                columns[m.name] = m.compute_from_confusions(confusion)
+            else:
+                columns[m.name] = np.array(
+                    [m.compute(y_true, y_pred[:, k]) for k in range(n_models)]
+                )
+        return columns
+
+
+def _confusion_matrices(
+    y_true: np.ndarray, y_pred: np.ndarray, n_classes: int | None = None
+) -> np.ndarray:
+    """Matriz de confusión de cada columna de y_pred con un solo np.bincount."""
+    n_models = y_pred.shape[1]
+    codes, n_classes = confusion_codes(
+        np.broadcast_to(y_true[:, None], y_pred.shape), y_pred, n_classes
+    )
+    cells = n_classes * n_classes
+    codes += np.arange(n_models, dtype=np.intp) * cells
+    counts = np.bincount(codes.ravel(), minlength=n_models * cells)
+    return counts.reshape(n_models, n_classes, n_classes)
+
+
+def _check_matrices(
+    y_true: np.ndarray, y_pred: np.ndarray | None, y_proba: np.ndarray | None
+) -> int:
+    """Comprueba que las matrices son (n, modelos) y devuelve el número de modelos."""
+    n_models = None
+    for label, matrix in (("y_pred", y_pred), ("y_proba", y_proba)):
+        if matrix is None:
+            continue
+        shape = np.shape(matrix)
+        if len(shape) != 2 or shape[0] != len(y_true):
+            raise ValueError(f"{label} must have shape ({len(y_true)}, n_models), got {shape}")
+        if n_models is not None and shape[1] != n_models:
+            raise ValueError("y_pred and y_proba must have the same number of models")
+        n_models = shape[1]
+    if n_models is None:
+        raise ValueError("Pass y_pred and/or y_proba")
+    return n_models
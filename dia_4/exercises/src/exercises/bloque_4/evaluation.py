@@ -7,13 +7,45 @@ Tu trabajo:
 3. Verificar que añadir una métrica nueva NO toca código existente (OCP)
 """
 
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
 
 import numpy as np
 
-from .helpers import accuracy, auc_roc, f1_binary, mae, rmse
+from .bootstrap import bootstrap_metrics, percentile_interval
+from .capabilities import (
+    ConfusionMatrixMetric,
+    StreamingRegressionMetric,
+    shared_confusion_matrix,
+)
+from .grouping import GroupIndex, grouped_confusion_matrices, grouped_regression_accumulators
+from .helpers import (
+    F1_AVERAGES,
+    accuracy,
+    accuracy_from_confusion,
+    auc_roc,
+    auc_roc_columns,
+    auc_roc_ovr,
+    auc_roc_resampled,
+    binary_confusion_matrix,
+    confusion_matrix,
+    f1_binary,
+    f1_from_confusion,
+    f1_multiclass,
+    f1_multiclass_from_confusion,
+    f1_multilabel,
+    mae,
+    max_error,
+    mcc_from_confusion,
+    precision_from_confusion,
+    r2_score,
+    recall_from_confusion,
+    rmse,
+    top_k_accuracy,
+)
 from .protocols import ClassificationMetric, ProbabilisticMetric, RegressionMetric
-
+from .streaming import DEFAULT_CHUNK_SIZE, BinnedAUCAccumulator, RegressionAccumulator
 
 # --- Estructura de datos: resultado de la evaluación ---
 
@@ -25,9 +57,14 @@ class EvaluationResult:
 
     Hints:
     - Campos: metrics (dict[str, float]), model_name (str)
+
+    confidence_intervals (opcional) guarda el intervalo (low, high) de cada
+    métrica cuando se evalúa con bootstrap.
     """
 
-    ...
+    metrics: dict[str, float]
+    model_name: str
+    confidence_intervals: dict[str, tuple[float, float]] = field(default_factory=dict)
 
 
 # --- Métricas de clasificación (cumplen ClassificationMetric) ---
@@ -40,9 +77,26 @@ class AccuracyMetric:
     Hints:
     - @property name devuelve "accuracy" (un string fijo).
     - compute() llama a accuracy() de helpers.py. UNA línea.
+
+    También cumple ConfusionMatrixMetric.
     """
 
-    ...
+    # compute() no necesita la matriz: solo la reutiliza si otra métrica la pide
+    confusion_classes: int | None = None
+    needs_confusion = False
+
+    @property
+    def name(self) -> str:
+        return "accuracy"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return accuracy(y_true, y_pred)
+
+    def compute_from_confusion(self, cm: np.ndarray) -> float:
+        return float(accuracy_from_confusion(cm))
+
+    def compute_from_confusions(self, cms: np.ndarray) -> np.ndarray:
+        return np.asarray(accuracy_from_confusion(cms))
 
 
 class F1Metric:
@@ -52,9 +106,89 @@ class F1Metric:
     Hints:
     - @property name devuelve "f1".
     - compute() llama a f1_binary() de helpers.py. UNA línea.
+
+    También cumple ConfusionMatrixMetric.
+    """
+
+    confusion_classes: int | None = 2
+    needs_confusion = True
+
+    @property
+    def name(self) -> str:
+        return "f1"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return f1_binary(y_true, y_pred)
+
+    def compute_from_confusion(self, cm: np.ndarray) -> float:
+        return float(f1_from_confusion(cm))
+
+    def compute_from_confusions(self, cms: np.ndarray) -> np.ndarray:
+        return np.asarray(f1_from_confusion(cms))
+
+
+class PrecisionMetric:
+    """Precision de la clase 1. Cumple ClassificationMetric y ConfusionMatrixMetric."""
+
+    confusion_classes: int | None = 2
+    needs_confusion = True
+
+    @property
+    def name(self) -> str:
+        return "precision"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return float(precision_from_confusion(binary_confusion_matrix(y_true, y_pred)))
+
+    def compute_from_confusion(self, cm: np.ndarray) -> float:
+        return float(precision_from_confusion(cm))
+
+    def compute_from_confusions(self, cms: np.ndarray) -> np.ndarray:
+        return np.asarray(precision_from_confusion(cms))
+
+
+class RecallMetric:
+    """Recall de la clase 1. Cumple ClassificationMetric y ConfusionMatrixMetric."""
+
+    confusion_classes: int | None = 2
+    needs_confusion = True
+
+    @property
+    def name(self) -> str:
+        return "recall"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return float(recall_from_confusion(binary_confusion_matrix(y_true, y_pred)))
+
+    def compute_from_confusion(self, cm: np.ndarray) -> float:
+        return float(recall_from_confusion(cm))
+
+    def compute_from_confusions(self, cms: np.ndarray) -> np.ndarray:
+        return np.asarray(recall_from_confusion(cms))
+
+
+class MCCMetric:
     """
+    Matthews correlation coefficient. Cumple ClassificationMetric y ConfusionMatrixMetric.
+
+    OJO: devuelve -1.0 a 1.0, no 0.0 a 1.0 como el resto.
+    """
+
+    confusion_classes: int | None = 2
+    needs_confusion = True
 
-    ...
+    @property
+    def name(self) -> str:
+        return "mcc"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return float(mcc_from_confusion(binary_confusion_matrix(y_true, y_pred)))
+
+    def compute_from_confusion(self, cm: np.ndarray) -> float:
+        return float(mcc_from_confusion(cm))
+
+    def compute_from_confusions(self, cms: np.ndarray) -> np.ndarray:
+        return np.asarray(mcc_from_confusion(cms))
 
 
 # --- Métrica probabilística (cumple ProbabilisticMetric) ---
@@ -69,9 +203,160 @@ class AUCROCMetric:
     - compute() llama a auc_roc() de helpers.py.
     - NOTA: recibe y_proba (probabilidades), no y_pred (predicciones).
       Por eso es un Protocol DISTINTO.
+
+    También cumple ResampledProbabilisticMetric (bootstrap vectorizado) y
+    ColumnwiseProbabilisticMetric (varios modelos a la vez).
+    """
+
+    @property
+    def name(self) -> str:
+        return "auc_roc"
+
+    def compute(self, y_true: np.ndarray, y_proba: np.ndarray) -> float:
+        return auc_roc(y_true, y_proba)
+
+    def compute_resampled(
+        self, y_true: np.ndarray, y_proba: np.ndarray, indices: np.ndarray
+    ) -> np.ndarray:
+        return auc_roc_resampled(y_true, y_proba, indices)
+
+    def compute_columns(self, y_true: np.ndarray, y_proba: np.ndarray) -> np.ndarray:
+        return auc_roc_columns(y_true, y_proba)
+
+
+class BinnedAUCMetric:
+    """
+    AUC-ROC aproximado por histogramas. Cumple ProbabilisticMetric.
+
+    Recorre y_proba por trozos con un BinnedAUCAccumulator: no ordena nada y
+    la memoria extra es O(chunk_size + n_bins), así que sirve para arrays
+    enormes o memmaps. Para el valor exacto, usa AUCROCMetric.
     """
 
-    ...
+    def __init__(self, n_bins: int = 10_000, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._n_bins = n_bins
+        self._chunk_size = chunk_size
+
+    @property
+    def name(self) -> str:
+        return "auc_roc_binned"
+
+    def compute(self, y_true: np.ndarray, y_proba: np.ndarray) -> float:
+        accumulator = BinnedAUCAccumulator(n_bins=self._n_bins)
+        accumulator.update_chunked(y_true, y_proba, chunk_size=self._chunk_size)
+        return accumulator.auc()
+
+
+# --- Métricas multiclase y multietiqueta ---
+
+
+class MulticlassF1Metric:
+    """
+    F1 multiclase promediado. Cumple ClassificationMetric y ConfusionMatrixMetric.
+
+    average: "macro", "micro" o "weighted" (ver f1_multiclass_from_confusion).
+    Con 1000 clases la matriz de confusión sigue siendo UN np.bincount.
+    """
+
+    confusion_classes: int | None = None
+    needs_confusion = True
+
+    def __init__(self, average: str = "macro") -> None:
+        """
+        Raises:
+            ValueError: Si average no es "macro", "micro" ni "weighted".
+        """
+        if average not in F1_AVERAGES:
+            raise ValueError(f"average must be one of {F1_AVERAGES}, got {average!r}")
+        self._average = average
+
+    @property
+    def name(self) -> str:
+        return f"f1_{self._average}"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return f1_multiclass(y_true, y_pred, self._average)
+
+    def compute_from_confusion(self, cm: np.ndarray) -> float:
+        return float(f1_multiclass_from_confusion(cm, self._average))
+
+    def compute_from_confusions(self, cms: np.ndarray) -> np.ndarray:
+        return np.asarray(f1_multiclass_from_confusion(cms, self._average))
+
+
+class MultilabelF1Metric:
+    """
+    F1 multietiqueta promediado. Cumple ClassificationMetric.
+
+    y_true e y_pred son matrices (n, etiquetas) de 0/1. NO cumple
+    ConfusionMatrixMetric: una matriz K×K no describe muestras con varias
+    etiquetas.
+    """
+
+    def __init__(self, average: str = "macro") -> None:
+        """
+        Raises:
+            ValueError: Si average no es "macro", "micro" ni "weighted".
+        """
+        if average not in F1_AVERAGES:
+            raise ValueError(f"average must be one of {F1_AVERAGES}, got {average!r}")
+        self._average = average
+
+    @property
+    def name(self) -> str:
+        return f"f1_multilabel_{self._average}"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return f1_multilabel(y_true, y_pred, self._average)
+
+
+class OneVsRestAUCMetric:
+    """
+    AUC-ROC uno-contra-resto promediado. Cumple ProbabilisticMetric.
+
+    y_proba es (n, K); y_true, un vector de clases o una matriz (n, K) de 0/1
+    (multietiqueta). average: "macro" o "weighted" (por prevalencia).
+    """
+
+    def __init__(self, average: str = "macro") -> None:
+        """
+        Raises:
+            ValueError: Si average no es "macro" ni "weighted".
+        """
+        if average not in ("macro", "weighted"):
+            raise ValueError(f"average must be 'macro' or 'weighted', got {average!r}")
+        self._average = average
+
+    @property
+    def name(self) -> str:
+        return f"auc_roc_ovr_{self._average}"
+
+    def compute(self, y_true: np.ndarray, y_proba: np.ndarray) -> float:
+        return auc_roc_ovr(y_true, y_proba, self._average)
+
+
+class TopKAccuracyMetric:
+    """
+    Top-k accuracy. Cumple ProbabilisticMetric: necesita los scores (n, K).
+
+    Una muestra acierta si su clase real está entre las k de mayor score.
+    """
+
+    def __init__(self, k: int = 5) -> None:
+        """
+        Raises:
+            ValueError: Si k < 1.
+        """
+        if k < 1:
+            raise ValueError(f"k must be >= 1, got {k}")
+        self._k = k
+
+    @property
+    def name(self) -> str:
+        return f"top_{self._k}_accuracy"
+
+    def compute(self, y_true: np.ndarray, y_proba: np.ndarray) -> float:
+        return top_k_accuracy(y_true, y_proba, self._k)
 
 
 # --- Métricas de regresión (cumplen RegressionMetric) ---
@@ -84,9 +369,19 @@ class RMSEMetric:
     Hints:
     - @property name devuelve "rmse".
     - compute() llama a rmse() de helpers.py.
+
+    También cumple StreamingRegressionMetric.
     """
 
-    ...
+    @property
+    def name(self) -> str:
+        return "rmse"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return rmse(y_true, y_pred)
+
+    def compute_from_accumulator(self, accumulator: RegressionAccumulator) -> float:
+        return accumulator.rmse()
 
 
 class MAEMetric:
@@ -96,9 +391,47 @@ class MAEMetric:
     Hints:
     - @property name devuelve "mae".
     - compute() llama a mae() de helpers.py.
+
+    También cumple StreamingRegressionMetric.
     """
 
-    ...
+    @property
+    def name(self) -> str:
+        return "mae"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return mae(y_true, y_pred)
+
+    def compute_from_accumulator(self, accumulator: RegressionAccumulator) -> float:
+        return accumulator.mae()
+
+
+class R2Metric:
+    """Coeficiente de determinación R². Cumple RegressionMetric y StreamingRegressionMetric."""
+
+    @property
+    def name(self) -> str:
+        return "r2"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return r2_score(y_true, y_pred)
+
+    def compute_from_accumulator(self, accumulator: RegressionAccumulator) -> float:
+        return accumulator.r2()
+
+
+class MaxErrorMetric:
+    """Mayor error absoluto. Cumple RegressionMetric y StreamingRegressionMetric."""
+
+    @property
+    def name(self) -> str:
+        return "max_error"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return max_error(y_true, y_pred)
+
+    def compute_from_accumulator(self, accumulator: RegressionAccumulator) -> float:
+        return accumulator.max_error()
 
 
 # --- Evaluador de clasificación ---
@@ -121,9 +454,141 @@ class ClassificationEvaluator:
     CLAVE OCP: este evaluador NO sabe qué métricas tiene. Solo itera
     sobre la lista. Añadir RecallMetric = crear clase, pasarla en la lista.
     Cero cambios aquí.
+
+    Las métricas que cumplen ConfusionMatrixMetric no recorren los arrays:
+    si alguna necesita la matriz de confusión (precision, recall, F1, MCC...),
+    evaluate() la calcula UNA vez (un np.bincount) y todas derivan su valor de
+    ella. Añadir precision, recall o MCC no añade pasadas sobre los datos.
+    Accuracy sola no construye la matriz: usa compute(), que admite
+    cualquier etiqueta (str, -1/1...).
     """
 
-    ...
+    def __init__(
+        self,
+        metrics: list[ClassificationMetric],
+        probabilistic_metrics: list[ProbabilisticMetric] | None = None,
+        model_name: str = "unnamed",
+    ) -> None:
+        self._metrics = metrics
+        self._probabilistic_metrics = probabilistic_metrics or []
+        self._model_name = model_name
+
+    def evaluate(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        y_proba: np.ndarray | None = None,
+    ) -> EvaluationResult:
+        """Calcula todas las métricas y las devuelve en un EvaluationResult."""
+        build, n_classes = shared_confusion_matrix(self._metrics, y_true, y_pred)
+        confusion = confusion_matrix(y_true, y_pred, n_classes) if build else None
+        metrics_dict = {}
+        for m in self._metrics:
+            if confusion is not None and isinstance(m, ConfusionMatrixMetric):
+                metrics_dict[m.name] = m.compute_from_confusion(confusion)
+            else:
+                metrics_dict[m.name] = m.compute(y_true, y_pred)
+
+        if y_proba is not None:
+            for m in self._probabilistic_metrics:
+                metrics_dict[m.name] = m.compute(y_true, y_proba)
+
+        return EvaluationResult(metrics=metrics_dict, model_name=self._model_name)
+
+    def evaluate_bootstrap(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        y_proba: np.ndarray | None = None,
+        n_resamples: int = 1000,
+        confidence: float = 0.95,
+        seed: int | None = None,
+        chunk_size: int | None = None,
+        max_workers: int = 1,
+    ) -> EvaluationResult:
+        """
+        Como evaluate(), más un intervalo de confianza bootstrap por métrica.
+
+        Las réplicas se calculan por bloques vectorizados (ver bootstrap.py);
+        el intervalo es el de percentiles.
+
+        Args:
+            n_resamples: Número de réplicas bootstrap.
+            confidence: Nivel del intervalo (0.95 = percentiles 2.5 y 97.5).
+            seed: Semilla para que el resultado sea reproducible.
+            chunk_size: Réplicas por bloque (limita la memoria).
+            max_workers: Procesos entre los que repartir los bloques.
+        """
+        result = self.evaluate(y_true, y_pred, y_proba)
+        samples = bootstrap_metrics(
+            y_true,
+            y_pred,
+            self._metrics,
+            self._probabilistic_metrics,
+            y_proba=y_proba,
+            n_resamples=n_resamples,
+            seed=seed,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+        intervals = {
+            name: percentile_interval(values, confidence) for name, values in samples.items()
+        }
+        return EvaluationResult(
+            metrics=result.metrics,
+            model_name=result.model_name,
+            confidence_intervals=intervals,
+        )
+
+    def evaluate_grouped(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        groups: np.ndarray,
+        y_proba: np.ndarray | None = None,
+    ) -> dict[Any, EvaluationResult]:
+        """
+        Evalúa cada grupo (país, dispositivo...) sin llamar a evaluate() por grupo.
+
+        Si alguna métrica necesita la matriz de confusión, las
+        ConfusionMatrixMetric salen de UN bincount que da la matriz de todos los
+        grupos (como en evaluate()). El resto recibe trozos de los arrays
+        reordenados por grupo UNA vez (ver grouping.py).
+
+        Args:
+            groups: Clave de grupo de cada muestra (int, str...).
+
+        Returns:
+            Dict clave de grupo → EvaluationResult, con las claves ordenadas.
+        """
+        index = GroupIndex(groups)
+        per_group: list[dict[str, float]] = [{} for _ in range(len(index))]
+        build, n_classes = shared_confusion_matrix(self._metrics, y_true, y_pred)
+        confusion = (
+            grouped_confusion_matrices(y_true, y_pred, index, n_classes) if build else None
+        )
+        parts: tuple[list[np.ndarray], list[np.ndarray]] | None = None
+        for m in self._metrics:
+            if confusion is not None and isinstance(m, ConfusionMatrixMetric):
+                values = m.compute_from_confusions(confusion).tolist()
+            else:
+                if parts is None:
+                    parts = index.split(y_true), index.split(y_pred)
+                values = [m.compute(t, p) for t, p in zip(*parts)]
+            for metrics_dict, value in zip(per_group, values):
+                metrics_dict[m.name] = value
+
+        if y_proba is not None and self._probabilistic_metrics:
+            true_parts = index.split(y_true) if parts is None else parts[0]
+            proba_parts = index.split(y_proba)
+            for m in self._probabilistic_metrics:
+                for metrics_dict, t, p in zip(per_group, true_parts, proba_parts):
+                    metrics_dict[m.name] = m.compute(t, p)
+
+        return {
+            key: EvaluationResult(metrics=metrics_dict, model_name=self._model_name)
+            for key, metrics_dict in zip(index.key_list(), per_group)
+        }
 
 
 # --- Evaluador de regresión ---
@@ -137,6 +602,76 @@ class RegressionEvaluator:
     - Mismo patrón que ClassificationEvaluator pero con RegressionMetric.
     - __init__ recibe: metrics: list[RegressionMetric], model_name: str
     - Método evaluate(y_true, y_pred) -> EvaluationResult
+
+    Para datos que no caben en memoria (shards, memmaps), evaluate_chunks()
+    los recorre por trozos con un RegressionAccumulator, y
+    evaluate_accumulator() convierte en EvaluationResult un acumulador ya
+    lleno (p. ej. la combinación con merge() de los de varios workers). Ambos
+    exigen métricas que cumplan StreamingRegressionMetric.
     """
 
-    ...
+    def __init__(self, metrics: list[RegressionMetric], model_name: str = "unnamed") -> None:
+        self._metrics = metrics
+        self._model_name = model_name
+
+    def evaluate(self, y_true: np.ndarray, y_pred: np.ndarray) -> EvaluationResult:
+        """Calcula todas las métricas y las devuelve en un EvaluationResult."""
+        metrics_dict = {m.name: m.compute(y_true, y_pred) for m in self._metrics}
+        return EvaluationResult(metrics=metrics_dict, model_name=self._model_name)
+
+    def evaluate_chunks(
+        self, chunks: Iterable[tuple[np.ndarray, np.ndarray]]
+    ) -> EvaluationResult:
+        """Evalúa un flujo de trozos (y_true, y_pred) sin juntarlos en memoria."""
+        accumulator = RegressionAccumulator()
+        for y_true, y_pred in chunks:
+            accumulator.update(y_true, y_pred)
+        return self.evaluate_accumulator(accumulator)
+
+    def evaluate_accumulator(self, accumulator: RegressionAccumulator) -> EvaluationResult:
+        """
+        Calcula todas las métricas desde un acumulador.
+
+        Raises:
+            TypeError: Si alguna métrica no cumple StreamingRegressionMetric.
+        """
+        metrics_dict = {}
+        for m in self._metrics:
+            if not isinstance(m, StreamingRegressionMetric):
+                raise TypeError(f"Metric {m.name!r} cannot be computed from an accumulator")
+            metrics_dict[m.name] = m.compute_from_accumulator(accumulator)
+        return EvaluationResult(metrics=metrics_dict, model_name=self._model_name)
+
+    def evaluate_grouped(
+        self, y_true: np.ndarray, y_pred: np.ndarray, groups: np.ndarray
+    ) -> dict[Any, EvaluationResult]:
+        """
+        Evalúa cada grupo sin llamar a evaluate() por grupo.
+
+        Las métricas StreamingRegressionMetric salen de un RegressionAccumulator
+        por grupo, construidos todos a la vez con bincount ponderado. El resto
+        recibe trozos de los arrays reordenados por grupo UNA vez.
+
+        Returns:
+            Dict clave de grupo → EvaluationResult, con las claves ordenadas.
+        """
+        index = GroupIndex(groups)
+        per_group: list[dict[str, float]] = [{} for _ in range(len(index))]
+        accumulators = None
+        parts: tuple[list[np.ndarray], list[np.ndarray]] | None = None
+        for m in self._metrics:
+            if isinstance(m, StreamingRegressionMetric):
+                if accumulators is None:
+                    accumulators = grouped_regression_accumulators(y_true, y_pred, index)
+                values = [m.compute_from_accumulator(acc) for acc in accumulators]
+            else:
+                if parts is None:
+                    parts = index.split(y_true), index.split(y_pred)
+                values = [m.compute(t, p) for t, p in zip(*parts)]
+            for metrics_dict, value in zip(per_group, values):
+                metrics_dict[m.name] = value
+
+        return {
+            key: EvaluationResult(metrics=metrics_dict, model_name=self._model_name)
+            for key, metrics_dict in zip(index.key_list(), per_group)
+        }
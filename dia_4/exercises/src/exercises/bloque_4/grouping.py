@@ -0,0 +1,160 @@
+"""
+Evaluación por grupos (país, dispositivo, segmento...) en una pasada.
+
+En lugar de filtrar los arrays y llamar a evaluate() una vez por grupo (una
+copia y un recorrido completo por grupo), se codifica cada clave de grupo
+como un entero 0..G-1 UNA vez y después:
+- Las matrices de confusión de todos los grupos salen de UN np.bincount
+  sobre grupo*K² + celda.
+- Las sumas de regresión (errores, media y M2 de y_true) salen de
+  np.bincount con weights, y el error máximo de np.maximum.at.
+- Si las claves son enteros pequeños no negativos, ni siquiera se ordenan:
+  se codifican con np.bincount y una tabla de traducción.
+- Las métricas que necesitan las muestras (AUC, métricas sin atajo) reciben
+  trozos contiguos de los arrays reordenados por grupo con UN argsort
+  estable (reducción segmentada), sin copiar los arrays una vez por grupo.
+"""
+
+from typing import Any
+
+import numpy as np
+
+from .helpers import confusion_codes
+from .streaming import RegressionAccumulator
+
+
+class GroupIndex:
+    """
+    Codificación de un array de claves de grupo.
+
+    keys: claves distintas, ordenadas. inverse[i]: número de grupo de la
+    muestra i. El orden por grupo (para split()) se calcula la primera vez
+    que se pide.
+    """
+
+    def __init__(self, groups: np.ndarray) -> None:
+        """
+        Raises:
+            ValueError: Si groups no es unidimensional.
+        """
+        groups = np.asarray(groups)
+        if groups.ndim != 1:
+            raise ValueError(f"groups must be 1-D, got shape {groups.shape}")
+        if _is_small_int_range(groups):
+            # Claves enteras pequeñas: bincount + tabla de traducción, sin ordenar
+            all_counts = np.bincount(groups)
+            self.keys = np.flatnonzero(all_counts)
+            self.counts = all_counts[self.keys]
+            lookup = np.zeros(all_counts.size, dtype=np.intp)
+            lookup[self.keys] = np.arange(self.keys.size)
+            self.inverse = lookup[groups]
+        else:
+            self.keys, self.inverse, self.counts = np.unique(
+                groups, return_inverse=True, return_counts=True
+            )
+            self.inverse = self.inverse.ravel()
+        self._order: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def order(self) -> np.ndarray:
+        """Permutación que deja las muestras agrupadas (estable: respeta el orden original)."""
+        if self._order is None:
+            self._order = np.argsort(self.inverse, kind="stable")
+        return self._order
+
+    @property
+    def starts(self) -> np.ndarray:
+        """Posición donde empieza cada grupo en el orden agrupado."""
+        return np.cumsum(self.counts) - self.counts
+
+    def split(self, array: np.ndarray) -> list[np.ndarray]:
+        """
+        Reordena array por grupo (una sola copia) y devuelve una vista por grupo.
+
+        Raises:
+            ValueError: Si array no tiene una muestra por clave de grupo.
+        """
+        array = np.asarray(array)
+        if len(array) != len(self.inverse):
+            raise ValueError(
+                f"Arrays and groups must have the same length, got {len(array)} "
+                f"and {len(self.inverse)}"
+            )
+        grouped = array[self.order]
+        return [grouped[start : start + count] for start, count in zip(self.starts, self.counts)]
+
+    def key_list(self) -> list[Any]:
+        """Claves como objetos de Python (int, str...), en el orden de los grupos."""
+        return self.keys.tolist()
+
+
+def _is_small_int_range(groups: np.ndarray) -> bool:
+    """True si las claves son enteros >= 0 con un máximo no mucho mayor que len(groups)."""
+    # bool queda fuera: indexar con un array bool es una máscara, no una tabla
+    if groups.dtype.kind not in "iu" or groups.size == 0:
+        return False
+    return groups.min() >= 0 and groups.max() <= max(groups.size, 1 << 16)
+
+
+def grouped_confusion_matrices(
+    y_true: np.ndarray, y_pred: np.ndarray, group_index: GroupIndex, n_classes: int | None = None
+) -> np.ndarray:
+    """
+    Matriz de confusión de cada grupo con un solo np.bincount.
+
+    Returns:
+        Array (grupos, K, K).
+    """
+    codes, n_classes = confusion_codes(y_true, y_pred, n_classes)
+    if codes.shape != group_index.inverse.shape:
+        raise ValueError("y_true, y_pred and groups must have the same length")
+    cells = n_classes * n_classes
+    grouped_codes = group_index.inverse * cells
+    grouped_codes += codes
+    counts = np.bincount(grouped_codes, minlength=len(group_index) * cells)
+    return counts.reshape(len(group_index), n_classes, n_classes)
+
+
+def grouped_regression_accumulators(
+    y_true: np.ndarray, y_pred: np.ndarray, group_index: GroupIndex
+) -> list[RegressionAccumulator]:
+    """
+    Un RegressionAccumulator por grupo, calculados con bincount ponderado.
+
+    Raises:
+        ValueError: Si y_true, y_pred y los grupos tienen distinta longitud.
+    """
+    y_true = np.asarray(y_true, dtype=np.float64)
+    error = np.subtract(y_pred, y_true, dtype=np.float64)
+    if not y_true.shape == error.shape == group_index.inverse.shape:
+        raise ValueError("y_true, y_pred and groups must have the same length")
+    inverse = group_index.inverse
+    n_groups = len(group_index)
+    counts = group_index.counts
+    if n_groups == 0:
+        return []
+
+    sum_squared = np.bincount(inverse, weights=error * error, minlength=n_groups)
+    np.abs(error, out=error)
+    sum_absolute = np.bincount(inverse, weights=error, minlength=n_groups)
+    max_absolute = np.zeros(n_groups)
+    np.maximum.at(max_absolute, inverse, error)
+
+    means = np.bincount(inverse, weights=y_true, minlength=n_groups) / counts
+    deviation = y_true - means[inverse]
+    m2 = np.bincount(inverse, weights=deviation * deviation, minlength=n_groups)
+
+    accumulators = []
+    for i in range(n_groups):
+        accumulator = RegressionAccumulator()
+        accumulator.count = int(counts[i])
+        accumulator.sum_squared_error = float(sum_squared[i])
+        accumulator.sum_absolute_error = float(sum_absolute[i])
+        accumulator.max_absolute_error = float(max_absolute[i])
+        accumulator.mean_true = float(means[i])
+        accumulator.m2_true = float(m2[i])
+        accumulators.append(accumulator)
+    return accumulators
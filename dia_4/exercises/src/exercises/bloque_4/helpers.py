@@ -14,26 +14,508 @@ def accuracy(y_true: np.ndarray, y_pred: np.ndarray) -> float:
 
 def f1_binary(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     """F1 score para clasificación binaria. Devuelve 0.0 a 1.0."""
-    tp = float(np.sum((y_true == 1) & (y_pred == 1)))
-    fp = float(np.sum((y_true == 0) & (y_pred == 1)))
-    fn = float(np.sum((y_true == 1) & (y_pred == 0)))
-    precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
-    recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
-    return (
-        2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
+    return float(f1_from_confusion(binary_confusion_matrix(y_true, y_pred)))
+
+
+def binary_confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """
+    Matriz [[tn, fp], [fn, tp]] de la clase 1 frente a la clase 0.
+
+    Con etiquetas 0/1 (enteras, bool o float sin decimales) es
+    confusion_matrix(..., n_classes=2). Con cualquier otra etiqueta (-1/1,
+    0.5...) cuenta con máscaras, como el f1_binary original: las muestras que
+    no son ni 0 ni 1 no cuentan en ninguna celda.
+    """
+    if binary_labels(y_true, y_pred):
+        return confusion_matrix(y_true, y_pred, n_classes=2)
+    true_pos, pred_pos = y_true == 1, y_pred == 1
+    true_neg, pred_neg = y_true == 0, y_pred == 0
+    return np.array(
+        [
+            [np.sum(true_neg & pred_neg), np.sum(true_neg & pred_pos)],
+            [np.sum(true_pos & pred_neg), np.sum(true_pos & pred_pos)],
+        ]
+    )
+
+
+def binary_labels(y_true: np.ndarray, y_pred: np.ndarray) -> bool:
+    """True si todas las etiquetas son enteras (ver _integer_labels) y valen 0 o 1."""
+    for y in (y_true, y_pred):
+        labels = _integer_labels(y)
+        if labels is None or (labels.size > 0 and (labels.min() < 0 or labels.max() > 1)):
+            return False
+    return True
+
+
+def confusion_matrix(
+    y_true: np.ndarray, y_pred: np.ndarray, n_classes: int | None = None
+) -> np.ndarray:
+    """
+    Matriz de confusión en UNA pasada: np.bincount sobre n_classes*y_true + y_pred.
+
+    cm[i, j] = número de muestras con clase real i y predicha j. En binario
+    (n_classes=2) es [[tn, fp], [fn, tp]]. Las etiquetas deben ser enteros
+    (bool, o float sin decimales) entre 0 y n_classes-1; si n_classes es None
+    se deduce como max(etiqueta) + 1 (mínimo 2).
+
+    Raises:
+        ValueError: Si hay etiquetas fuera de [0, n_classes) o los arrays
+            tienen distinta longitud.
+        TypeError: Si las etiquetas no son enteras (str, float con decimales...).
+    """
+    codes, n_classes = confusion_codes(y_true, y_pred, n_classes)
+    counts = np.bincount(codes.ravel(), minlength=n_classes * n_classes)
+    return counts.reshape(n_classes, n_classes)
+
+
+def confusion_codes(
+    y_true: np.ndarray, y_pred: np.ndarray, n_classes: int | None = None
+) -> tuple[np.ndarray, int]:
+    """
+    Celda de la matriz de confusión de cada muestra: n_classes*y_true + y_pred.
+
+    Devuelve (codes, n_classes). Mismas reglas y errores que confusion_matrix().
+    """
+    y_true = _as_labels(y_true)
+    y_pred = _as_labels(y_pred)
+    if y_true.shape != y_pred.shape:
+        raise ValueError(f"Shape mismatch: {y_true.shape} vs {y_pred.shape}")
+    if y_true.size == 0:
+        return np.zeros(0, dtype=np.intp), n_classes or 2
+
+    low = min(y_true.min(), y_pred.min())
+    high = max(y_true.max(), y_pred.max())
+    if n_classes is None:
+        n_classes = max(int(high) + 1, 2)
+    if low < 0 or high >= n_classes:
+        raise ValueError(f"Labels must be in [0, {n_classes}), got [{low}, {high}]")
+
+    codes = np.multiply(y_true, n_classes, dtype=np.intp)
+    np.add(codes, y_pred, out=codes, casting="unsafe")
+    return codes, n_classes
+
+
+def _as_labels(y: np.ndarray) -> np.ndarray:
+    """
+    Array de etiquetas enteras (ver _integer_labels).
+
+    Raises:
+        TypeError: Si las etiquetas no son enteras (str, float con decimales...):
+            convertirlas truncaría 0.2 y 0.3 a la misma clase.
+    """
+    labels = _integer_labels(y)
+    if labels is None:
+        raise TypeError(
+            f"Labels must be integers, bool or whole-number floats, got dtype {np.asarray(y).dtype}"
+        )
+    return labels
+
+
+def _integer_labels(y: np.ndarray) -> np.ndarray | None:
+    """
+    Etiquetas como enteros, o None si no lo son.
+
+    bool y enteros se usan tal cual, sin copia; los float sin decimales
+    (0.0, 1.0...) se convierten a intp.
+    """
+    y = np.asarray(y)
+    if y.dtype.kind in "biu":
+        return y
+    if y.dtype.kind == "f" and np.all(np.isfinite(y) & (y == np.round(y))):
+        return y.astype(np.intp)
+    return None
+
+
+def _binary_counts(cm: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(tn, fp, fn, tp) de una matriz binaria 2x2, o de cada matriz de una pila (..., 2, 2)."""
+    if cm.shape[-2:] != (2, 2):
+        raise ValueError(f"Binary metric needs a 2x2 confusion matrix, got {cm.shape}")
+    cm = np.asarray(cm, dtype=np.float64)
+    return cm[..., 0, 0], cm[..., 0, 1], cm[..., 1, 0], cm[..., 1, 1]
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> float | np.ndarray:
+    """numerator / denominator, con 0.0 donde denominator es 0; float si son escalares."""
+    result = np.divide(
+        numerator, denominator, out=np.zeros(np.shape(denominator)), where=denominator > 0
     )
+    return float(result) if result.ndim == 0 else result
+
+
+# Las métricas *_from_confusion aceptan UNA matriz (devuelven float) o una pila
+# (..., K, K) de matrices (devuelven un array con un valor por matriz): así el
+# bootstrap o la evaluación por grupos calculan todas las réplicas a la vez.
+
+
+def accuracy_from_confusion(cm: np.ndarray) -> float | np.ndarray:
+    """Accuracy a partir de una matriz de confusión (binaria o multiclase)."""
+    return _ratio(np.trace(cm, axis1=-2, axis2=-1), cm.sum(axis=(-2, -1)))
+
+
+def precision_from_confusion(cm: np.ndarray) -> float | np.ndarray:
+    """Precision de la clase 1 a partir de la matriz de confusión binaria."""
+    _, fp, _, tp = _binary_counts(cm)
+    return _ratio(tp, tp + fp)
+
+
+def recall_from_confusion(cm: np.ndarray) -> float | np.ndarray:
+    """Recall de la clase 1 a partir de la matriz de confusión binaria."""
+    _, _, fn, tp = _binary_counts(cm)
+    return _ratio(tp, tp + fn)
+
+
+def f1_from_confusion(cm: np.ndarray) -> float | np.ndarray:
+    """F1 de la clase 1 a partir de la matriz de confusión binaria: 2tp / (2tp + fp + fn)."""
+    _, fp, fn, tp = _binary_counts(cm)
+    return _ratio(2 * tp, 2 * tp + fp + fn)
+
+
+def mcc_from_confusion(cm: np.ndarray) -> float | np.ndarray:
+    """
+    Matthews correlation coefficient a partir de la matriz de confusión binaria.
+
+    Devuelve -1.0 a 1.0; 0.0 si alguna fila o columna de la matriz está vacía.
+    """
+    tn, fp, fn, tp = _binary_counts(cm)
+    denominator = (tp + fp) * (tp + fn) * (tn + fp) * (tn + fn)
+    return _ratio(tp * tn - fp * fn, np.sqrt(denominator))
 
 
 def auc_roc(y_true: np.ndarray, y_proba: np.ndarray) -> float:
-    """AUC-ROC simplificado. Devuelve 0.0 a 1.0."""
-    # Ordena por probabilidad descendente y calcula TPR/FPR
-    order = np.argsort(-y_proba)
-    y_sorted = y_true[order]
-    tps = np.cumsum(y_sorted)
-    fps = np.cumsum(1 - y_sorted)
-    tpr = tps / tps[-1] if tps[-1] > 0 else tps
-    fpr = fps / fps[-1] if fps[-1] > 0 else fps
-    return float(np.trapz(tpr, fpr))
+    """
+    AUC-ROC por rangos (estadístico U de Mann-Whitney). Devuelve 0.0 a 1.0.
+
+    AUC = P(score de un positivo > score de un negativo), contando los
+    empates como 1/2: los scores empatados reciben su rango medio. Un solo
+    argsort, sin construir la curva ROC ni integrarla. Si no hay positivos o
+    no hay negativos, devuelve 0.0.
+    """
+    y_true = np.asarray(y_true)
+    y_proba = np.asarray(y_proba)
+    order = np.argsort(y_proba)
+    scores = y_proba[order]
+    positives = y_true[order] == 1
+    del order
+
+    n = positives.size
+    n_pos = int(np.count_nonzero(positives))
+    n_neg = n - n_pos
+    if n_pos == 0 or n_neg == 0:
+        return 0.0
+
+    # Suma de rangos (base 1) de los positivos, multiplicada por 2 para seguir en enteros
+    changes = scores[1:] != scores[:-1]
+    if np.count_nonzero(changes) == n - 1:
+        # Sin empates: el rango es la posición en el orden
+        twice_rank_sum = 2 * (int(np.flatnonzero(positives).sum()) + n_pos)
+    else:
+        starts = np.flatnonzero(np.concatenate(([True], changes)))
+        ends = np.append(starts[1:], n)
+        pos_per_group = np.add.reduceat(positives, starts, dtype=np.int64)
+        # rango medio del grupo = (start + 1 + end) / 2
+        twice_rank_sum = int(np.dot(pos_per_group, starts + ends + 1))
+
+    u_statistic = (twice_rank_sum - n_pos * (n_pos + 1)) / 2
+    return u_statistic / (n_pos * n_neg)
+
+
+def midranks(scores: np.ndarray) -> np.ndarray:
+    """
+    Rango medio (base 1) de cada valor dentro de su columna.
+
+    Los empates reciben la media de los rangos que ocupan. Acepta un vector
+    o una matriz (n, columnas): las columnas se copian UNA vez a filas
+    contiguas y se ordenan con un solo np.argsort.
+    """
+    rows = np.ascontiguousarray(np.moveaxis(np.asarray(scores), 0, -1))
+    order = np.argsort(rows, axis=-1)
+    ranks = np.empty(rows.shape, dtype=np.float64)
+    np.put_along_axis(ranks, order, _sorted_midranks(np.take_along_axis(rows, order, -1)), -1)
+    return np.moveaxis(ranks, -1, 0)
+
+
+def _sorted_midranks(ordered: np.ndarray) -> np.ndarray:
+    """Rango medio de cada posición de filas ya ordenadas (último eje)."""
+    n = ordered.shape[-1]
+    positions = np.arange(n)
+    starts_group = np.ones(ordered.shape, dtype=bool)
+    np.not_equal(ordered[..., 1:], ordered[..., :-1], out=starts_group[..., 1:])
+    if starts_group.all():
+        # Sin empates: el rango es la posición en el orden
+        return np.broadcast_to(positions + 1.0, ordered.shape)
+    ends_group = np.ones(ordered.shape, dtype=bool)
+    ends_group[..., :-1] = starts_group[..., 1:]
+
+    # Primera y última posición del grupo de empate de cada elemento
+    first = np.maximum.accumulate(np.where(starts_group, positions, 0), axis=-1)
+    last = np.where(ends_group, positions, n - 1)[..., ::-1]
+    last = np.minimum.accumulate(last, axis=-1)[..., ::-1]
+    return (first + last) / 2 + 1
+
+
+def auc_roc_columns(y_true: np.ndarray, y_proba: np.ndarray) -> np.ndarray:
+    """
+    AUC-ROC de cada columna de y_proba (n, modelos) frente al mismo y_true.
+
+    Misma definición que auc_roc() (empates = 1/2). Las columnas se ordenan
+    con un solo np.argsort y se suman los rangos de los positivos en el
+    orden ya calculado, sin devolver los rangos a su posición original.
+
+    Returns:
+        Array con un AUC por columna (0.0 si falta una de las dos clases).
+    """
+    positives = np.asarray(y_true) == 1
+    n_pos = int(np.count_nonzero(positives))
+    n_neg = positives.size - n_pos
+    rows = np.ascontiguousarray(np.asarray(y_proba).T)
+    if n_pos == 0 or n_neg == 0:
+        return np.zeros(rows.shape[0])
+    order = np.argsort(rows, axis=1)
+    sorted_ranks = _sorted_midranks(np.take_along_axis(rows, order, 1))
+    rank_sums = np.where(positives[order], sorted_ranks, 0.0).sum(axis=1)
+    return (rank_sums - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)
+
+
+def auc_roc_resampled(
+    y_true: np.ndarray, y_proba: np.ndarray, indices: np.ndarray
+) -> np.ndarray:
+    """
+    AUC-ROC de muchas réplicas bootstrap con UN argsort y UN np.bincount.
+
+    indices es una matriz (réplicas, n): la réplica r está formada por las
+    muestras indices[r]. El orden por score no cambia entre réplicas, así que
+    se ordena una vez y cada muestra recibe un código es_positivo*G + grupo
+    (grupo = su bloque de scores empatados, G = número de grupos). Un bincount
+    de los códigos remuestreados da, por réplica, negativos y positivos de
+    cada grupo; de ahí sale el AUC igual que en auc_roc().
+
+    Returns:
+        Array con un AUC por réplica (0.0 si a la réplica le falta una clase).
+    """
+    y_proba = np.asarray(y_proba)
+    order = np.argsort(y_proba)
+    scores = y_proba[order]
+    group_starts = np.concatenate(([True], scores[1:] != scores[:-1]))
+    n_groups = int(np.count_nonzero(group_starts))
+    codes = np.empty(order.size, dtype=np.intp)
+    codes[order] = np.cumsum(group_starts) - 1
+    codes += (np.asarray(y_true) == 1) * n_groups
+
+    n_resamples = indices.shape[0]
+    offsets = np.arange(n_resamples, dtype=np.intp)[:, None] * (2 * n_groups)
+    resampled = codes[indices]
+    resampled += offsets
+    counts = np.bincount(resampled.ravel(), minlength=n_resamples * 2 * n_groups)
+    counts = counts.reshape(n_resamples, 2, n_groups)
+    negatives = counts[:, 0]
+    positives = counts[:, 1]
+
+    # Por grupo: 2 * (negativos por debajo) + negativos empatados, en enteros
+    twice_wins = np.cumsum(negatives, axis=1)
+    twice_wins *= 2
+    twice_wins -= negatives
+    wins = np.einsum("rg,rg->r", positives, twice_wins) / 2
+    pairs = positives.sum(axis=1) * negatives.sum(axis=1)
+    return np.divide(wins, pairs, out=np.zeros_like(wins), where=pairs > 0)
+
+
+F1_AVERAGES = ("macro", "micro", "weighted")
+
+# Entradas máximas de los temporales (filas × clases) de un bloque de top_k_accuracy()
+_MAX_BLOCK_ENTRIES = 1 << 23
+
+
+def f1_multiclass(
+    y_true: np.ndarray, y_pred: np.ndarray, average: str = "macro", n_classes: int | None = None
+) -> float:
+    """
+    F1 multiclase promediado ("macro", "micro" o "weighted"). Devuelve 0.0 a 1.0.
+
+    Sale de la matriz de confusión K×K (un np.bincount), sin bucles por clase.
+    """
+    return float(
+        f1_multiclass_from_confusion(confusion_matrix(y_true, y_pred, n_classes), average)
+    )
+
+
+def f1_multiclass_from_confusion(cm: np.ndarray, average: str = "macro") -> float | np.ndarray:
+    """
+    F1 promediado a partir de una matriz de confusión K×K (también 2×2).
+
+    - macro: media del F1 de cada clase, sin pesos.
+    - micro: F1 de los tp/fp/fn sumados (en multiclase coincide con accuracy).
+    - weighted: media del F1 de cada clase ponderada por su soporte.
+
+    Las clases que no aparecen ni en y_true ni en y_pred no cuentan en macro.
+
+    Raises:
+        ValueError: Si average no es uno de F1_AVERAGES.
+    """
+    tp = np.diagonal(cm, axis1=-2, axis2=-1).astype(np.float64)
+    fp = cm.sum(axis=-2) - tp
+    fn = cm.sum(axis=-1) - tp
+    return _average_f1(tp, fp, fn, average)
+
+
+def f1_multilabel(y_true: np.ndarray, y_pred: np.ndarray, average: str = "macro") -> float:
+    """
+    F1 multietiqueta promediado. y_true e y_pred son matrices (n, etiquetas) de 0/1.
+
+    tp, fp y fn de todas las etiquetas salen de tres conteos por columna;
+    average como en f1_multiclass_from_confusion().
+
+    Raises:
+        ValueError: Si las matrices tienen distinta forma o average no es válido.
+    """
+    y_true = np.asarray(y_true) != 0
+    y_pred = np.asarray(y_pred) != 0
+    if y_true.shape != y_pred.shape or y_true.ndim != 2:
+        raise ValueError(
+            f"Expected two (n, labels) matrices, got {y_true.shape} and {y_pred.shape}"
+        )
+    tp = np.count_nonzero(y_true & y_pred, axis=0).astype(np.float64)
+    fp = np.count_nonzero(y_pred, axis=0) - tp
+    fn = np.count_nonzero(y_true, axis=0) - tp
+    return float(_average_f1(tp, fp, fn, average))
+
+
+def _average_f1(
+    tp: np.ndarray, fp: np.ndarray, fn: np.ndarray, average: str
+) -> float | np.ndarray:
+    """Promedia el F1 por clase (2tp / (2tp + fp + fn), último eje) según average."""
+    if average == "micro":
+        return _ratio(2 * tp.sum(axis=-1), (2 * tp + fp + fn).sum(axis=-1))
+    if average not in F1_AVERAGES:
+        raise ValueError(f"average must be one of {F1_AVERAGES}, got {average!r}")
+    denominator = 2 * tp + fp + fn
+    present = denominator > 0
+    f1 = np.divide(2 * tp, denominator, out=np.zeros_like(tp), where=present)
+    if average == "macro":
+        return _ratio(f1.sum(axis=-1), present.sum(axis=-1))
+    support = tp + fn
+    return _ratio((f1 * support).sum(axis=-1), support.sum(axis=-1))
+
+
+def auc_roc_ovr(y_true: np.ndarray, y_proba: np.ndarray, average: str = "macro") -> float:
+    """
+    AUC-ROC uno-contra-resto, promediado ("macro" o "weighted" por prevalencia).
+
+    y_proba es (n, K). y_true es un vector de clases 0..K-1 (multiclase) o
+    una matriz (n, K) de 0/1 (multietiqueta). El AUC de cada clase sale de
+    un np.sort de su columna y searchsorted de sus positivos, que se agrupan
+    por clase UNA vez para todas. Las clases sin positivos o sin negativos no
+    tienen AUC y no entran en la media.
+
+    Returns:
+        AUC medio (0.0 si ninguna clase tiene AUC).
+
+    Raises:
+        ValueError: Si las formas no cuadran, hay clases fuera de [0, K) o
+            average no es "macro" ni "weighted".
+    """
+    if average not in ("macro", "weighted"):
+        raise ValueError(f"average must be 'macro' or 'weighted', got {average!r}")
+    aucs, n_pos = _auc_roc_per_class(y_true, np.asarray(y_proba))
+    valid = ~np.isnan(aucs)
+    if not valid.any():
+        return 0.0
+    if average == "macro":
+        return float(aucs[valid].mean())
+    return float(np.dot(aucs[valid], n_pos[valid]) / n_pos[valid].sum())
+
+
+def _auc_roc_per_class(y_true: np.ndarray, y_proba: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """AUC uno-contra-resto de cada clase (nan si no está definido) y positivos por clase."""
+    if y_proba.ndim != 2:
+        raise ValueError(f"y_proba must have shape (n, classes), got {y_proba.shape}")
+    n, n_classes = y_proba.shape
+    y_true = np.asarray(y_true)
+    if y_true.ndim == 2:
+        if y_true.shape != y_proba.shape:
+            raise ValueError(f"Shape mismatch: {y_true.shape} vs {y_proba.shape}")
+        labels = y_true != 0
+        n_pos = np.count_nonzero(labels, axis=0)
+        members = None
+    else:
+        labels = _check_class_labels(y_true, n, n_classes)
+        n_pos = np.bincount(labels, minlength=n_classes)
+        # Muestras agrupadas por clase: las de la clase c son members[starts[c]:][:n_pos[c]]
+        members = np.argsort(labels, kind="stable")
+        starts = np.cumsum(n_pos) - n_pos
+    n_neg = n - n_pos
+
+    aucs = np.full(n_classes, np.nan)
+    for c in np.flatnonzero((n_pos > 0) & (n_neg > 0)):
+        column = y_proba[:, c]
+        if members is None:
+            positive_scores = column[labels[:, c]]
+        else:
+            positive_scores = column[members[starts[c] : starts[c] + n_pos[c]]]
+        rank_sum = _positive_rank_sum(column, positive_scores)
+        aucs[c] = (rank_sum - n_pos[c] * (n_pos[c] + 1) / 2) / (n_pos[c] * n_neg[c])
+    return aucs, n_pos
+
+
+def _positive_rank_sum(scores: np.ndarray, positive_scores: np.ndarray) -> float:
+    """
+    Suma de los rangos medios (base 1) de positive_scores dentro de scores.
+
+    Sin argsort: se ordenan los valores (np.sort es varias veces más rápido)
+    y searchsorted cuenta, para cada positivo, los scores menores y los
+    menores o iguales; su rango medio es (menores + menores_o_iguales + 1) / 2.
+    Compensa cuando los positivos son pocos (uno-contra-resto con muchas
+    clases); ordenarlos también hace que las búsquedas recorran el array en
+    orden.
+    """
+    ordered = np.sort(scores)
+    queries = np.sort(positive_scores)
+    below = np.searchsorted(ordered, queries, side="left").sum(dtype=np.int64)
+    below_or_equal = np.searchsorted(ordered, queries, side="right").sum(dtype=np.int64)
+    return (int(below) + int(below_or_equal) + queries.size) / 2
+
+
+def top_k_accuracy(y_true: np.ndarray, y_proba: np.ndarray, k: int = 5) -> float:
+    """
+    Fracción de muestras cuya clase real está entre las k de mayor score.
+
+    No ordena las filas: la clase real está en el top-k si menos de k clases
+    tienen un score ESTRICTAMENTE mayor que el suyo (los empates cuentan a
+    favor). Una comparación por celda, por bloques de filas.
+
+    Raises:
+        ValueError: Si k < 1, y_proba no es (n, K) o hay clases fuera de [0, K).
+    """
+    if k < 1:
+        raise ValueError(f"k must be >= 1, got {k}")
+    y_proba = np.asarray(y_proba)
+    if y_proba.ndim != 2:
+        raise ValueError(f"y_proba must have shape (n, classes), got {y_proba.shape}")
+    n, n_classes = y_proba.shape
+    labels = _check_class_labels(np.asarray(y_true), n, n_classes)
+    if n == 0:
+        return 0.0
+
+    correct = 0
+    block = max(1, _MAX_BLOCK_ENTRIES // max(n_classes, 1))
+    for start in range(0, n, block):
+        chunk = y_proba[start : start + block]
+        chunk_labels = labels[start : start + block]
+        true_scores = chunk[np.arange(len(chunk)), chunk_labels]
+        higher = np.count_nonzero(chunk > true_scores[:, None], axis=1)
+        correct += int(np.count_nonzero(higher < k))
+    return correct / n
+
+
+def _check_class_labels(y_true: np.ndarray, n: int, n_classes: int) -> np.ndarray:
+    """Etiquetas enteras de longitud n y entre 0 y n_classes-1."""
+    labels = _as_labels(y_true)
+    if labels.shape != (n,):
+        raise ValueError(f"y_true must have shape ({n},), got {labels.shape}")
+    if n and (labels.min() < 0 or labels.max() >= n_classes):
+        raise ValueError(
+            f"Labels must be in [0, {n_classes}), got [{labels.min()}, {labels.max()}]"
+        )
+    return labels
 
 
 def rmse(y_true: np.ndarray, y_pred: np.ndarray) -> float:
@@ -44,3 +526,21 @@ def rmse(y_true: np.ndarray, y_pred: np.ndarray) -> float:
 def mae(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     """Mean Absolute Error. Devuelve >= 0."""
     return float(np.mean(np.abs(y_true - y_pred)))
+
+
+def r2_score(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """
+    Coeficiente de determinación R². Devuelve <= 1.0.
+
+    Si y_true es constante: 1.0 si las predicciones son perfectas, 0.0 si no.
+    """
+    ss_res = float(np.sum((y_true - y_pred) ** 2))
+    ss_tot = float(np.sum((y_true - np.mean(y_true)) ** 2))
+    if ss_tot == 0:
+        return 1.0 if ss_res == 0 else 0.0
+    return 1.0 - ss_res / ss_tot
+
+
+def max_error(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """Mayor error absoluto. Devuelve >= 0."""
+    return float(np.max(np.abs(y_true - y_pred)))
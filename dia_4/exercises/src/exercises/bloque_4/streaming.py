@@ -0,0 +1,260 @@
+"""
+Métricas en streaming para arrays que no caben en memoria.
+
+Un acumulador recibe los datos por trozos con update(), guarda solo un
+resumen de tamaño fijo y se puede combinar con otro con merge(): cada worker
+procesa sus shards y al final se suman los resúmenes.
+
+- BinnedAUCAccumulator: AUC-ROC aproximado con dos histogramas fijos (scores
+  de positivos y de negativos). Memoria O(n_bins) sea cual sea el número de
+  muestras.
+- RegressionAccumulator: sumas de error cuadrático y absoluto, error máximo
+  y media/varianza de y_true (para R²). Memoria O(1).
+- iter_chunks(): trocea arrays (también np.memmap / np.load(mmap_mode="r"))
+  sin copiarlos enteros.
+"""
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def iter_chunks(
+    *arrays: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[np.ndarray, ...]]:
+    """
+    Genera trozos alineados de varios arrays de la misma longitud.
+
+    Los trozos son vistas (slices): con un memmap solo se leen de disco las
+    páginas del trozo actual.
+
+    Raises:
+        ValueError: Si los arrays tienen longitudes distintas o chunk_size < 1.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    lengths = {len(array) for array in arrays}
+    if len(lengths) > 1:
+        raise ValueError(f"All arrays must have the same length, got {sorted(lengths)}")
+    total = lengths.pop() if lengths else 0
+    for start in range(0, total, chunk_size):
+        yield tuple(array[start : start + chunk_size] for array in arrays)
+
+
+class BinnedAUCAccumulator:
+    """
+    AUC-ROC aproximado en streaming con histogramas mergeables.
+
+    Los scores se reparten en n_bins intervalos iguales entre low y high (los
+    que caen fuera van al primer/último intervalo). Por cada intervalo se
+    cuentan positivos y negativos con UN np.bincount por trozo.
+
+    El AUC se calcula como en auc_roc() (empates = 1/2), pero tratando como
+    empatados todos los scores del mismo intervalo. El error es como mucho la
+    mitad de la fracción de pares (positivo, negativo) que comparten
+    intervalo; con scores continuos y n_bins grandes es despreciable.
+    """
+
+    def __init__(self, n_bins: int = 10_000, low: float = 0.0, high: float = 1.0) -> None:
+        """
+        Raises:
+            ValueError: Si n_bins < 1 o high <= low.
+        """
+        if n_bins < 1:
+            raise ValueError(f"n_bins must be >= 1, got {n_bins}")
+        if high <= low:
+            raise ValueError(f"high must be greater than low, got [{low}, {high}]")
+        self.n_bins = n_bins
+        self.low = low
+        self.high = high
+        # counts[b, 0] = negativos en el intervalo b, counts[b, 1] = positivos
+        self.counts = np.zeros((n_bins, 2), dtype=np.int64)
+
+    @property
+    def n_samples(self) -> int:
+        """Número de muestras acumuladas."""
+        return int(self.counts.sum())
+
+    def update(self, y_true: np.ndarray, y_proba: np.ndarray) -> None:
+        """Añade un trozo de etiquetas (positivo = 1) y scores."""
+        y_proba = np.asarray(y_proba)
+        scale = self.n_bins / (self.high - self.low)
+        bins = ((y_proba - self.low) * scale).astype(np.intp)
+        np.clip(bins, 0, self.n_bins - 1, out=bins)
+        bins *= 2
+        bins += np.asarray(y_true) == 1
+        self.counts += np.bincount(bins, minlength=2 * self.n_bins).reshape(self.n_bins, 2)
+
+    def update_chunked(
+        self, y_true: np.ndarray, y_proba: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """update() por trozos: los temporales ocupan O(chunk_size), no O(len)."""
+        for true_chunk, proba_chunk in iter_chunks(y_true, y_proba, chunk_size=chunk_size):
+            self.update(true_chunk, proba_chunk)
+
+    def merge(self, other: "BinnedAUCAccumulator") -> None:
+        """
+        Suma los histogramas de otro acumulador con los mismos intervalos.
+
+        Raises:
+            ValueError: Si los intervalos (n_bins, low, high) no coinciden.
+        """
+        if (other.n_bins, other.low, other.high) != (self.n_bins, self.low, self.high):
+            raise ValueError("Cannot merge accumulators with different bins")
+        self.counts += other.counts
+
+    def auc(self) -> float:
+        """AUC-ROC aproximado. 0.0 si no hay positivos o no hay negativos."""
+        negatives = self.counts[:, 0].astype(np.float64)
+        positives = self.counts[:, 1].astype(np.float64)
+        n_neg = negatives.sum()
+        n_pos = positives.sum()
+        if n_pos == 0 or n_neg == 0:
+            return 0.0
+        negatives_below = np.cumsum(negatives) - negatives
+        wins = np.dot(positives, negatives_below) + 0.5 * np.dot(positives, negatives)
+        return float(wins / (n_pos * n_neg))
+
+
+def binned_auc(
+    chunks: Iterable[tuple[np.ndarray, np.ndarray]],
+    n_bins: int = 10_000,
+    low: float = 0.0,
+    high: float = 1.0,
+) -> float:
+    """AUC-ROC aproximado de un flujo de trozos (y_true, y_proba)."""
+    accumulator = BinnedAUCAccumulator(n_bins=n_bins, low=low, high=high)
+    for y_true, y_proba in chunks:
+        accumulator.update(y_true, y_proba)
+    return accumulator.auc()
+
+
+class RegressionAccumulator:
+    """
+    Resumen mergeable de un problema de regresión.
+
+    Guarda count, suma de errores al cuadrado, suma de errores absolutos,
+    error absoluto máximo, y media y M2 (suma de desviaciones al cuadrado) de
+    y_true. De ahí salen rmse, mae, max_error y R² sin volver a ver los datos.
+
+    La media y M2 se combinan con la fórmula de Chan et al. (en vez de
+    acumular sum(y) y sum(y**2)), que no pierde precisión cuando la varianza
+    es pequeña frente a la media. Todo se acumula en float64, aunque los
+    arrays sean float32.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum_squared_error = 0.0
+        self.sum_absolute_error = 0.0
+        self.max_absolute_error = 0.0
+        self.mean_true = 0.0
+        self.m2_true = 0.0
+
+    @classmethod
+    def from_npy(
+        cls,
+        y_true_path: str | Path,
+        y_pred_path: str | Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "RegressionAccumulator":
+        """Acumula dos ficheros .npy abiertos con mmap, trozo a trozo."""
+        accumulator = cls()
+        accumulator.update_chunked(
+            np.load(y_true_path, mmap_mode="r"),
+            np.load(y_pred_path, mmap_mode="r"),
+            chunk_size=chunk_size,
+        )
+        return accumulator
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        """
+        Añade un trozo de valores reales y predichos.
+
+        Raises:
+            ValueError: Si los arrays tienen distinta forma.
+        """
+        y_true = np.asarray(y_true, dtype=np.float64)
+        error = np.subtract(y_pred, y_true, dtype=np.float64)
+        if error.shape != y_true.shape:
+            raise ValueError(f"Shape mismatch: {y_true.shape} vs {np.shape(y_pred)}")
+        if error.size == 0:
+            return
+        error = error.ravel()
+        chunk_squared = float(np.dot(error, error))
+        np.abs(error, out=error)
+        chunk_absolute = float(error.sum())
+        chunk_max = float(error.max())
+
+        chunk_mean = float(y_true.mean())
+        deviation = y_true.ravel() - chunk_mean
+        chunk_m2 = float(np.dot(deviation, deviation))
+
+        self._combine(
+            error.size, chunk_squared, chunk_absolute, chunk_max, chunk_mean, chunk_m2
+        )
+
+    def update_chunked(
+        self, y_true: np.ndarray, y_pred: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """update() por trozos: los temporales ocupan O(chunk_size), no O(len)."""
+        for true_chunk, pred_chunk in iter_chunks(y_true, y_pred, chunk_size=chunk_size):
+            self.update(true_chunk, pred_chunk)
+
+    def merge(self, other: "RegressionAccumulator") -> None:
+        """Suma el resumen de otro acumulador (p. ej. de otro worker o shard)."""
+        self._combine(
+            other.count,
+            other.sum_squared_error,
+            other.sum_absolute_error,
+            other.max_absolute_error,
+            other.mean_true,
+            other.m2_true,
+        )
+
+    def rmse(self) -> float:
+        """Root Mean Squared Error (0.0 si no hay datos)."""
+        return (self.sum_squared_error / self.count) ** 0.5 if self.count else 0.0
+
+    def mae(self) -> float:
+        """Mean Absolute Error (0.0 si no hay datos)."""
+        return self.sum_absolute_error / self.count if self.count else 0.0
+
+    def max_error(self) -> float:
+        """Mayor error absoluto visto."""
+        return self.max_absolute_error
+
+    def r2(self) -> float:
+        """
+        Coeficiente de determinación R² = 1 - SS_res / SS_tot.
+
+        Si y_true es constante (SS_tot = 0): 1.0 si las predicciones son
+        perfectas y 0.0 si no.
+        """
+        if self.m2_true == 0:
+            return 1.0 if self.sum_squared_error == 0 else 0.0
+        return 1.0 - self.sum_squared_error / self.m2_true
+
+    def _combine(
+        self,
+        count: int,
+        sum_squared_error: float,
+        sum_absolute_error: float,
+        max_absolute_error: float,
+        mean_true: float,
+        m2_true: float,
+    ) -> None:
+        """Combina otro resumen con este (fórmula de Chan para media y M2)."""
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean_true - self.mean_true
+        self.m2_true += m2_true + delta * delta * self.count * count / total
+        self.mean_true += delta * count / total
+        self.count = total
+        self.sum_squared_error += sum_squared_error
+        self.sum_absolute_error += sum_absolute_error
+        self.max_absolute_error = max(self.max_absolute_error, max_absolute_error)
@@ -2,14 +2,18 @@
 
 import pytest
 
+from exercises.bloque_2.capabilities import FusableTokenFilter
 from exercises.bloque_2.preprocessing import (
+    FusedFilterStep,
     LowercaseNormalizer,
     MinLengthFilter,
     PreprocessingResult,
     RegexTokenizer,
+    ScannerTokenizer,
     StopwordFilter,
     TextPreprocessingPipeline,
     WhitespaceTokenizer,
+    compile_filter_steps,
 )
 
 
@@ -41,10 +45,10 @@ def test_whitespace_tokenizer():
 
 
 def test_whitespace_tokenizer_empty_string():
-    """Test WhitespaceTokenizer handles empty string."""
+    """Test WhitespaceTokenizer returns no tokens for an empty string."""
     tokenizer = WhitespaceTokenizer()
     result = tokenizer.tokenize("")
-    assert result == [""]
+    assert result == []
 
 
 # ============================================================================
@@ -64,6 +68,34 @@ def test_regex_tokenizer_with_whitespace_pattern():
     assert result == ["hello", "world", "foo"]
 
 
+def test_regex_tokenizer_tokenize_iter_matches_tokenize():
+    """Test RegexTokenizer lazy mode yields the same tokens as tokenize."""
+    tokenizer = RegexTokenizer(pattern=r"[,\s]+")
+    text = ", hello,  world,,foo "
+
+    lazy = tokenizer.tokenize_iter(text)
+
+    assert not isinstance(lazy, list)
+    assert list(lazy) == tokenizer.tokenize(text) == ["hello", "world", "foo"]
+
+
+# ============================================================================
+# TESTS: ScannerTokenizer
+# ============================================================================
+def test_scanner_tokenizer_extracts_word_tokens():
+    """Test ScannerTokenizer keeps words and drops punctuation."""
+    tokenizer = ScannerTokenizer()
+    result = tokenizer.tokenize("hello, world! this is a test.")
+    assert result == ["hello", "world", "this", "is", "a", "test"]
+
+
+def test_scanner_tokenizer_custom_pattern_with_groups():
+    """Test ScannerTokenizer returns whole matches even if the pattern has groups."""
+    tokenizer = ScannerTokenizer(token_pattern=r"(#)?\w+")
+    assert tokenizer.tokenize("#ai rocks") == ["#ai", "rocks"]
+    assert list(tokenizer.tokenize_iter("#ai rocks")) == ["#ai", "rocks"]
+
+
 # ============================================================================
 # TESTS: StopwordFilter
 # ============================================================================
@@ -215,3 +247,165 @@ def test_components_have_no_shared_state():
 
     assert result1.original_text != result2.original_text
     assert result1.tokens != result2.tokens
+
+
+# ============================================================================
+# TESTS: TextPreprocessingPipeline.process_many
+# ============================================================================
+def test_process_many_matches_process(common_stopwords):
+    """Test process_many yields the same results as process, in order."""
+    pipeline = TextPreprocessingPipeline(
+        normalizer=LowercaseNormalizer(),
+        tokenizer=WhitespaceTokenizer(),
+        filters=[StopwordFilter(stopwords=common_stopwords), MinLengthFilter()],
+    )
+    texts = ["The cat is big", "  A DOG in the park ", "Hello world"]
+
+    results = list(pipeline.process_many(texts))
+
+    assert results == [pipeline.process(text) for text in texts]
+
+
+def test_process_many_is_lazy():
+    """Test process_many consumes the input only as results are requested."""
+    pipeline = TextPreprocessingPipeline(
+        normalizer=LowercaseNormalizer(), tokenizer=WhitespaceTokenizer(), filters=[]
+    )
+    consumed = []
+
+    def texts():
+        for text in ["first text", "second text"]:
+            consumed.append(text)
+            yield text
+
+    results = pipeline.process_many(texts())
+    assert consumed == []
+
+    first = next(results)
+    assert first.tokens == ["first", "text"]
+    assert consumed == ["first text"]
+
+
+def test_process_many_can_drop_intermediate_tokens(common_stopwords):
+    """Test keep_tokens=False keeps only filtered_tokens."""
+    pipeline = TextPreprocessingPipeline(
+        normalizer=LowercaseNormalizer(),
+        tokenizer=WhitespaceTokenizer(),
+        filters=[StopwordFilter(stopwords=common_stopwords)],
+    )
+
+    (result,) = pipeline.process_many(["The cat is big"], keep_tokens=False)
+
+    assert result.tokens == []
+    assert result.filtered_tokens == ["cat", "big"]
+
+
+# ============================================================================
+# TESTS: TextPreprocessingPipeline.process_parallel
+# ============================================================================
+def test_process_parallel_preserves_input_order(common_stopwords):
+    """Test process_parallel yields the same results as serial mode, in order."""
+    pipeline = TextPreprocessingPipeline(
+        normalizer=LowercaseNormalizer(),
+        tokenizer=WhitespaceTokenizer(),
+        filters=[StopwordFilter(stopwords=common_stopwords)],
+    )
+    texts = [f"The review number {i} is GOOD" for i in range(50)]
+
+    results = list(pipeline.process_parallel(texts, max_workers=2, chunk_size=7))
+
+    assert results == list(pipeline.process_many(texts))
+
+
+def test_process_parallel_rejects_unpicklable_components():
+    """Test process_parallel fails fast when a component cannot be pickled."""
+
+    class LocalNormalizer:
+        def normalize(self, text: str) -> str:
+            return text
+
+    pipeline = TextPreprocessingPipeline(
+        normalizer=LocalNormalizer(), tokenizer=WhitespaceTokenizer(), filters=[]
+    )
+
+    with pytest.raises(TypeError, match="picklable"):
+        list(pipeline.process_parallel(["some text"], max_workers=1))
+
+
+def test_process_parallel_rejects_invalid_chunk_size():
+    """Test process_parallel validates chunk_size."""
+    pipeline = TextPreprocessingPipeline(
+        normalizer=LowercaseNormalizer(), tokenizer=WhitespaceTokenizer(), filters=[]
+    )
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        list(pipeline.process_parallel(["some text"], chunk_size=0))
+
+
+# ============================================================================
+# TESTS: Fused filter chain
+# ============================================================================
+def test_builtin_filters_are_fusable(common_stopwords):
+    """Test StopwordFilter and MinLengthFilter support lazy filtering."""
+    assert isinstance(StopwordFilter(stopwords=common_stopwords), FusableTokenFilter)
+    assert isinstance(MinLengthFilter(), FusableTokenFilter)
+
+
+def test_compile_filter_steps_fuses_consecutive_filters(common_stopwords):
+    """Test consecutive fusable filters become one step with the same output."""
+    filters = [StopwordFilter(stopwords=common_stopwords), MinLengthFilter(min_length=4)]
+    tokens = ["the", "cat", "is", "a", "big", "animal"]
+
+    steps = compile_filter_steps(filters, fuse=True)
+
+    assert len(steps) == 1
+    assert isinstance(steps[0], FusedFilterStep)
+    assert steps[0](tokens) == ["animal"]
+
+
+def test_compile_filter_steps_does_not_fuse_by_default(common_stopwords):
+    """Test filters run one by one unless fusion is requested."""
+    filters = [StopwordFilter(stopwords=common_stopwords), MinLengthFilter(min_length=4)]
+
+    steps = compile_filter_steps(filters)
+
+    assert len(steps) == 2
+    assert not any(isinstance(step, FusedFilterStep) for step in steps)
+
+
+def test_fused_filter_step_with_three_filters(common_stopwords):
+    """Test a fused run of three filters keeps only tokens every filter keeps."""
+    step = FusedFilterStep(
+        [
+            StopwordFilter(stopwords=common_stopwords),
+            MinLengthFilter(min_length=3),
+            StopwordFilter(stopwords={"dog"}),
+        ]
+    )
+
+    assert step(["the", "cat", "a", "dog", "animal"]) == ["cat", "animal"]
+
+
+def test_compile_filter_steps_keeps_order_with_non_fusable_filter(common_stopwords):
+    """Test a non-fusable filter splits the fused runs and keeps its position."""
+    class DropFirstFilter:
+        def filter_tokens(self, tokens: list[str]) -> list[str]:
+            return tokens[1:]
+
+    filters = [
+        StopwordFilter(stopwords=common_stopwords),
+        DropFirstFilter(),
+        MinLengthFilter(min_length=2),
+    ]
+    pipeline = TextPreprocessingPipeline(
+        normalizer=LowercaseNormalizer(),
+        tokenizer=WhitespaceTokenizer(),
+        filters=filters,
+        fuse_filters=True,
+    )
+
+    result = pipeline.process("the cat is a big x")
+
+    assert len(compile_filter_steps(filters, fuse=True)) == 3
+    # Stopwords → ["cat", "big", "x"], drop first → ["big", "x"], min length → ["big"]
+    assert result.filtered_tokens == ["big"]
@@ -0,0 +1,94 @@
+"""Tests para la instrumentación por etapa del Bloque 2."""
+
+import pytest
+
+from exercises.bloque_2.preprocessing import (
+    LowercaseNormalizer,
+    MinLengthFilter,
+    StopwordFilter,
+    TextPreprocessingPipeline,
+    WhitespaceTokenizer,
+)
+from exercises.bloque_2.profiling import PipelineProfiler
+
+
+class UpperFilter:
+    """Non-fusable filter used to get a separate stage."""
+
+    def filter_tokens(self, tokens: list[str]) -> list[str]:
+        return [token.upper() for token in tokens]
+
+
+@pytest.fixture
+def profiled_pipeline(common_stopwords):
+    """Pipeline with a fused filter run, a plain filter and a profiler."""
+    profiler = PipelineProfiler()
+    pipeline = TextPreprocessingPipeline(
+        normalizer=LowercaseNormalizer(),
+        tokenizer=WhitespaceTokenizer(),
+        filters=[
+            StopwordFilter(stopwords=common_stopwords),
+            MinLengthFilter(min_length=3),
+            UpperFilter(),
+        ],
+        profiler=profiler,
+        fuse_filters=True,
+    )
+    return pipeline, profiler
+
+
+def test_profiler_records_calls_and_tokens_per_stage(profiled_pipeline):
+    """Test each stage accumulates calls and token counts."""
+    pipeline, profiler = profiled_pipeline
+
+    pipeline.process("The cat is a big animal")
+    list(pipeline.process_many(["A dog", "The end"]))
+
+    stats = profiler.to_dict()
+    assert list(stats) == ["normalize", "tokenize", "StopwordFilter+MinLengthFilter", "UpperFilter"]
+    assert stats["normalize"]["calls"] == 3
+    assert stats["tokenize"]["tokens_out"] == 6 + 2 + 2
+    fused = stats["StopwordFilter+MinLengthFilter"]
+    assert (fused["tokens_in"], fused["tokens_out"]) == (10, 5)
+    assert all(stage["seconds"] >= 0.0 for stage in stats.values())
+
+
+def test_profiled_results_match_unprofiled(profiled_pipeline, common_stopwords):
+    """Test profiling does not change the results."""
+    pipeline, _ = profiled_pipeline
+    plain = TextPreprocessingPipeline(
+        normalizer=LowercaseNormalizer(),
+        tokenizer=WhitespaceTokenizer(),
+        filters=[
+            StopwordFilter(stopwords=common_stopwords),
+            MinLengthFilter(min_length=3),
+            UpperFilter(),
+        ],
+    )
+
+    assert pipeline.process("The cat is a big animal") == plain.process(
+        "The cat is a big animal"
+    )
+
+
+def test_profiler_prometheus_export(profiled_pipeline):
+    """Test the Prometheus text export contains typed counters per stage."""
+    pipeline, profiler = profiled_pipeline
+    pipeline.process("The cat")
+
+    text = profiler.to_prometheus()
+
+    assert "# TYPE text_pipeline_stage_calls_total counter" in text
+    assert 'text_pipeline_stage_calls_total{stage="tokenize"} 1' in text
+    assert 'text_pipeline_stage_tokens_out_total{stage="UpperFilter"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_profiler_reset_clears_stats(profiled_pipeline):
+    """Test reset removes all accumulated stats."""
+    pipeline, profiler = profiled_pipeline
+    pipeline.process("The cat")
+
+    profiler.reset()
+
+    assert profiler.to_dict() == {}
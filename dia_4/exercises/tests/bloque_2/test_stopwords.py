@@ -0,0 +1,71 @@
+"""Tests para el registro de stopwords compartido del Bloque 2."""
+
+import pytest
+
+from exercises.bloque_2.preprocessing import StopwordFilter
+from exercises.bloque_2.stopwords import (
+    CompactStopwordSet,
+    StopwordRegistry,
+    get_stopwords,
+)
+
+
+def test_get_stopwords_returns_shared_frozenset():
+    """Test every caller receives the same frozenset instance."""
+    first = get_stopwords("en")
+    second = get_stopwords("en")
+
+    assert isinstance(first, frozenset)
+    assert first is second
+    assert "the" in first
+
+
+def test_stopword_filter_for_language():
+    """Test StopwordFilter.for_language builds filters from the registry."""
+    first = StopwordFilter.for_language("es")
+    second = StopwordFilter.for_language("es")
+
+    assert first.filter_tokens(["el", "gato", "y", "la", "casa"]) == ["gato", "casa"]
+    assert second.filter_tokens(["el", "gato"]) == ["gato"]
+
+
+def test_registry_loads_file_lazily_and_once(tmp_path):
+    """Test register_file reads the file on first get and caches it."""
+    path = tmp_path / "fr.txt"
+    path.write_text("# French\nle\nla\n\nles\n", encoding="utf-8")
+    registry = StopwordRegistry()
+
+    registry.register_file("fr", path)
+    path.write_text("le\nla\nles\net\n", encoding="utf-8")
+    stopwords = registry.get("fr")
+    path.unlink()
+
+    assert stopwords == frozenset({"le", "la", "les", "et"})
+    assert registry.get("fr") is stopwords
+
+
+def test_registry_unknown_language_raises():
+    """Test get fails for a language that was never registered."""
+    registry = StopwordRegistry()
+
+    with pytest.raises(KeyError, match="xx"):
+        registry.get("xx")
+
+
+def test_compact_set_matches_frozenset_membership():
+    """Test CompactStopwordSet answers membership exactly like a frozenset."""
+    words = {f"word{i}" for i in range(0, 2000, 2)} | {"niño", "über", "東京"}
+    compact = CompactStopwordSet(words)
+    probes = [f"word{i}" for i in range(2000)] + ["niño", "nino", "東京", "", 42]
+
+    assert len(compact) == len(words)
+    assert set(compact) == words
+    assert [probe in compact for probe in probes] == [probe in words for probe in probes]
+
+
+def test_stopword_filter_with_compact_set():
+    """Test StopwordFilter works with the compact representation."""
+    stopword_filter = StopwordFilter.for_language("en", compact=True)
+
+    assert stopword_filter.filter_tokens(["the", "cat", "is", "big"]) == ["cat", "big"]
+    assert list(stopword_filter.filter_stream(["a", "dog"])) == ["dog"]
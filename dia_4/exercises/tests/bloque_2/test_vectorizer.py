@@ -0,0 +1,102 @@
+"""Tests para el vectorizador disperso del Bloque 2."""
+
+import numpy as np
+import pytest
+
+from exercises.bloque_2.preprocessing import PreprocessingResult
+from exercises.bloque_2.vectorizer import BagOfWordsVectorizer
+from exercises.bloque_2.vocabulary import Vocabulary
+
+
+def make_results(*documents: str) -> list[PreprocessingResult]:
+    """Build pipeline results whose filtered tokens are the given words."""
+    return [
+        PreprocessingResult(
+            original_text=document,
+            normalized_text=document,
+            tokens=document.split(),
+            filtered_tokens=document.split(),
+        )
+        for document in documents
+    ]
+
+
+def test_counts_match_dense_bag_of_words():
+    """Test the CSR matrix holds the term counts of each document."""
+    results = make_results("cat dog cat", "dog bird", "")
+    vectorizer = BagOfWordsVectorizer().partial_fit(results)
+
+    matrix = vectorizer.transform(results)
+
+    # Columns: cat=0, dog=1, bird=2
+    expected = np.array([[2, 1, 0], [0, 1, 1], [0, 0, 0]], dtype=float)
+    np.testing.assert_array_equal(matrix.to_dense(), expected)
+    np.testing.assert_array_equal(matrix.indptr, [0, 2, 4, 4])
+    assert matrix.nnz == 4
+
+
+def test_transform_ignores_unknown_tokens():
+    """Test tokens not seen in partial_fit are dropped in vocabulary mode."""
+    vectorizer = BagOfWordsVectorizer().partial_fit(make_results("cat dog"))
+
+    matrix = vectorizer.transform(make_results("cat fish fish"))
+
+    np.testing.assert_array_equal(matrix.to_dense(), [[1.0, 0.0]])
+
+
+def test_partial_fit_grows_shared_vocabulary():
+    """Test incremental partial_fit extends the shared vocabulary and df."""
+    vocabulary = Vocabulary()
+    vectorizer = BagOfWordsVectorizer(vocabulary=vocabulary, use_idf=True)
+
+    vectorizer.partial_fit(make_results("cat dog"))
+    vectorizer.partial_fit(make_results("cat bird"))
+
+    assert len(vocabulary) == 3
+    # cat in 2 of 2 docs → idf 1.0; dog and bird in 1 of 2 docs
+    np.testing.assert_allclose(vectorizer.idf, [1.0, np.log(3 / 2) + 1, np.log(3 / 2) + 1])
+
+
+def test_tfidf_with_l2_normalization():
+    """Test TF-IDF rows are weighted by idf and have unit norm."""
+    results = make_results("cat dog", "cat", "cat bird bird")
+    vectorizer = BagOfWordsVectorizer(use_idf=True, l2_normalize=True)
+    vectorizer.partial_fit(results)
+
+    dense = vectorizer.transform(results).to_dense()
+
+    np.testing.assert_allclose(np.linalg.norm(dense, axis=1), [1.0, 1.0, 1.0])
+    # In the first document dog (rarer) weighs more than cat
+    assert dense[0, 1] > dense[0, 0]
+
+
+def test_tfidf_requires_partial_fit():
+    """Test transform with use_idf fails before any partial_fit."""
+    vectorizer = BagOfWordsVectorizer(use_idf=True)
+
+    with pytest.raises(ValueError, match="partial_fit"):
+        vectorizer.transform(make_results("cat"))
+
+
+def test_hashing_mode_is_stable_and_has_no_vocabulary():
+    """Test hashing mode uses fixed columns and no vocabulary."""
+    results = make_results("cat dog cat", "dog")
+    first = BagOfWordsVectorizer(n_features=16)
+    second = BagOfWordsVectorizer(n_features=16)
+
+    matrix = first.transform(results)
+
+    assert first.vocabulary is None
+    assert matrix.shape == (2, 16)
+    np.testing.assert_array_equal(matrix.to_dense().sum(axis=1), [3.0, 1.0])
+    np.testing.assert_array_equal(matrix.indices, second.transform(results).indices)
+
+
+def test_transform_batches_splits_stream():
+    """Test transform_batches yields one matrix per batch."""
+    results = make_results("a b", "b c", "c d", "d e", "e")
+    vectorizer = BagOfWordsVectorizer(n_features=8)
+
+    shapes = [matrix.shape for matrix in vectorizer.transform_batches(results, batch_size=2)]
+
+    assert shapes == [(2, 8), (2, 8), (1, 8)]
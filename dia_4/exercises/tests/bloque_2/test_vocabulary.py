@@ -0,0 +1,81 @@
+"""Tests para el vocabulario compartido del Bloque 2."""
+
+from array import array
+
+import pytest
+
+from exercises.bloque_2.preprocessing import (
+    LowercaseNormalizer,
+    StopwordFilter,
+    TextPreprocessingPipeline,
+    WhitespaceTokenizer,
+)
+from exercises.bloque_2.vocabulary import UNKNOWN_ID, Vocabulary
+
+
+def test_encode_assigns_consecutive_ids():
+    """Test new tokens get consecutive ids and repeated tokens reuse them."""
+    vocab = Vocabulary()
+
+    ids = vocab.encode(["cat", "dog", "cat", "bird"])
+
+    assert ids == array("i", [0, 1, 0, 2])
+    assert len(vocab) == 3
+
+
+def test_encode_without_grow_uses_unknown_id():
+    """Test grow=False does not add tokens and maps them to UNKNOWN_ID."""
+    vocab = Vocabulary(["cat"])
+
+    ids = vocab.encode(["cat", "dog"], grow=False)
+
+    assert ids == array("i", [0, UNKNOWN_ID])
+    assert "dog" not in vocab
+
+
+def test_decode_returns_shared_token_instances():
+    """Test decode returns the vocabulary's canonical strings, not copies."""
+    vocab = Vocabulary()
+    # Built at run time, so each call gets a new, non-interned string
+    head = "c"
+    first = vocab.encode([f"{head}at"])
+    second = vocab.encode([f"{head}at"])
+
+    assert vocab.decode(first)[0] is vocab.decode(second)[0]
+
+
+def test_decode_unknown_id_raises():
+    """Test decode fails for ids outside the vocabulary."""
+    vocab = Vocabulary(["cat"])
+
+    with pytest.raises(IndexError):
+        vocab.decode([5])
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    """Test a saved vocabulary loads back with the same ids."""
+    vocab = Vocabulary(["niño", "cat", "dog"])
+    path = tmp_path / "vocab.json"
+
+    vocab.save(path)
+    loaded = Vocabulary.load(path)
+
+    assert len(loaded) == 3
+    assert loaded.token_id("niño") == vocab.token_id("niño")
+    assert loaded.decode([2, 1]) == ["dog", "cat"]
+
+
+def test_encode_many_with_pipeline_results(common_stopwords):
+    """Test the vocabulary encodes filtered tokens coming from the pipeline."""
+    pipeline = TextPreprocessingPipeline(
+        normalizer=LowercaseNormalizer(),
+        tokenizer=WhitespaceTokenizer(),
+        filters=[StopwordFilter(stopwords=common_stopwords)],
+    )
+    vocab = Vocabulary()
+    results = pipeline.process_many(["The cat is big", "A big dog"], keep_tokens=False)
+
+    encoded = list(vocab.encode_many(result.filtered_tokens for result in results))
+
+    assert encoded == [array("i", [0, 1]), array("i", [1, 2])]
+    assert vocab.decode(encoded[1]) == ["big", "dog"]
@@ -0,0 +1,131 @@
+"""Tests para la caché de scores del Bloque 3."""
+
+import pytest
+
+from exercises.bloque_3.caching import CachingSentimentAnalyzer, normalize_review_text
+from exercises.bloque_3.capabilities import BatchSentimentAnalyzer
+from exercises.bloque_3.scoring import (
+    InMemoryResultSaver,
+    InMemoryReviewLoader,
+    KeywordSentimentAnalyzer,
+    ScoringService,
+)
+
+
+class CountingAnalyzer:
+    """Fake analyzer that records every text it scores."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def analyze(self, text: str) -> float:
+        self.calls.append(text)
+        return len(text.split()) / 10
+
+
+def test_normalize_review_text_collapses_case_and_spaces():
+    """Test near-duplicate texts share the same normalized form."""
+    assert normalize_review_text("  Great   product!\n") == normalize_review_text("great product!")
+
+
+def test_analyze_caches_near_duplicates():
+    """Test the wrapped analyzer runs once per normalized text."""
+    inner = CountingAnalyzer()
+    cached = CachingSentimentAnalyzer(inner)
+
+    scores = [cached.analyze(t) for t in ["Great product", "great  product", "GREAT PRODUCT"]]
+
+    assert scores == [0.2, 0.2, 0.2]
+    assert inner.calls == ["Great product"]
+    assert cached.stats.hits == 2
+    assert cached.stats.misses == 1
+    assert cached.stats.hit_rate == pytest.approx(2 / 3)
+
+
+def test_analyze_batch_deduplicates_and_keeps_order():
+    """Test analyze_batch scores each new key once and returns one score per text."""
+    inner = CountingAnalyzer()
+    cached = CachingSentimentAnalyzer(inner)
+    cached.analyze("one")
+
+    scores = cached.analyze_batch(["one two", "one", "ONE TWO", "a b c"])
+
+    assert scores == [0.2, 0.1, 0.2, 0.3]
+    assert inner.calls == ["one", "one two", "a b c"]
+    assert isinstance(cached, BatchSentimentAnalyzer)
+
+
+def test_analyze_batch_uses_inner_batch_api(positive_words, negative_words):
+    """Test cached scores equal the wrapped keyword analyzer scores."""
+    inner = KeywordSentimentAnalyzer(positive_words, negative_words)
+    texts = ["Great product", "bad bad", "great   PRODUCT", "ok"]
+
+    assert CachingSentimentAnalyzer(inner).analyze_batch(texts) == inner.analyze_batch(texts)
+
+
+def test_lru_evicts_least_recently_used():
+    """Test the cache stays bounded and evicts the oldest unused entry."""
+    inner = CountingAnalyzer()
+    cached = CachingSentimentAnalyzer(inner, max_size=2)
+
+    cached.analyze("a")
+    cached.analyze("b")
+    cached.analyze("a")
+    cached.analyze("c")
+    cached.analyze("a")
+    cached.analyze("b")
+
+    assert inner.calls == ["a", "b", "c", "b"]
+    assert len(cached) == 2
+    assert cached.stats.evictions == 2
+
+
+def test_cache_persists_across_instances(tmp_path):
+    """Test save() writes the cache and a new wrapper reloads it."""
+    path = tmp_path / "scores.cache"
+    first = CachingSentimentAnalyzer(CountingAnalyzer(), path=path)
+    first.analyze_batch(["a", "b c", "d e f"])
+    first.save()
+
+    inner = CountingAnalyzer()
+    second = CachingSentimentAnalyzer(inner, path=path)
+
+    assert second.analyze_batch(["A", "B C", "d e f"]) == [0.1, 0.2, 0.3]
+    assert inner.calls == []
+
+
+def test_reload_keeps_most_recent_entries_when_smaller(tmp_path):
+    """Test loading into a smaller cache keeps the most recently used entries."""
+    path = tmp_path / "scores.cache"
+    first = CachingSentimentAnalyzer(CountingAnalyzer(), path=path)
+    for text in ["a", "b", "c", "a"]:
+        first.analyze(text)
+    first.save()
+
+    inner = CountingAnalyzer()
+    second = CachingSentimentAnalyzer(inner, max_size=2, path=path)
+    second.analyze_batch(["a", "c", "b"])
+
+    assert inner.calls == ["b"]
+
+
+def test_save_without_path_raises():
+    """Test save() needs a path."""
+    with pytest.raises(ValueError, match="path"):
+        CachingSentimentAnalyzer(CountingAnalyzer()).save()
+
+
+def test_scoring_service_with_cache(sample_reviews, positive_words, negative_words):
+    """Test the wrapper plugs into ScoringService like any analyzer."""
+    analyzer = CachingSentimentAnalyzer(KeywordSentimentAnalyzer(positive_words, negative_words))
+    service = ScoringService(
+        loader=InMemoryReviewLoader(reviews=sample_reviews + sample_reviews),
+        analyzer=analyzer,
+        saver=InMemoryResultSaver(),
+    )
+
+    results = service.run()
+
+    assert [r.label for r in results] == ["positive", "negative", "neutral"] * 2
+    assert analyzer.stats.misses == 3
+    assert analyzer.stats.hits == 3
@@ -0,0 +1,170 @@
+"""Tests para el análisis de sentimiento concurrente del Bloque 3."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from exercises.bloque_3.concurrency import ConcurrentSentimentAnalyzer
+from exercises.bloque_3.scoring import InMemoryResultSaver, InMemoryReviewLoader, ScoringService
+
+
+class SlowAnalyzer:
+    """Blocking fake analyzer: score depends on the text, latency is artificial."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def analyze(self, text: str) -> float:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        return len(text) / 100
+
+
+class AsyncSlowAnalyzer:
+    """Async fake analyzer whose latency decreases with the text index."""
+
+    async def analyze(self, text: str) -> float:
+        await asyncio.sleep(0.02 / (1 + len(text)))
+        return len(text) / 100
+
+
+class FlakyAnalyzer:
+    """Fails the first `failures` calls, then succeeds."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    def analyze(self, text: str) -> float:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("temporary failure")
+        return 0.5
+
+
+def test_threaded_batch_preserves_order_and_limits_in_flight():
+    """Test blocking analyzers run concurrently, capped, with ordered output."""
+    slow = SlowAnalyzer(latency=0.01)
+    analyzer = ConcurrentSentimentAnalyzer(slow, max_in_flight=4)
+    texts = ["x" * i for i in range(20)]
+
+    scores = analyzer.analyze_batch(texts)
+
+    assert scores == [i / 100 for i in range(20)]
+    assert 1 < slow.max_in_flight <= 4
+
+
+def test_async_batch_preserves_order():
+    """Test async analyzers keep input order even if later calls finish first."""
+    analyzer = ConcurrentSentimentAnalyzer(AsyncSlowAnalyzer(), max_in_flight=10)
+    texts = ["a", "bbbb", "cc", ""]
+
+    assert analyzer.analyze_batch(texts) == [0.01, 0.04, 0.02, 0.0]
+
+
+def test_retry_with_backoff_recovers_from_transient_errors():
+    """Test failed calls are retried until they succeed."""
+    flaky = FlakyAnalyzer(failures=2)
+    analyzer = ConcurrentSentimentAnalyzer(flaky, retries=2, backoff=0.001)
+
+    assert analyzer.analyze("text") == 0.5
+    assert flaky.calls == 3
+
+
+def test_retries_exhausted_raises_last_error():
+    """Test the error propagates when every attempt fails."""
+    analyzer = ConcurrentSentimentAnalyzer(FlakyAnalyzer(failures=5), retries=1, backoff=0.001)
+
+    with pytest.raises(ConnectionError):
+        analyzer.analyze("text")
+
+
+def test_timeout_raises_when_call_is_too_slow():
+    """Test a call slower than the timeout fails with TimeoutError."""
+    analyzer = ConcurrentSentimentAnalyzer(SlowAnalyzer(latency=0.2), timeout=0.01)
+
+    with pytest.raises(TimeoutError):
+        analyzer.analyze("text")
+
+
+def test_timed_out_calls_keep_their_slot_until_they_finish():
+    """Test a call past its timeout still counts against max_in_flight."""
+    slow = SlowAnalyzer(latency=0.05)
+    analyzer = ConcurrentSentimentAnalyzer(
+        slow, max_in_flight=2, timeout=0.005, retries=2, backoff=0.0
+    )
+
+    with pytest.raises(TimeoutError):
+        analyzer.analyze_batch(["a", "b", "c", "d"])
+    time.sleep(0.1)
+
+    assert slow.max_in_flight <= 2
+
+
+def test_single_calls_reuse_the_thread_pool():
+    """Test analyze() runs every text on the same pool instead of one pool per text."""
+
+    class ThreadRecorder:
+        def __init__(self):
+            self.threads = set()
+
+        def analyze(self, text: str) -> float:
+            self.threads.add(threading.current_thread().name)
+            return len(text) / 100
+
+    recorder = ThreadRecorder()
+    analyzer = ConcurrentSentimentAnalyzer(recorder, max_in_flight=2)
+
+    scores = [analyzer.analyze("x" * i) for i in range(20)]
+
+    assert scores == [i / 100 for i in range(20)]
+    assert len(recorder.threads) <= 2
+
+
+def test_close_shuts_down_the_thread_pool():
+    """Test leaving the with block stops the pool's worker threads."""
+    seen = set()
+
+    class ThreadRecorder:
+        def analyze(self, text: str) -> float:
+            seen.add(threading.current_thread())
+            return 0.0
+
+    with ConcurrentSentimentAnalyzer(ThreadRecorder(), max_in_flight=3) as analyzer:
+        analyzer.analyze_batch(["a", "b", "c", "d"])
+
+    assert seen
+    assert not any(thread.is_alive() for thread in seen)
+    with pytest.raises(RuntimeError):
+        analyzer.analyze("late")
+
+
+def test_invalid_max_in_flight_raises():
+    """Test max_in_flight must be positive."""
+    with pytest.raises(ValueError, match="max_in_flight"):
+        ConcurrentSentimentAnalyzer(SlowAnalyzer(), max_in_flight=0)
+
+
+def test_scoring_service_with_concurrent_analyzer(sample_reviews):
+    """Test the wrapper plugs into ScoringService as a batch analyzer."""
+    analyzer = ConcurrentSentimentAnalyzer(SlowAnalyzer(latency=0.001), max_in_flight=3)
+    service = ScoringService(
+        loader=InMemoryReviewLoader(reviews=sample_reviews),
+        analyzer=analyzer,
+        saver=InMemoryResultSaver(),
+    )
+
+    results = service.run()
+
+    assert [r.sentiment_score for r in results] == [
+        len(review.text) / 100 for review in sample_reviews
+    ]
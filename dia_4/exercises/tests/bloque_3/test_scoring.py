@@ -3,12 +3,14 @@
 import pytest
 from pydantic import ValidationError
 
+from exercises.bloque_3.capabilities import BatchSentimentAnalyzer
 from exercises.bloque_3.scoring import (
     InMemoryResultSaver,
     InMemoryReviewLoader,
     KeywordSentimentAnalyzer,
     Review,
     ScoringResult,
+    ScoringResultBatch,
     ScoringService,
 )
 
@@ -215,3 +217,246 @@ def test_scoring_service_creates_results_with_timestamps(
     for result in results:
         assert isinstance(result.scored_at, str)
         assert len(result.scored_at) > 0
+
+
+# ============================================================================
+# TESTS: Batch sentiment analysis
+# ============================================================================
+def test_analyze_batch_matches_analyze(positive_words, negative_words):
+    """Test analyze_batch returns exactly the same scores as analyze."""
+    analyzer = KeywordSentimentAnalyzer(
+        positive_words=positive_words | {"okay"},
+        negative_words=negative_words | {"okay"},
+    )
+    texts = [
+        "great amazing wonderful",
+        "Terrible AWFUL product, bad",
+        "the product is okay",
+        "",
+        "   ",
+        "good good bad",
+        "great great great great great",
+    ]
+
+    batch_scores = analyzer.analyze_batch(texts)
+
+    assert batch_scores == [analyzer.analyze(text) for text in texts]
+
+
+def test_keyword_analyzer_fulfills_batch_protocol(positive_words, negative_words):
+    """Test KeywordSentimentAnalyzer is detected as a batch analyzer."""
+    analyzer = KeywordSentimentAnalyzer(
+        positive_words=positive_words, negative_words=negative_words
+    )
+
+    assert isinstance(analyzer, BatchSentimentAnalyzer)
+
+
+def test_scoring_service_uses_analyze_batch_when_available(sample_reviews):
+    """Test ScoringService scores all reviews in a single batch call."""
+
+    class FakeBatchAnalyzer:
+        def __init__(self):
+            self.batch_calls = 0
+
+        def analyze(self, text: str) -> float:
+            raise AssertionError("analyze() should not be called")
+
+        def analyze_batch(self, texts: list[str]) -> list[float]:
+            self.batch_calls += 1
+            return [0.5] * len(texts)
+
+    analyzer = FakeBatchAnalyzer()
+    service = ScoringService(
+        loader=InMemoryReviewLoader(reviews=sample_reviews),
+        analyzer=analyzer,
+        saver=InMemoryResultSaver(),
+    )
+
+    results = service.run()
+
+    assert analyzer.batch_calls == 1
+    assert [result.sentiment_score for result in results] == [0.5, 0.5, 0.5]
+
+
+# ============================================================================
+# TESTS: ScoringService.run_streaming
+# ============================================================================
+def make_reviews(count: int) -> list[Review]:
+    """Build count distinct reviews."""
+    return [Review(text=f"review {i} is great", rating=5, product="A") for i in range(count)]
+
+
+def test_run_streaming_saves_each_chunk(positive_words, negative_words):
+    """Test run_streaming calls save once per chunk with bounded size."""
+    saved_chunks = []
+
+    class RecordingSaver:
+        def save(self, results: list[ScoringResult]) -> None:
+            saved_chunks.append(results)
+
+    service = ScoringService(
+        loader=InMemoryReviewLoader(reviews=make_reviews(7)),
+        analyzer=KeywordSentimentAnalyzer(
+            positive_words=positive_words, negative_words=negative_words
+        ),
+        saver=RecordingSaver(),
+    )
+
+    processed = service.run_streaming(chunk_size=3)
+
+    assert processed == 7
+    assert [len(chunk) for chunk in saved_chunks] == [3, 3, 1]
+    assert saved_chunks[2][0].review_text == "review 6 is great"
+
+
+def test_run_streaming_keeps_progress_after_failure():
+    """Test chunks saved before a failure stay saved and can be resumed."""
+
+    class FailingAnalyzer:
+        def __init__(self):
+            self.fail = True
+
+        def analyze(self, text: str) -> float:
+            if self.fail and text.startswith("review 4 "):
+                raise RuntimeError("model unavailable")
+            return 0.0
+
+    reviews = make_reviews(6)
+    analyzer = FailingAnalyzer()
+    saver = InMemoryResultSaver()
+    service = ScoringService(
+        loader=InMemoryReviewLoader(reviews=reviews), analyzer=analyzer, saver=saver
+    )
+
+    with pytest.raises(RuntimeError):
+        service.run_streaming(chunk_size=2)
+    assert len(saver.results) == 4
+
+    analyzer.fail = False
+    processed = service.run_streaming(chunk_size=2, resume_from=len(saver.results))
+
+    assert processed == 2
+    assert [result.review_text for result in saver.results] == [r.text for r in reviews]
+
+
+def test_run_streaming_with_plain_loader_and_odd_resume():
+    """Test run_streaming works with a loader without load_chunks."""
+
+    class ListLoader:
+        def load(self) -> list[Review]:
+            return make_reviews(5)
+
+    saver = InMemoryResultSaver()
+    service = ScoringService(
+        loader=ListLoader(), analyzer=KeywordSentimentAnalyzer(set(), set()), saver=saver
+    )
+
+    processed = service.run_streaming(chunk_size=2, resume_from=3)
+
+    assert processed == 2
+    assert [result.review_text for result in saver.results] == [
+        "review 3 is great",
+        "review 4 is great",
+    ]
+
+
+def test_run_streaming_rejects_invalid_chunk_size(sample_reviews):
+    """Test run_streaming validates chunk_size."""
+    service = ScoringService(
+        loader=InMemoryReviewLoader(reviews=sample_reviews),
+        analyzer=KeywordSentimentAnalyzer(set(), set()),
+        saver=InMemoryResultSaver(),
+    )
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        service.run_streaming(chunk_size=0)
+
+
+# ============================================================================
+# TESTS: ScoringResultBatch (columnar)
+# ============================================================================
+def test_scoring_result_has_no_instance_dict():
+    """Test ScoringResult is slotted."""
+    result = ScoringResult(
+        review_text="ok", sentiment_score=0.0, label="neutral", scored_at="2024-01-01"
+    )
+
+    assert not hasattr(result, "__dict__")
+
+
+def test_scoring_result_batch_columns(sample_reviews):
+    """Test the batch stores indices, float64 scores, uint8 labels and one timestamp."""
+    batch = ScoringResultBatch.from_scores(sample_reviews, [0.8, -0.9, 0.0], scored_at="t0")
+
+    assert len(batch) == 3
+    assert list(batch.review_indices) == [0, 1, 2]
+    assert batch.scores.typecode == "d"
+    assert batch.label_codes.typecode == "B"
+    assert list(batch.label_codes) == [2, 0, 1]
+    assert batch.scored_at == "t0"
+
+
+def test_scoring_result_batch_converts_to_rows(sample_reviews):
+    """Test rows are rebuilt on demand with the review text and shared timestamp."""
+    batch = ScoringResultBatch.from_scores(sample_reviews, [0.8, -0.9, 0.0], scored_at="t0")
+
+    assert batch[1] == ScoringResult(
+        review_text="Terrible quality, very bad",
+        sentiment_score=-0.9,
+        label="negative",
+        scored_at="t0",
+    )
+    assert [result.label for result in batch.to_results()] == ["positive", "negative", "neutral"]
+    assert next(iter(batch.rows())) == ("This product is great and amazing", 0.8, "positive", "t0")
+
+
+def test_scoring_result_batch_rejects_length_mismatch(sample_reviews):
+    """Test every review needs exactly one score."""
+    with pytest.raises(ValueError, match="scores"):
+        ScoringResultBatch.from_scores(sample_reviews, [0.1])
+
+
+def test_run_columnar_matches_run(sample_reviews, positive_words, negative_words):
+    """Test run_columnar scores like run and saves row objects to a plain saver."""
+    analyzer = KeywordSentimentAnalyzer(
+        positive_words=positive_words, negative_words=negative_words
+    )
+    saver = InMemoryResultSaver()
+    service = ScoringService(
+        loader=InMemoryReviewLoader(reviews=sample_reviews), analyzer=analyzer, saver=saver
+    )
+
+    batch = service.run_columnar()
+    expected = ScoringService(
+        loader=InMemoryReviewLoader(reviews=sample_reviews),
+        analyzer=analyzer,
+        saver=InMemoryResultSaver(),
+    ).run()
+
+    assert [(r.review_text, r.sentiment_score, r.label) for r in batch] == [
+        (r.review_text, r.sentiment_score, r.label) for r in expected
+    ]
+    assert saver.results == batch.to_results()
+
+
+def test_run_columnar_uses_save_batch_when_available(sample_reviews):
+    """Test run_columnar hands the batch to a ColumnarResultSaver as is."""
+    received = []
+
+    class ColumnarSaver:
+        def save(self, results: list[ScoringResult]) -> None:
+            raise AssertionError("save() should not be called")
+
+        def save_batch(self, batch: ScoringResultBatch) -> None:
+            received.append(batch)
+
+    service = ScoringService(
+        loader=InMemoryReviewLoader(reviews=sample_reviews),
+        analyzer=KeywordSentimentAnalyzer(set(), set()),
+        saver=ColumnarSaver(),
+    )
+
+    batch = service.run_columnar()
+
+    assert received == [batch]
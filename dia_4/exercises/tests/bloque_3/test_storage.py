@@ -0,0 +1,224 @@
+"""Tests para los loaders y savers CSV / SQLite del Bloque 3."""
+
+import csv
+import sqlite3
+from contextlib import closing
+
+import pytest
+from pydantic import ValidationError
+
+from exercises.bloque_3.scoring import (
+    KeywordSentimentAnalyzer,
+    Review,
+    ScoringResult,
+    ScoringResultBatch,
+    ScoringService,
+)
+from exercises.bloque_3.storage import (
+    CSVResultSaver,
+    CSVReviewLoader,
+    JSONLReviewLoader,
+    SQLiteResultSaver,
+    SQLiteReviewLoader,
+    construct_reviews,
+    validate_reviews,
+    validate_reviews_json,
+)
+
+
+@pytest.fixture
+def reviews_csv(tmp_path):
+    """CSV file with five reviews."""
+    path = tmp_path / "reviews.csv"
+    with path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["text", "rating", "product"])
+        for i in range(5):
+            writer.writerow([f"review {i} is great", 5, f"Widget {i}"])
+    return path
+
+
+@pytest.fixture
+def reviews_db(tmp_path):
+    """SQLite database with a reviews table of five rows."""
+    path = tmp_path / "reviews.db"
+    with closing(sqlite3.connect(path)) as connection, connection:
+        connection.execute("CREATE TABLE reviews (text TEXT, rating INTEGER, product TEXT)")
+        connection.executemany(
+            "INSERT INTO reviews VALUES (?, ?, ?)",
+            [(f"review {i} is bad", 1, "Widget") for i in range(5)],
+        )
+    return path
+
+
+def make_result(text: str) -> ScoringResult:
+    """Build a scoring result for text."""
+    return ScoringResult(
+        review_text=text, sentiment_score=0.5, label="positive", scored_at="2024-01-01T00:00:00"
+    )
+
+
+def test_csv_loader_streams_validated_chunks(reviews_csv):
+    """Test CSVReviewLoader yields validated reviews in chunks."""
+    loader = CSVReviewLoader(reviews_csv)
+
+    chunks = list(loader.load_chunks(2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[0][0].rating == 5
+    assert loader.load()[4].product == "Widget 4"
+
+
+def test_csv_loader_rejects_invalid_rows(tmp_path):
+    """Test invalid rows raise ValidationError."""
+    path = tmp_path / "bad.csv"
+    path.write_text("text,rating,product\nok,9,Widget\n", encoding="utf-8")
+
+    with pytest.raises(ValidationError):
+        CSVReviewLoader(path).load()
+
+
+def test_csv_saver_appends_with_single_header(tmp_path):
+    """Test several saves append rows under one header."""
+    path = tmp_path / "results.csv"
+    saver = CSVResultSaver(path)
+
+    saver.save([make_result("a"), make_result("b")])
+    saver.save([make_result("c")])
+
+    with path.open(newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["review_text"] for row in rows] == ["a", "b", "c"]
+    assert rows[0]["sentiment_score"] == "0.5"
+
+
+def test_sqlite_loader_streams_in_insertion_order(reviews_db):
+    """Test SQLiteReviewLoader reads rows in order with fetchmany."""
+    loader = SQLiteReviewLoader(reviews_db)
+
+    chunks = list(loader.load_chunks(3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 2]
+    assert [review.text for review in loader.load()][-1] == "review 4 is bad"
+
+
+def test_sqlite_saver_inserts_batches(tmp_path):
+    """Test SQLiteResultSaver creates the table and inserts every result."""
+    path = tmp_path / "results.db"
+    saver = SQLiteResultSaver(path)
+
+    saver.save([make_result("a"), make_result("b")])
+    saver.save([make_result("c")])
+
+    with closing(sqlite3.connect(path)) as connection:
+        rows = connection.execute("SELECT review_text, label FROM scoring_results").fetchall()
+    assert rows == [("a", "positive"), ("b", "positive"), ("c", "positive")]
+
+
+def test_savers_write_columnar_batches_like_rows(tmp_path, sample_reviews):
+    """Test save_batch writes the same rows as save(batch.to_results())."""
+    batch = ScoringResultBatch.from_scores(sample_reviews, [0.8, -0.9, 0.0], scored_at="t0")
+    SQLiteResultSaver(tmp_path / "batch.db").save_batch(batch)
+    SQLiteResultSaver(tmp_path / "rows.db").save(batch.to_results())
+    CSVResultSaver(tmp_path / "batch.csv").save_batch(batch)
+    CSVResultSaver(tmp_path / "rows.csv").save(batch.to_results())
+
+    query = "SELECT * FROM scoring_results ORDER BY rowid"
+    with (
+        closing(sqlite3.connect(tmp_path / "batch.db")) as batch_db,
+        closing(sqlite3.connect(tmp_path / "rows.db")) as rows_db,
+    ):
+        assert batch_db.execute(query).fetchall() == rows_db.execute(query).fetchall()
+    assert (tmp_path / "batch.csv").read_text() == (tmp_path / "rows.csv").read_text()
+
+
+def test_sqlite_rejects_unsafe_table_name(tmp_path):
+    """Test table names are validated before being used in SQL."""
+    with pytest.raises(ValueError, match="table"):
+        SQLiteResultSaver(tmp_path / "x.db", table="results; DROP TABLE reviews")
+
+
+def test_scoring_service_streams_from_csv_to_sqlite(
+    reviews_csv, tmp_path, positive_words, negative_words
+):
+    """Test a full streaming run from a CSV file into SQLite."""
+    saver = SQLiteResultSaver(tmp_path / "results.db")
+    service = ScoringService(
+        loader=CSVReviewLoader(reviews_csv),
+        analyzer=KeywordSentimentAnalyzer(
+            positive_words=positive_words, negative_words=negative_words
+        ),
+        saver=saver,
+    )
+
+    processed = service.run_streaming(chunk_size=2)
+
+    with closing(sqlite3.connect(tmp_path / "results.db")) as connection:
+        count = connection.execute("SELECT COUNT(*) FROM scoring_results").fetchone()[0]
+    assert processed == count == 5
+
+
+# ============================================================================
+# TESTS: Bulk validation paths
+# ============================================================================
+def test_validate_reviews_batch_equals_per_row_models():
+    """Test batch validation builds the same models as the constructor."""
+    rows = [
+        {"text": "great", "rating": "5", "product": "A"},
+        {"text": "bad", "rating": 1, "product": "B"},
+    ]
+
+    reviews = validate_reviews(rows)
+
+    assert reviews == [Review(text="great", rating=5, product="A"), Review(**rows[1])]
+
+
+def test_validate_reviews_reports_invalid_row_position():
+    """Test batch validation errors point at the failing row."""
+    rows = [
+        {"text": "ok", "rating": 3, "product": "A"},
+        {"text": "", "rating": 3, "product": "B"},
+    ]
+
+    with pytest.raises(ValidationError) as error:
+        validate_reviews(rows)
+
+    assert error.value.errors()[0]["loc"][0] == 1
+
+
+def test_validate_reviews_json_from_bytes():
+    """Test reviews validate straight from JSON bytes."""
+    data = b'[{"text": "great", "rating": 5, "product": "A"}]'
+
+    assert validate_reviews_json(data) == [Review(text="great", rating=5, product="A")]
+
+
+def test_construct_reviews_skips_validation():
+    """Test trusted mode builds models without validating them."""
+    reviews = construct_reviews([{"text": "", "rating": 99, "product": "A"}])
+
+    assert reviews[0].rating == 99
+
+
+def test_loaders_trusted_mode_matches_full_mode_for_clean_data(reviews_db):
+    """Test trusted and full validation give the same reviews for typed rows."""
+    full = SQLiteReviewLoader(reviews_db).load()
+    trusted = SQLiteReviewLoader(reviews_db, validation="trusted").load()
+
+    assert trusted == full
+
+
+def test_jsonl_loader_validates_chunks(tmp_path):
+    """Test JSONLReviewLoader streams and validates JSON lines."""
+    path = tmp_path / "reviews.jsonl"
+    path.write_bytes(
+        b'{"text": "great", "rating": 5, "product": "A"}\n'
+        b"\n"
+        b'{"text": "bad", "rating": 1, "product": "B"}\n'
+        b'{"text": "meh", "rating": 3, "product": "C"}\n'
+    )
+
+    chunks = list(JSONLReviewLoader(path).load_chunks(2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[1][0] == Review(text="meh", rating=3, product="C")
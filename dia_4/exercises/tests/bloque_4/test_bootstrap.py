@@ -0,0 +1,207 @@
+"""Tests para los intervalos de confianza bootstrap del Bloque 4."""
+
+import numpy as np
+import pytest
+
+from exercises.bloque_4.bootstrap import (
+    bootstrap_confusion_matrices,
+    bootstrap_metrics,
+    percentile_interval,
+)
+from exercises.bloque_4.evaluation import (
+    AccuracyMetric,
+    AUCROCMetric,
+    ClassificationEvaluator,
+    F1Metric,
+    MCCMetric,
+    MulticlassF1Metric,
+    MultilabelF1Metric,
+    PrecisionMetric,
+    RecallMetric,
+)
+from exercises.bloque_4.helpers import (
+    F1_AVERAGES,
+    accuracy,
+    auc_roc,
+    auc_roc_resampled,
+    confusion_codes,
+    confusion_matrix,
+)
+
+
+@pytest.fixture
+def noisy_classification():
+    """Binary labels, ~80% correct predictions and informative scores."""
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 400)
+    y_pred = np.where(rng.random(400) < 0.8, y_true, 1 - y_true)
+    y_proba = np.clip(0.3 + 0.4 * y_true + rng.normal(0, 0.2, 400), 0, 1)
+    return y_true, y_pred, y_proba
+
+
+class PlainAccuracyMetric:
+    """Accuracy without compute_from_confusion (forces index resampling)."""
+
+    @property
+    def name(self) -> str:
+        return "plain_accuracy"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return accuracy(y_true, y_pred)
+
+
+def test_bootstrap_confusion_matrices_match_per_row(noisy_classification):
+    """Test the single-bincount matrices equal one confusion_matrix per resample."""
+    y_true, y_pred, _ = noisy_classification
+    codes, n_classes = confusion_codes(y_true, y_pred)
+    indices = np.random.default_rng(1).integers(0, y_true.size, size=(5, y_true.size))
+
+    matrices = bootstrap_confusion_matrices(codes, n_classes, indices)
+
+    for row, cm in zip(indices, matrices):
+        np.testing.assert_array_equal(cm, confusion_matrix(y_true[row], y_pred[row]))
+
+
+def test_confusion_metrics_on_a_stack_match_per_matrix():
+    """Test compute_from_confusions gives one value per matrix, empty cells included."""
+    rng = np.random.default_rng(3)
+    binary = rng.integers(0, 4, size=(50, 2, 2))
+    binary[0] = 0
+    binary[1] = [[5, 0], [0, 0]]
+    multiclass = rng.integers(0, 4, size=(50, 4, 4))
+    multiclass[0] = 0
+    binary_metrics = [AccuracyMetric(), PrecisionMetric(), RecallMetric(), F1Metric(), MCCMetric()]
+    multiclass_metrics = [MulticlassF1Metric(average) for average in F1_AVERAGES]
+
+    for metrics, stack in ((binary_metrics, binary), (multiclass_metrics, multiclass)):
+        for metric in metrics:
+            expected = [metric.compute_from_confusion(cm) for cm in stack]
+            np.testing.assert_allclose(metric.compute_from_confusions(stack), expected)
+
+
+def test_auc_roc_resampled_matches_materialized_resamples(noisy_classification):
+    """Test the single-sort AUC equals auc_roc on each resample, ties included."""
+    y_true, _, y_proba = noisy_classification
+    y_proba = np.round(y_proba, 1)
+    indices = np.random.default_rng(2).integers(0, y_true.size, size=(6, y_true.size))
+
+    resampled = auc_roc_resampled(y_true, y_proba, indices)
+
+    expected = [auc_roc(y_true[row], y_proba[row]) for row in indices]
+    np.testing.assert_allclose(resampled, expected)
+
+
+def test_percentile_interval_bounds():
+    """Test the interval uses the (1 - confidence) / 2 tails."""
+    low, high = percentile_interval(np.arange(101, dtype=float), confidence=0.9)
+
+    assert (low, high) == pytest.approx((5.0, 95.0))
+    with pytest.raises(ValueError, match="confidence"):
+        percentile_interval(np.arange(3.0), confidence=1.5)
+
+
+def test_bootstrap_is_reproducible_and_paired(noisy_classification):
+    """Test the same seed gives the same samples and all metrics share resamples."""
+    y_true, y_pred, _ = noisy_classification
+    metrics = [AccuracyMetric(), PlainAccuracyMetric()]
+
+    first = bootstrap_metrics(y_true, y_pred, metrics, n_resamples=50, seed=3, chunk_size=20)
+    second = bootstrap_metrics(y_true, y_pred, metrics, n_resamples=50, seed=3, chunk_size=20)
+
+    np.testing.assert_array_equal(first["accuracy"], second["accuracy"])
+    assert first["accuracy"].shape == (50,)
+    # Both metrics see the same resampled rows
+    np.testing.assert_allclose(first["accuracy"], first["plain_accuracy"])
+
+
+def test_confusion_only_bootstrap_has_expected_spread(noisy_classification):
+    """Test the multinomial shortcut matches the index-resampling spread."""
+    y_true, y_pred, _ = noisy_classification
+
+    # MCC needs the matrix, so accuracy reuses the multinomial matrices too
+    metrics = [AccuracyMetric(), MCCMetric()]
+    fast = bootstrap_metrics(y_true, y_pred, metrics, n_resamples=2000, seed=0)
+    slow = bootstrap_metrics(y_true, y_pred, [PlainAccuracyMetric()], n_resamples=2000, seed=0)
+
+    p = accuracy(y_true, y_pred)
+    expected_sd = np.sqrt(p * (1 - p) / y_true.size)
+    assert fast["accuracy"].std() == pytest.approx(expected_sd, rel=0.1)
+    assert slow["plain_accuracy"].std() == pytest.approx(expected_sd, rel=0.1)
+
+
+def test_bootstrap_without_matrix_metrics_skips_confusion_codes(monkeypatch):
+    """Test accuracy alone resamples rows, so any label type works."""
+    def fail(*args, **kwargs):
+        raise AssertionError("confusion_codes should not be called")
+
+    monkeypatch.setattr("exercises.bloque_4.bootstrap.confusion_codes", fail)
+    y_true = np.array(["a", "b", "a", "b"])
+    y_pred = np.array(["a", "b", "b", "b"])
+
+    samples = bootstrap_metrics(y_true, y_pred, [AccuracyMetric()], n_resamples=20, seed=0)
+
+    assert samples["accuracy"].shape == (20,)
+    assert ((samples["accuracy"] >= 0) & (samples["accuracy"] <= 1)).all()
+
+
+def test_bootstrap_resamples_rows_of_multilabel_input():
+    """Test 2-D multilabel input is resampled by rows, not by cells."""
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, (50, 3))
+    y_pred = np.where(rng.random((50, 3)) < 0.8, y_true, 1 - y_true)
+
+    samples = bootstrap_metrics(y_true, y_pred, [MultilabelF1Metric()], n_resamples=30, seed=0)
+
+    values = samples["f1_multilabel_macro"]
+    assert values.shape == (30,)
+    assert ((values >= 0) & (values <= 1)).all()
+
+
+def test_bootstrap_with_processes_matches_serial(noisy_classification):
+    """Test spreading blocks across processes does not change the samples."""
+    y_true, y_pred, y_proba = noisy_classification
+
+    def run(max_workers: int) -> dict[str, np.ndarray]:
+        return bootstrap_metrics(
+            y_true,
+            y_pred,
+            [F1Metric()],
+            probabilistic_metrics=[AUCROCMetric()],
+            y_proba=y_proba,
+            n_resamples=40,
+            seed=7,
+            chunk_size=10,
+            max_workers=max_workers,
+        )
+
+    serial = run(max_workers=1)
+    parallel = run(max_workers=2)
+
+    for name in ("f1", "auc_roc"):
+        np.testing.assert_array_equal(serial[name], parallel[name])
+
+
+def test_evaluate_bootstrap_reports_interval_per_metric(noisy_classification):
+    """Test every reported metric gets an interval around its point estimate."""
+    y_true, y_pred, y_proba = noisy_classification
+    evaluator = ClassificationEvaluator(
+        metrics=[AccuracyMetric(), F1Metric(), MCCMetric()],
+        probabilistic_metrics=[AUCROCMetric()],
+        model_name="m",
+    )
+
+    result = evaluator.evaluate_bootstrap(y_true, y_pred, y_proba, n_resamples=300, seed=0)
+
+    assert result.model_name == "m"
+    assert set(result.confidence_intervals) == set(result.metrics)
+    for name, (low, high) in result.confidence_intervals.items():
+        assert low <= result.metrics[name] <= high
+
+
+def test_bootstrap_rejects_invalid_arguments(noisy_classification):
+    """Test argument validation."""
+    y_true, y_pred, _ = noisy_classification
+    with pytest.raises(ValueError, match="n_resamples"):
+        bootstrap_metrics(y_true, y_pred, [AccuracyMetric()], n_resamples=0)
+    with pytest.raises(ValueError, match="empty"):
+        bootstrap_metrics(np.array([]), np.array([]), [AccuracyMetric()])
@@ -0,0 +1,172 @@
+"""Tests para la comparación de modelos del Bloque 4."""
+
+import numpy as np
+import pytest
+
+from exercises.bloque_4.comparison import ModelComparator, delong
+from exercises.bloque_4.evaluation import (
+    AccuracyMetric,
+    AUCROCMetric,
+    ClassificationEvaluator,
+    F1Metric,
+    MCCMetric,
+)
+from exercises.bloque_4.helpers import auc_roc, auc_roc_columns, midranks
+
+
+@pytest.fixture
+def model_matrix():
+    """Labels plus three models of decreasing quality, as (n, 3) matrices."""
+    rng = np.random.default_rng(3)
+    n = 400
+    y_true = rng.integers(0, 2, n)
+    y_proba = np.column_stack(
+        [
+            np.clip(0.5 + shift * (y_true - 0.5) + rng.normal(0, 0.2, n), 0, 1)
+            for shift in (0.5, 0.2, 0.0)
+        ]
+    )
+    y_pred = (y_proba >= 0.5).astype(int)
+    return y_true, y_pred, y_proba
+
+
+class PlainAccuracyMetric:
+    """Accuracy without compute_from_confusion."""
+
+    @property
+    def name(self) -> str:
+        return "plain_accuracy"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return float(np.mean(y_true == y_pred))
+
+
+def _reference_midranks(values):
+    """1-based average ranks computed with a Python loop."""
+    return np.array([np.sum(values < v) + (np.sum(values == v) + 1) / 2 for v in values])
+
+
+def _reference_delong(y_true, y_proba):
+    """DeLong covariance from the O(m*n) placement values."""
+    pos, neg = y_proba[y_true == 1], y_proba[y_true == 0]
+    psi = (pos[:, None, :] > neg[None, :, :]) + 0.5 * (pos[:, None, :] == neg[None, :, :])
+    v_pos, v_neg = psi.mean(axis=1), psi.mean(axis=0)
+    return np.cov(v_pos, rowvar=False) / len(pos) + np.cov(v_neg, rowvar=False) / len(neg)
+
+
+def test_midranks_matches_reference_with_ties():
+    values = np.array([0.3, 0.1, 0.3, 0.9, 0.1, 0.3])
+    np.testing.assert_allclose(midranks(values), _reference_midranks(values))
+
+
+def test_midranks_works_per_column():
+    rng = np.random.default_rng(0)
+    matrix = rng.integers(0, 5, size=(50, 3)).astype(float)
+    ranks = midranks(matrix)
+    for k in range(3):
+        np.testing.assert_allclose(ranks[:, k], _reference_midranks(matrix[:, k]))
+
+
+def test_auc_roc_columns_matches_auc_roc(model_matrix):
+    y_true, _, y_proba = model_matrix
+    expected = [auc_roc(y_true, y_proba[:, k]) for k in range(y_proba.shape[1])]
+    np.testing.assert_allclose(auc_roc_columns(y_true, y_proba), expected)
+
+
+def test_auc_roc_columns_single_class_is_zero():
+    np.testing.assert_array_equal(auc_roc_columns(np.ones(4), np.random.rand(4, 2)), [0.0, 0.0])
+
+
+def test_delong_matches_placement_reference(model_matrix):
+    y_true, _, y_proba = model_matrix
+    y_proba = np.round(y_proba, 2)  # force ties
+    result = delong(y_true, y_proba)
+    np.testing.assert_allclose(result.aucs, auc_roc_columns(y_true, y_proba))
+    np.testing.assert_allclose(result.covariance, _reference_delong(y_true, y_proba))
+
+
+def test_delong_test_is_symmetric(model_matrix):
+    y_true, _, y_proba = model_matrix
+    result = delong(y_true, y_proba)
+    z_ab, p_ab = result.test(0, 1)
+    z_ba, p_ba = result.test(1, 0)
+    assert z_ab == pytest.approx(-z_ba)
+    assert p_ab == pytest.approx(p_ba)
+    assert p_ab < 0.05
+
+
+def test_delong_identical_models_p_value_one(model_matrix):
+    y_true, _, y_proba = model_matrix
+    result = delong(y_true, np.column_stack([y_proba[:, 0], y_proba[:, 0]]))
+    assert result.test(0, 1) == (0.0, 1.0)
+
+
+def test_delong_requires_both_classes():
+    with pytest.raises(ValueError):
+        delong(np.zeros(5), np.random.rand(5, 2))
+
+
+def test_compare_matches_per_model_evaluator(model_matrix):
+    y_true, y_pred, y_proba = model_matrix
+    metrics = [AccuracyMetric(), F1Metric(), MCCMetric(), PlainAccuracyMetric()]
+    comparator = ModelComparator(metrics, [AUCROCMetric()])
+    table = comparator.compare(y_true, y_pred, y_proba, model_names=["a", "b", "c"])
+    for k, name in enumerate(["a", "b", "c"]):
+        expected = ClassificationEvaluator(metrics, [AUCROCMetric()]).evaluate(
+            y_true, y_pred[:, k], y_proba[:, k]
+        )
+        row = next(result for result in table.results if result.model_name == name)
+        assert row.metrics == pytest.approx(expected.metrics)
+
+
+def test_compare_ranks_best_first(model_matrix):
+    y_true, y_pred, y_proba = model_matrix
+    table = ModelComparator([AccuracyMetric()], [AUCROCMetric()], rank_by="auc_roc").compare(
+        y_true, y_pred, y_proba, model_names=["a", "b", "c"]
+    )
+    assert table.model_names == ["a", "b", "c"]
+    assert table.rank_by == "auc_roc"
+    assert set(table.p_values) == {"b", "c"}
+    assert table.p_values["c"] < 0.05
+
+
+def test_compare_lower_is_better():
+    y_true = np.array([0, 1, 0, 1])
+    y_pred = np.array([[0, 1, 0, 1], [1, 0, 1, 0]]).T
+    table = ModelComparator([AccuracyMetric()], higher_is_better=False).compare(y_true, y_pred)
+    assert table.model_names == ["model_1", "model_0"]
+    assert table.p_values == {}
+
+
+def test_compare_to_text_has_one_row_per_model(model_matrix):
+    y_true, y_pred, y_proba = model_matrix
+    table = ModelComparator([AccuracyMetric()], [AUCROCMetric()]).compare(
+        y_true, y_pred, y_proba
+    )
+    lines = table.to_text().splitlines()
+    assert len(lines) == 4
+    assert "p_value" in lines[0]
+
+
+def test_compare_validates_shapes(model_matrix):
+    y_true, y_pred, y_proba = model_matrix
+    comparator = ModelComparator([AccuracyMetric()])
+    with pytest.raises(ValueError):
+        comparator.compare(y_true, y_pred[:, 0])
+    with pytest.raises(ValueError):
+        comparator.compare(y_true, y_pred, y_proba[:, :2])
+    with pytest.raises(ValueError):
+        comparator.compare(y_true, y_pred, model_names=["only_one"])
+    with pytest.raises(ValueError):
+        comparator.compare(y_true)
+
+
+def test_compare_unknown_rank_by_raises(model_matrix):
+    y_true, y_pred, _ = model_matrix
+    with pytest.raises(ValueError):
+        ModelComparator([AccuracyMetric()], rank_by="auc_roc").compare(y_true, y_pred)
+
+
+def test_comparator_requires_metrics():
+    with pytest.raises(ValueError):
+        ModelComparator()
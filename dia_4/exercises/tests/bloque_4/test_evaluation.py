@@ -6,13 +6,19 @@ import pytest
 from exercises.bloque_4.evaluation import (
     AccuracyMetric,
     AUCROCMetric,
+    BinnedAUCMetric,
     ClassificationEvaluator,
     EvaluationResult,
     F1Metric,
     MAEMetric,
+    MCCMetric,
+    MulticlassF1Metric,
+    PrecisionMetric,
+    RecallMetric,
     RegressionEvaluator,
     RMSEMetric,
 )
+from exercises.bloque_4.helpers import auc_roc, confusion_matrix, f1_binary
 
 
 # ============================================================================
@@ -251,3 +257,208 @@ def test_evaluation_result_has_model_name():
     """Test EvaluationResult has model_name."""
     result = EvaluationResult(metrics={"accuracy": 0.9}, model_name="my_model")
     assert result.model_name == "my_model"
+
+
+# ============================================================================
+# TESTS: Confusion matrix (shared single pass)
+# ============================================================================
+def test_confusion_matrix_binary_layout(binary_classification_mixed):
+    """Test the binary confusion matrix is [[tn, fp], [fn, tp]]."""
+    y_true, y_pred = binary_classification_mixed
+
+    cm = confusion_matrix(y_true, y_pred)
+
+    assert cm.tolist() == [[2, 2], [1, 3]]
+
+
+def test_confusion_matrix_accepts_bool_and_rejects_out_of_range():
+    """Test bool labels work and labels outside [0, n_classes) raise."""
+    y_true = np.array([True, False, True])
+    y_pred = np.array([True, True, False])
+    assert confusion_matrix(y_true, y_pred).tolist() == [[0, 1], [1, 1]]
+
+    with pytest.raises(ValueError, match="Labels"):
+        confusion_matrix(np.array([0, 1]), np.array([0, 2]), n_classes=2)
+    with pytest.raises(ValueError, match="Labels"):
+        confusion_matrix(np.array([0, 1]), np.array([0, -1]))
+
+
+def test_f1_binary_matches_mask_formula(binary_classification_mixed):
+    """Test f1_binary gives the classic tp/fp/fn mask result."""
+    y_true, y_pred = binary_classification_mixed
+    tp = np.sum((y_true == 1) & (y_pred == 1))
+    fp = np.sum((y_true == 0) & (y_pred == 1))
+    fn = np.sum((y_true == 1) & (y_pred == 0))
+
+    assert f1_binary(y_true, y_pred) == pytest.approx(2 * tp / (2 * tp + fp + fn))
+
+
+@pytest.mark.parametrize(
+    ("metric_class", "expected"),
+    [
+        (AccuracyMetric, 5 / 8),
+        (PrecisionMetric, 3 / 5),
+        (RecallMetric, 3 / 4),
+        (F1Metric, 2 / 3),
+        (MCCMetric, (3 * 2 - 2 * 1) / np.sqrt(5 * 4 * 4 * 3)),
+    ],
+)
+def test_confusion_metrics_compute_and_from_confusion_agree(
+    metric_class, expected, binary_classification_mixed
+):
+    """Test each metric gives the same value from arrays and from the matrix."""
+    y_true, y_pred = binary_classification_mixed
+    metric = metric_class()
+
+    assert metric.compute(y_true, y_pred) == pytest.approx(expected)
+    assert metric.compute_from_confusion(confusion_matrix(y_true, y_pred)) == pytest.approx(
+        expected
+    )
+
+
+def test_classification_evaluator_builds_confusion_matrix_once(
+    binary_classification_mixed, monkeypatch
+):
+    """Test evaluate() computes one confusion matrix for all confusion metrics."""
+    calls = []
+
+    def counting_confusion_matrix(*args, **kwargs):
+        calls.append(args)
+        return confusion_matrix(*args, **kwargs)
+
+    monkeypatch.setattr(
+        "exercises.bloque_4.evaluation.confusion_matrix", counting_confusion_matrix
+    )
+    y_true, y_pred = binary_classification_mixed
+    metrics = [AccuracyMetric(), PrecisionMetric(), RecallMetric(), F1Metric(), MCCMetric()]
+
+    result = ClassificationEvaluator(metrics=metrics).evaluate(y_true, y_pred)
+
+    assert len(calls) == 1
+    assert result.metrics["accuracy"] == pytest.approx(5 / 8)
+    assert result.metrics["f1"] == pytest.approx(2 / 3)
+
+
+def test_accuracy_alone_does_not_build_confusion_matrix(monkeypatch):
+    """Test accuracy uses compute(), so any label type still works."""
+    def failing_confusion_matrix(*args, **kwargs):
+        raise AssertionError("confusion matrix should not be built")
+
+    monkeypatch.setattr("exercises.bloque_4.evaluation.confusion_matrix", failing_confusion_matrix)
+    evaluator = ClassificationEvaluator(metrics=[AccuracyMetric()])
+
+    strings = evaluator.evaluate(np.array(["cat", "dog"]), np.array(["cat", "cat"]))
+    signs = evaluator.evaluate(np.array([-1, 1, 1]), np.array([-1, 1, -1]))
+    floats = evaluator.evaluate(np.array([0.2, 0.9]), np.array([0.3, 0.9]))
+    large_ids = evaluator.evaluate(np.array([70_000, 1]), np.array([70_000, 2]))
+
+    assert strings.metrics["accuracy"] == pytest.approx(0.5)
+    assert signs.metrics["accuracy"] == pytest.approx(2 / 3)
+    assert floats.metrics["accuracy"] == pytest.approx(0.5)
+    assert large_ids.metrics["accuracy"] == pytest.approx(0.5)
+
+
+def test_confusion_matrix_rejects_non_integer_labels():
+    """Test float and string labels raise instead of being truncated."""
+    with pytest.raises(TypeError, match="Labels must be integers"):
+        confusion_matrix(np.array([0.2, 0.9]), np.array([0.3, 0.9]))
+    with pytest.raises(TypeError, match="Labels must be integers"):
+        confusion_matrix(np.array(["a", "b"]), np.array(["a", "a"]))
+
+
+def test_confusion_matrix_accepts_whole_number_float_labels():
+    """Test float labels without decimals are counted like integers."""
+    cm = confusion_matrix(np.array([0.0, 1.0, 1.0]), np.array([0.0, 1.0, 0.0]))
+
+    np.testing.assert_array_equal(cm, [[1, 0], [1, 1]])
+
+
+def test_binary_metrics_accept_float_labels():
+    """Test F1, precision, recall and MCC work on 0.0/1.0 float labels."""
+    y_true = np.array([0.0, 1.0, 1.0])
+    y_pred = np.array([0.0, 1.0, 0.0])
+    metrics = [F1Metric(), PrecisionMetric(), RecallMetric(), MCCMetric()]
+
+    result = ClassificationEvaluator(metrics=metrics).evaluate(y_true, y_pred)
+
+    assert f1_binary(y_true, y_pred) == pytest.approx(2 / 3)
+    assert result.metrics["f1"] == pytest.approx(2 / 3)
+    assert result.metrics["precision"] == pytest.approx(1.0)
+    assert result.metrics["recall"] == pytest.approx(0.5)
+    assert result.metrics["mcc"] == pytest.approx(0.5)
+
+
+def test_binary_metrics_count_minus_one_labels_with_masks():
+    """Test -1/1 labels fall back to masked counts: -1 is neither class 0 nor 1."""
+    y_true = np.array([-1, 1, 1, -1])
+    y_pred = np.array([-1, 1, 1, 1])
+    metrics = [F1Metric(), PrecisionMetric(), RecallMetric()]
+
+    result = ClassificationEvaluator(metrics=metrics).evaluate(y_true, y_pred)
+
+    assert f1_binary(y_true, y_pred) == pytest.approx(1.0)
+    assert result.metrics == pytest.approx({"f1": 1.0, "precision": 1.0, "recall": 1.0})
+    assert F1Metric().compute(y_true, y_pred) == pytest.approx(1.0)
+
+
+def test_binary_and_multiclass_metrics_share_a_binary_matrix():
+    """Test binary metrics get a 2x2 matrix and reject multiclass labels up front."""
+    evaluator = ClassificationEvaluator(metrics=[F1Metric(), MulticlassF1Metric("macro")])
+
+    result = evaluator.evaluate(np.array([0, 1, 1, 0]), np.array([0, 1, 0, 0]))
+
+    assert result.metrics["f1"] == pytest.approx(2 / 3)
+    assert result.metrics["f1_macro"] == pytest.approx((0.8 + 2 / 3) / 2)
+    with pytest.raises(ValueError, match=r"Labels must be in \[0, 2\)"):
+        evaluator.evaluate(np.array([0, 1, 2]), np.array([0, 2, 1]))
+
+
+# ============================================================================
+# TESTS: Rank-based AUC
+# ============================================================================
+def pairwise_auc(y_true: np.ndarray, y_proba: np.ndarray) -> float:
+    """Reference AUC: fraction of (positive, negative) pairs ranked right, ties = 1/2."""
+    pos = y_proba[y_true == 1][:, None]
+    neg = y_proba[y_true == 0][None, :]
+    return float(np.mean((pos > neg) + 0.5 * (pos == neg)))
+
+
+def test_auc_roc_known_value(binary_classification_proba_mixed):
+    """Test AUC equals the pairwise definition."""
+    y_true, y_proba = binary_classification_proba_mixed
+
+    assert auc_roc(y_true, y_proba) == pytest.approx(pairwise_auc(y_true, y_proba))
+
+
+def test_auc_roc_counts_ties_as_half():
+    """Test tied scores contribute 1/2, whatever their order in the input."""
+    y_true = np.array([1, 0, 0, 1])
+    y_proba = np.array([0.5, 0.5, 0.5, 0.5])
+
+    assert auc_roc(y_true, y_proba) == 0.5
+    assert auc_roc(y_true[::-1], y_proba) == 0.5
+
+
+def test_auc_roc_matches_pairwise_with_many_ties():
+    """Test AUC on heavily tied (discretized) scores."""
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 500)
+    y_proba = np.round(rng.random(500) * 0.5 + 0.3 * y_true, 1)
+
+    assert auc_roc(y_true, y_proba) == pytest.approx(pairwise_auc(y_true, y_proba))
+
+
+def test_auc_roc_single_class_returns_zero():
+    """Test AUC is 0.0 when only one class is present."""
+    assert auc_roc(np.array([1, 1, 1]), np.array([0.2, 0.5, 0.9])) == 0.0
+
+
+def test_binned_auc_metric_is_close_to_exact():
+    """Test the histogram AUC approximates the exact one."""
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 2, 20_000)
+    y_proba = np.clip(rng.normal(0.4 + 0.2 * y_true, 0.2), 0, 1)
+
+    binned = BinnedAUCMetric(n_bins=1000, chunk_size=3000).compute(y_true, y_proba)
+
+    assert binned == pytest.approx(auc_roc(y_true, y_proba), abs=1e-3)
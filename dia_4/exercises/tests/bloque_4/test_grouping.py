@@ -0,0 +1,130 @@
+"""Tests para la evaluación por grupos del Bloque 4."""
+
+import numpy as np
+import pytest
+
+from exercises.bloque_4.evaluation import (
+    AccuracyMetric,
+    AUCROCMetric,
+    ClassificationEvaluator,
+    F1Metric,
+    MAEMetric,
+    MaxErrorMetric,
+    R2Metric,
+    RegressionEvaluator,
+    RMSEMetric,
+)
+from exercises.bloque_4.grouping import GroupIndex, grouped_confusion_matrices
+from exercises.bloque_4.helpers import accuracy, confusion_matrix
+
+
+@pytest.fixture
+def grouped_classification():
+    """Labels, predictions, scores and a country key per sample."""
+    rng = np.random.default_rng(0)
+    n = 600
+    y_true = rng.integers(0, 2, n)
+    y_pred = np.where(rng.random(n) < 0.75, y_true, 1 - y_true)
+    y_proba = np.clip(0.3 + 0.4 * y_true + rng.normal(0, 0.25, n), 0, 1)
+    countries = rng.choice(np.array(["es", "fr", "mx", "ar"]), n)
+    return y_true, y_pred, y_proba, countries
+
+
+class PlainAccuracyMetric:
+    """Accuracy without compute_from_confusion."""
+
+    @property
+    def name(self) -> str:
+        return "plain_accuracy"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return accuracy(y_true, y_pred)
+
+
+class MedianAbsoluteErrorMetric:
+    """Regression metric without an accumulator shortcut."""
+
+    @property
+    def name(self) -> str:
+        return "median_ae"
+
+    def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return float(np.median(np.abs(y_true - y_pred)))
+
+
+def test_group_index_split_keeps_original_order():
+    """Test split returns each group's samples in their original order."""
+    index = GroupIndex(np.array([2, 1, 2, 1, 3]))
+
+    parts = index.split(np.array([10, 20, 30, 40, 50]))
+
+    assert index.key_list() == [1, 2, 3]
+    assert [part.tolist() for part in parts] == [[20, 40], [10, 30], [50]]
+
+
+def test_group_index_accepts_bool_keys():
+    """Test bool group keys are grouped by value, not used as a mask."""
+    index = GroupIndex(np.array([True, False, True, True]))
+
+    parts = index.split(np.array([10, 20, 30, 40]))
+
+    assert index.key_list() == [False, True]
+    assert [part.tolist() for part in parts] == [[20], [10, 30, 40]]
+
+
+def test_grouped_confusion_matrices_match_per_group(grouped_classification):
+    """Test one bincount gives every group's confusion matrix."""
+    y_true, y_pred, _, countries = grouped_classification
+    index = GroupIndex(countries)
+
+    matrices = grouped_confusion_matrices(y_true, y_pred, index)
+
+    for key, cm in zip(index.key_list(), matrices):
+        mask = countries == key
+        np.testing.assert_array_equal(cm, confusion_matrix(y_true[mask], y_pred[mask]))
+
+
+def test_classification_evaluate_grouped_matches_per_group_evaluate(grouped_classification):
+    """Test grouped results equal evaluate() on each filtered slice."""
+    y_true, y_pred, y_proba, countries = grouped_classification
+    evaluator = ClassificationEvaluator(
+        metrics=[AccuracyMetric(), F1Metric(), PlainAccuracyMetric()],
+        probabilistic_metrics=[AUCROCMetric()],
+        model_name="m",
+    )
+
+    grouped = evaluator.evaluate_grouped(y_true, y_pred, countries, y_proba=y_proba)
+
+    assert list(grouped) == ["ar", "es", "fr", "mx"]
+    for key, result in grouped.items():
+        mask = countries == key
+        expected = evaluator.evaluate(y_true[mask], y_pred[mask], y_proba[mask])
+        assert result.model_name == "m"
+        assert result.metrics == pytest.approx(expected.metrics)
+
+
+def test_regression_evaluate_grouped_matches_per_group_evaluate():
+    """Test grouped regression results equal evaluate() on each slice."""
+    rng = np.random.default_rng(1)
+    y_true = rng.normal(50, 10, 500)
+    y_pred = y_true + rng.normal(0, 2, 500)
+    devices = rng.integers(0, 3, 500)
+    metrics = [RMSEMetric(), MAEMetric(), R2Metric(), MaxErrorMetric()]
+    evaluator = RegressionEvaluator(metrics=[*metrics, MedianAbsoluteErrorMetric()])
+
+    grouped = evaluator.evaluate_grouped(y_true, y_pred, devices)
+
+    assert list(grouped) == [0, 1, 2]
+    for key, result in grouped.items():
+        mask = devices == key
+        expected = evaluator.evaluate(y_true[mask], y_pred[mask])
+        assert result.metrics == pytest.approx(expected.metrics)
+
+
+def test_evaluate_grouped_rejects_length_mismatch(grouped_classification):
+    """Test groups must have one key per sample."""
+    y_true, y_pred, _, countries = grouped_classification
+    evaluator = ClassificationEvaluator(metrics=[AccuracyMetric()])
+
+    with pytest.raises(ValueError, match="same length"):
+        evaluator.evaluate_grouped(y_true, y_pred, countries[:-1])
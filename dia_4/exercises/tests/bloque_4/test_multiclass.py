@@ -0,0 +1,188 @@
+"""Tests para las métricas multiclase y multietiqueta del Bloque 4."""
+
+import numpy as np
+import pytest
+
+from exercises.bloque_4.capabilities import ConfusionMatrixMetric
+from exercises.bloque_4.evaluation import (
+    AccuracyMetric,
+    ClassificationEvaluator,
+    MulticlassF1Metric,
+    MultilabelF1Metric,
+    OneVsRestAUCMetric,
+    TopKAccuracyMetric,
+)
+from exercises.bloque_4.helpers import (
+    accuracy,
+    auc_roc,
+    auc_roc_ovr,
+    f1_binary,
+    f1_multiclass,
+    f1_multilabel,
+    top_k_accuracy,
+)
+
+
+@pytest.fixture
+def multiclass_scores():
+    """Labels, rounded scores (with ties) and argmax predictions for 6 classes."""
+    rng = np.random.default_rng(11)
+    n, n_classes = 2000, 6
+    y_true = rng.integers(0, n_classes, n)
+    y_proba = rng.random((n, n_classes))
+    y_proba[np.arange(n), y_true] += 0.4
+    y_proba = np.round(y_proba, 2)
+    return y_true, y_proba, y_proba.argmax(axis=1)
+
+
+def _per_class_f1(y_true, y_pred, n_classes):
+    """Per-class F1 computed one class at a time."""
+    return np.array([f1_binary(y_true == c, y_pred == c) for c in range(n_classes)])
+
+
+def test_f1_macro_matches_per_class_mean(multiclass_scores):
+    """Test macro F1 is the mean of the one-vs-rest binary F1 scores."""
+    y_true, _, y_pred = multiclass_scores
+    expected = _per_class_f1(y_true, y_pred, 6).mean()
+    assert f1_multiclass(y_true, y_pred, "macro") == pytest.approx(expected)
+
+
+def test_f1_weighted_uses_support(multiclass_scores):
+    """Test weighted F1 weights each class by its support."""
+    y_true, _, y_pred = multiclass_scores
+    support = np.bincount(y_true, minlength=6)
+    expected = np.dot(_per_class_f1(y_true, y_pred, 6), support) / support.sum()
+    assert f1_multiclass(y_true, y_pred, "weighted") == pytest.approx(expected)
+
+
+def test_f1_micro_equals_accuracy(multiclass_scores):
+    """Test micro F1 equals accuracy for single-label multiclass data."""
+    y_true, _, y_pred = multiclass_scores
+    assert f1_multiclass(y_true, y_pred, "micro") == pytest.approx(accuracy(y_true, y_pred))
+
+
+def test_f1_macro_ignores_absent_classes():
+    """Test classes with no true or predicted samples do not lower macro F1."""
+    y_true = np.array([0, 0, 2, 2])
+    y_pred = np.array([0, 0, 2, 2])
+    assert f1_multiclass(y_true, y_pred, "macro", n_classes=10) == 1.0
+
+
+def test_f1_invalid_average_raises():
+    """Test unknown averages are rejected by the helper and the metric."""
+    with pytest.raises(ValueError):
+        f1_multiclass(np.array([0, 1]), np.array([0, 1]), "samples")
+    with pytest.raises(ValueError):
+        MulticlassF1Metric("samples")
+
+
+def test_f1_multilabel_matches_per_label():
+    """Test multilabel F1 matches per-label binary F1 (macro) and pooled counts (micro)."""
+    rng = np.random.default_rng(5)
+    y_true = rng.random((500, 4)) < 0.3
+    y_pred = rng.random((500, 4)) < 0.3
+    expected = np.mean([f1_binary(y_true[:, j], y_pred[:, j]) for j in range(4)])
+    assert f1_multilabel(y_true, y_pred, "macro") == pytest.approx(expected)
+    tp = np.sum(y_true & y_pred)
+    micro = 2 * tp / (y_true.sum() + y_pred.sum())
+    assert f1_multilabel(y_true, y_pred, "micro") == pytest.approx(micro)
+
+
+def test_auc_ovr_matches_per_class_auc(multiclass_scores):
+    """Test one-vs-rest AUC averages the per-class binary AUCs."""
+    y_true, y_proba, _ = multiclass_scores
+    per_class = [auc_roc((y_true == c).astype(int), y_proba[:, c]) for c in range(6)]
+    assert auc_roc_ovr(y_true, y_proba) == pytest.approx(np.mean(per_class))
+    weights = np.bincount(y_true)
+    weighted = np.dot(per_class, weights) / weights.sum()
+    assert auc_roc_ovr(y_true, y_proba, "weighted") == pytest.approx(weighted)
+
+
+def test_auc_ovr_multilabel_matches_per_label():
+    """Test one-vs-rest AUC on multilabel input averages the per-label AUCs."""
+    rng = np.random.default_rng(2)
+    y_true = (rng.random((400, 3)) < 0.4).astype(int)
+    y_proba = np.round(rng.random((400, 3)) + 0.3 * y_true, 1)
+    per_label = [auc_roc(y_true[:, j], y_proba[:, j]) for j in range(3)]
+    assert auc_roc_ovr(y_true, y_proba) == pytest.approx(np.mean(per_label))
+
+
+def test_auc_ovr_skips_classes_without_samples():
+    """Test classes absent from y_true are left out of the average."""
+    y_true = np.array([0, 1, 0, 1])
+    y_proba = np.array([[0.9, 0.1, 0.0], [0.2, 0.8, 0.0], [0.7, 0.3, 0.0], [0.4, 0.6, 0.0]])
+    assert auc_roc_ovr(y_true, y_proba) == 1.0
+
+
+def test_auc_ovr_validates_labels():
+    """Test out-of-range labels and 1-D scores are rejected."""
+    with pytest.raises(ValueError):
+        auc_roc_ovr(np.array([0, 3]), np.random.rand(2, 3))
+    with pytest.raises(ValueError):
+        auc_roc_ovr(np.array([0, 1]), np.random.rand(2))
+
+
+def test_top_k_accuracy_matches_argsort_without_ties():
+    """Test top-k accuracy matches a full argsort when scores have no ties."""
+    rng = np.random.default_rng(4)
+    y_true = rng.integers(0, 10, 1000)
+    y_proba = rng.random((1000, 10))
+    for k in (1, 3, 10):
+        top_k = np.argsort(-y_proba, axis=1)[:, :k]
+        expected = np.mean((top_k == y_true[:, None]).any(axis=1))
+        assert top_k_accuracy(y_true, y_proba, k) == pytest.approx(expected)
+
+
+def test_top_k_accuracy_counts_ties_as_hits():
+    """Test a true class tied with the k-th best score counts as a hit."""
+    y_true = np.array([2])
+    y_proba = np.array([[0.5, 0.5, 0.5]])
+    assert top_k_accuracy(y_true, y_proba, 1) == 1.0
+
+
+def test_top_k_accuracy_invalid_k_raises():
+    """Test k < 1 is rejected by the helper and the metric."""
+    with pytest.raises(ValueError):
+        top_k_accuracy(np.array([0]), np.array([[1.0]]), 0)
+    with pytest.raises(ValueError):
+        TopKAccuracyMetric(0)
+
+
+def test_metric_names():
+    """Test the names reported by the multiclass metrics."""
+    assert MulticlassF1Metric("weighted").name == "f1_weighted"
+    assert MultilabelF1Metric().name == "f1_multilabel_macro"
+    assert OneVsRestAUCMetric().name == "auc_roc_ovr_macro"
+    assert TopKAccuracyMetric(3).name == "top_3_accuracy"
+
+
+def test_multiclass_f1_is_confusion_metric():
+    """Test only the single-label F1 metric can use the confusion matrix."""
+    assert isinstance(MulticlassF1Metric(), ConfusionMatrixMetric)
+    assert not isinstance(MultilabelF1Metric(), ConfusionMatrixMetric)
+
+
+def test_evaluator_with_multiclass_metrics(multiclass_scores):
+    """Test the evaluator combines multiclass label and probability metrics."""
+    y_true, y_proba, y_pred = multiclass_scores
+    evaluator = ClassificationEvaluator(
+        metrics=[AccuracyMetric(), MulticlassF1Metric("macro"), MulticlassF1Metric("micro")],
+        probabilistic_metrics=[OneVsRestAUCMetric(), TopKAccuracyMetric(2)],
+    )
+    result = evaluator.evaluate(y_true, y_pred, y_proba)
+    assert result.metrics["f1_micro"] == pytest.approx(result.metrics["accuracy"])
+    assert result.metrics["f1_macro"] == pytest.approx(f1_multiclass(y_true, y_pred))
+    assert result.metrics["auc_roc_ovr_macro"] == pytest.approx(auc_roc_ovr(y_true, y_proba))
+    assert result.metrics["top_2_accuracy"] >= result.metrics["accuracy"]
+
+
+def test_evaluate_grouped_with_multiclass_metrics(multiclass_scores):
+    """Test grouped evaluation matches evaluating each group separately."""
+    y_true, y_proba, y_pred = multiclass_scores
+    groups = np.arange(len(y_true)) % 3
+    evaluator = ClassificationEvaluator([MulticlassF1Metric()], [TopKAccuracyMetric(2)])
+    results = evaluator.evaluate_grouped(y_true, y_pred, groups, y_proba)
+    for key, result in results.items():
+        mask = groups == key
+        expected = evaluator.evaluate(y_true[mask], y_pred[mask], y_proba[mask])
+        assert result.metrics == pytest.approx(expected.metrics)
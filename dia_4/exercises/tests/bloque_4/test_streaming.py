@@ -0,0 +1,228 @@
+"""Tests para los acumuladores en streaming del Bloque 4."""
+
+import numpy as np
+import pytest
+
+from exercises.bloque_4.evaluation import (
+    MAEMetric,
+    MaxErrorMetric,
+    R2Metric,
+    RegressionEvaluator,
+    RMSEMetric,
+)
+from exercises.bloque_4.helpers import auc_roc, mae, max_error, r2_score, rmse
+from exercises.bloque_4.streaming import (
+    BinnedAUCAccumulator,
+    RegressionAccumulator,
+    binned_auc,
+    iter_chunks,
+)
+
+
+@pytest.fixture
+def scored_sample():
+    """Labels and continuous scores with partial separation."""
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 10_000)
+    y_proba = np.clip(rng.normal(0.45 + 0.15 * y_true, 0.2), 0, 1)
+    return y_true, y_proba
+
+
+# ============================================================================
+# TESTS: iter_chunks
+# ============================================================================
+def test_iter_chunks_yields_aligned_views():
+    """Test chunks are aligned slices of every array."""
+    a = np.arange(7)
+    b = np.arange(7) * 10
+
+    chunks = list(iter_chunks(a, b, chunk_size=3))
+
+    assert [len(x) for x, _ in chunks] == [3, 3, 1]
+    assert chunks[2][1].tolist() == [60]
+
+
+def test_iter_chunks_rejects_length_mismatch():
+    """Test arrays must have the same length."""
+    with pytest.raises(ValueError, match="same length"):
+        list(iter_chunks(np.arange(3), np.arange(4)))
+
+
+def test_iter_chunks_reads_memmap(tmp_path):
+    """Test chunks can come from a memory-mapped .npy file."""
+    path = tmp_path / "scores.npy"
+    np.save(path, np.linspace(0, 1, 10))
+    scores = np.load(path, mmap_mode="r")
+
+    total = sum(float(chunk.sum()) for (chunk,) in iter_chunks(scores, chunk_size=4))
+
+    assert total == pytest.approx(5.0)
+
+
+# ============================================================================
+# TESTS: BinnedAUCAccumulator
+# ============================================================================
+def test_binned_auc_approximates_exact_auc(scored_sample):
+    """Test the binned AUC is within a tight tolerance of the rank-based AUC."""
+    y_true, y_proba = scored_sample
+    accumulator = BinnedAUCAccumulator(n_bins=2000)
+
+    accumulator.update(y_true, y_proba)
+
+    assert accumulator.n_samples == len(y_true)
+    assert accumulator.auc() == pytest.approx(auc_roc(y_true, y_proba), abs=1e-3)
+
+
+def test_binned_auc_is_exact_when_scores_fall_on_bins():
+    """Test discrete scores (one per bin) give the exact tie-aware AUC."""
+    y_true = np.array([1, 0, 1, 0, 1, 0])
+    y_proba = np.array([0.9, 0.1, 0.5, 0.5, 0.1, 0.9])
+    accumulator = BinnedAUCAccumulator(n_bins=10)
+
+    accumulator.update(y_true, y_proba)
+
+    assert accumulator.auc() == pytest.approx(auc_roc(y_true, y_proba))
+
+
+def test_merged_accumulators_equal_single_pass(scored_sample):
+    """Test merging per-shard accumulators gives the same histogram."""
+    y_true, y_proba = scored_sample
+    whole = BinnedAUCAccumulator(n_bins=500)
+    whole.update(y_true, y_proba)
+
+    shards = []
+    for true_chunk, proba_chunk in iter_chunks(y_true, y_proba, chunk_size=3000):
+        shard = BinnedAUCAccumulator(n_bins=500)
+        shard.update(true_chunk, proba_chunk)
+        shards.append(shard)
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    assert merged.auc() == whole.auc()
+
+
+def test_merge_rejects_different_bins():
+    """Test only accumulators with identical bins can be merged."""
+    with pytest.raises(ValueError, match="bins"):
+        BinnedAUCAccumulator(n_bins=10).merge(BinnedAUCAccumulator(n_bins=20))
+
+
+def test_binned_auc_clips_out_of_range_scores():
+    """Test scores outside [low, high] fall into the edge bins."""
+    accumulator = BinnedAUCAccumulator(n_bins=4)
+
+    accumulator.update(np.array([0, 1]), np.array([-3.0, 7.0]))
+
+    assert accumulator.counts[0].tolist() == [1, 0]
+    assert accumulator.counts[-1].tolist() == [0, 1]
+    assert accumulator.auc() == 1.0
+
+
+def test_binned_auc_from_chunk_stream(scored_sample):
+    """Test binned_auc consumes an iterable of chunks."""
+    y_true, y_proba = scored_sample
+
+    streamed = binned_auc(iter_chunks(y_true, y_proba, chunk_size=1024), n_bins=2000)
+
+    assert streamed == pytest.approx(auc_roc(y_true, y_proba), abs=1e-3)
+
+
+# ============================================================================
+# TESTS: RegressionAccumulator
+# ============================================================================
+@pytest.fixture
+def regression_sample():
+    """Large-offset targets with small noise (stresses R² precision)."""
+    rng = np.random.default_rng(2)
+    y_true = 1000.0 + rng.normal(0, 1, 10_001)
+    y_pred = y_true + rng.normal(0, 0.3, y_true.size)
+    return y_true, y_pred
+
+
+def test_regression_accumulator_matches_in_memory_helpers(regression_sample):
+    """Test chunked accumulation reproduces every full-array metric."""
+    y_true, y_pred = regression_sample
+    accumulator = RegressionAccumulator()
+
+    accumulator.update_chunked(y_true, y_pred, chunk_size=999)
+
+    assert accumulator.count == y_true.size
+    assert accumulator.rmse() == pytest.approx(rmse(y_true, y_pred), rel=1e-12)
+    assert accumulator.mae() == pytest.approx(mae(y_true, y_pred), rel=1e-12)
+    assert accumulator.max_error() == max_error(y_true, y_pred)
+    assert accumulator.r2() == pytest.approx(r2_score(y_true, y_pred), rel=1e-9)
+
+
+def test_regression_accumulators_merge_across_shards(regression_sample):
+    """Test merging per-worker accumulators equals one accumulator over all data."""
+    y_true, y_pred = regression_sample
+    whole = RegressionAccumulator()
+    whole.update(y_true, y_pred)
+
+    merged = RegressionAccumulator()
+    for true_shard, pred_shard in iter_chunks(y_true, y_pred, chunk_size=2500):
+        shard = RegressionAccumulator()
+        shard.update(true_shard, pred_shard)
+        merged.merge(shard)
+
+    assert merged.count == whole.count
+    assert merged.rmse() == pytest.approx(whole.rmse(), rel=1e-12)
+    assert merged.r2() == pytest.approx(whole.r2(), rel=1e-9)
+    assert merged.max_error() == whole.max_error()
+
+
+def test_regression_accumulator_from_npy(tmp_path, regression_sample):
+    """Test accumulating from memory-mapped .npy files."""
+    y_true, y_pred = regression_sample
+    np.save(tmp_path / "y_true.npy", y_true.astype(np.float32))
+    np.save(tmp_path / "y_pred.npy", y_pred.astype(np.float32))
+
+    accumulator = RegressionAccumulator.from_npy(
+        tmp_path / "y_true.npy", tmp_path / "y_pred.npy", chunk_size=4096
+    )
+
+    expected = rmse(y_true.astype(np.float32).astype(np.float64), y_pred.astype(np.float32))
+    assert accumulator.rmse() == pytest.approx(expected, rel=1e-6)
+
+
+def test_regression_accumulator_empty_and_constant():
+    """Test degenerate cases: no data and constant targets."""
+    empty = RegressionAccumulator()
+    assert (empty.rmse(), empty.mae(), empty.r2()) == (0.0, 0.0, 1.0)
+
+    constant = RegressionAccumulator()
+    constant.update(np.array([2.0, 2.0]), np.array([2.0, 3.0]))
+    assert constant.r2() == 0.0
+
+
+def test_regression_evaluator_chunks_match_evaluate(regression_sample):
+    """Test evaluate_chunks gives the same EvaluationResult as evaluate."""
+    y_true, y_pred = regression_sample
+    evaluator = RegressionEvaluator(
+        metrics=[RMSEMetric(), MAEMetric(), R2Metric(), MaxErrorMetric()], model_name="m"
+    )
+
+    full = evaluator.evaluate(y_true, y_pred)
+    streamed = evaluator.evaluate_chunks(iter_chunks(y_true, y_pred, chunk_size=1000))
+
+    assert streamed.model_name == "m"
+    assert streamed.metrics == pytest.approx(full.metrics, rel=1e-9)
+
+
+def test_regression_evaluator_accumulator_rejects_non_streaming_metric():
+    """Test metrics without compute_from_accumulator are rejected."""
+
+    class MedianErrorMetric:
+        @property
+        def name(self) -> str:
+            return "median_error"
+
+        def compute(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+            return float(np.median(np.abs(y_true - y_pred)))
+
+    evaluator = RegressionEvaluator(metrics=[RMSEMetric(), MedianErrorMetric()])
+
+    with pytest.raises(TypeError, match="median_error"):
+        evaluator.evaluate_accumulator(RegressionAccumulator())
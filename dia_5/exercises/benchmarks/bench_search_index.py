@@ -0,0 +1,95 @@
+"""
+Benchmark de construcción y consulta de los índices de autocompletado.
+
+Genera un flujo sintético de términos con distribución de Zipf (pocos términos
+muy frecuentes, cola larga de términos raros) y mide:
+- Tiempo de construcción de PrefixIndex y TrigramIndex
+- Memoria retenida por cada índice (tracemalloc, opcional con --memory); los
+  strings de los términos se comparten con el Counter y no se cuentan
+- Latencia media por consulta en microsegundos
+
+Ejecutar:
+    uv run python benchmarks/bench_search_index.py
+    uv run python benchmarks/bench_search_index.py --terms 10000000 --vocab 500000 --memory
+"""
+
+import argparse
+import random
+import string
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import TypeVar
+
+from exercises.search_index import PrefixIndex, TrigramIndex, count_normalized_terms
+
+T = TypeVar("T")
+
+
+def generate_terms(n_terms: int, vocab_size: int, seed: int = 0) -> list[str]:
+    """Generate n_terms raw terms drawn from a Zipf-like vocabulary."""
+    rng = random.Random(seed)
+    vocab = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 12)))
+        for _ in range(vocab_size)
+    ]
+    weights = [1 / rank for rank in range(1, vocab_size + 1)]
+    return rng.choices(vocab, weights=weights, k=n_terms)
+
+
+def time_queries(query_fn, queries: list[str]) -> float:
+    """Return the mean latency of query_fn over queries, in microseconds."""
+    start = time.perf_counter()
+    for query in queries:
+        query_fn(query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def traced_size(build_fn: Callable[[], T]) -> tuple[T, int]:
+    """Build an object under tracemalloc and return it with its retained bytes."""
+    tracemalloc.start()
+    obj = build_fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark de construcción y consulta de los índices de autocompletado"
+    )
+    parser.add_argument("--terms", type=int, default=1_000_000)
+    parser.add_argument("--vocab", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--memory", action="store_true", help="medir memoria retenida")
+    args = parser.parse_args()
+
+    terms = generate_terms(args.terms, args.vocab)
+    print(f"terms={args.terms:,} vocab={args.vocab:,}")
+
+    start = time.perf_counter()
+    counts = count_normalized_terms(terms)
+    print(f"normalize+count: {time.perf_counter() - start:8.2f} s ({len(counts):,} únicos)")
+
+    for name, index_cls in (("PrefixIndex", PrefixIndex), ("TrigramIndex", TrigramIndex)):
+        start = time.perf_counter()
+        index = index_cls(counts)
+        print(f"{name} build:    {time.perf_counter() - start:8.2f} s")
+        if args.memory:
+            del index
+            index, size = traced_size(lambda cls=index_cls: cls(counts))
+            print(f"{name} memory:   {size / 2**20:8.1f} MiB")
+
+        rng = random.Random(1)
+        sample = rng.sample(sorted(counts), min(args.queries, len(counts)))
+        if isinstance(index, PrefixIndex):
+            queries = [term[: rng.randint(1, 4)] for term in sample]
+            latency = time_queries(index.complete, queries)
+        else:
+            queries = [term[:-1] + "x" for term in sample[: max(1, len(sample) // 10)]]
+            latency = time_queries(index.search, queries)
+        print(f"{name} query:    {latency:8.1f} µs/consulta")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+Índices para autocompletado sobre texto normalizado.
+
+Este módulo construye, a partir de un flujo de términos, dos índices en memoria
+sobre el texto normalizado con normalize_for_search:
+- PrefixIndex: array ordenado de términos únicos + frecuencias, con búsqueda
+  binaria (bisect) para resolver prefijos sin recorrer todo el vocabulario, y
+  el top-k ya calculado para los prefijos que abarcan muchos términos
+- TrigramIndex: listas invertidas trigrama → ids de término para búsquedas
+  aproximadas (fuzzy) tolerantes a erratas
+"""
+
+import heapq
+import math
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
+
+from .search_normalizer import normalize_for_search
+
+# Carácter que sigue a cualquier otro en orden Unicode: cierra el rango de un prefijo
+_PREFIX_SENTINEL = "\U0010ffff"
+
+# Prefijos con más términos que esto guardan su top-k precalculado
+_MIN_CACHED_RANGE = 256
+
+# Tamaño del top-k precalculado; consultas con k mayor recorren el rango
+_CACHED_TOP_K = 10
+
+# Relleno de los bordes del término, para que inicio y final generen trigramas propios
+_TRIGRAM_PADDING = "  "
+
+_EMPTY_POSTING = array("i")
+
+
+def count_normalized_terms(terms: Iterable[str]) -> Counter[str]:
+    """
+    Normalize a stream of terms and count how often each one appears.
+
+    Terms that normalize to an empty string are skipped.
+
+    :param terms: Raw terms (queries, titles, tags...)
+    :type terms: Iterable[str]
+    :return: Frequency of each normalized term
+    :rtype: Counter[str]
+    """
+    counts: Counter[str] = Counter()
+    for term in terms:
+        normalized = normalize_for_search(term)
+        if normalized:
+            counts[normalized] += 1
+    return counts
+
+
+def extract_trigrams(term: str) -> set[str]:
+    """
+    Extract the set of character trigrams of a term.
+
+    The term is padded with spaces so that short terms still produce trigrams
+    and so that the beginning and end of the word weigh in the similarity.
+
+    :param term: Normalized term
+    :type term: str
+    :return: Set of trigrams
+    :rtype: set[str]
+
+    Example:
+        >>> sorted(extract_trigrams("sol"))
+        ['  s', ' so', 'l  ', 'ol ', 'sol']
+    """
+    padded = f"{_TRIGRAM_PADDING}{term}{_TRIGRAM_PADDING}"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class PrefixIndex:
+    """
+    Sorted-array prefix index with term frequencies.
+
+    Terms are stored once, sorted, in a plain list; frequencies live in a
+    parallel array('I'). A prefix query is two binary searches that delimit the
+    matching slice, followed by a top-k selection by frequency over that slice.
+
+    Short, popular prefixes ("a", "ca"...) match a large slice of the
+    vocabulary, so at build time every prefix matching more than
+    _MIN_CACHED_RANGE terms stores its _CACHED_TOP_K best term ids. Queries
+    on those prefixes just read the stored list; any other prefix scans at
+    most _MIN_CACHED_RANGE terms.
+    """
+
+    def __init__(self, counts: dict[str, int]) -> None:
+        """
+        Build the index from already normalized term frequencies.
+
+        :param counts: Mapping normalized term → frequency
+        :type counts: dict[str, int]
+        """
+        self._terms = sorted(counts)
+        self._counts = array("I", (counts[term] for term in self._terms))
+        self._top_k: dict[str, array] = {}
+        self._cache_popular_prefixes()
+
+    @classmethod
+    def from_terms(cls, terms: Iterable[str]) -> "PrefixIndex":
+        """
+        Build the index from a stream of raw terms.
+
+        :param terms: Raw terms, normalized with normalize_for_search
+        :type terms: Iterable[str]
+        :return: Prefix index over the normalized terms
+        :rtype: PrefixIndex
+        """
+        return cls(count_normalized_terms(terms))
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def complete(self, prefix: str, k: int = 10) -> list[tuple[str, int]]:
+        """
+        Return the k most frequent terms starting with prefix.
+
+        :param prefix: Query prefix (normalized with normalize_for_search)
+        :type prefix: str
+        :param k: Maximum number of completions
+        :type k: int
+        :return: (term, frequency) pairs, most frequent first
+        :rtype: list[tuple[str, int]]
+
+        Example:
+            >>> index = PrefixIndex.from_terms(["Café", "cafetera", "café", "casa"])
+            >>> index.complete("caf")
+            [('cafe', 2), ('cafetera', 1)]
+        """
+        prefix = normalize_for_search(prefix)
+        cached = self._top_k.get(prefix)
+        if cached is not None and k <= _CACHED_TOP_K:
+            ranked = cached[:k]
+        else:
+            start = bisect_left(self._terms, prefix)
+            stop = bisect_left(self._terms, prefix + _PREFIX_SENTINEL, lo=start)
+            ranked = self._rank(start, stop, k)
+        return [(self._terms[i], self._counts[i]) for i in ranked]
+
+    def _rank(self, start: int, stop: int, k: int) -> list[int]:
+        """Ids of the k most frequent terms in [start, stop), ties by term order."""
+        counts = self._counts
+        return heapq.nsmallest(k, range(start, stop), key=lambda i: (-counts[i], i))
+
+    def _cache_popular_prefixes(self) -> None:
+        """Store the top-k of every prefix matching more than _MIN_CACHED_RANGE terms."""
+        terms = self._terms
+        # Rangos [start, stop) de los términos que empiezan por terms[start][:depth]
+        pending = [(0, len(terms), 0)]
+        while pending:
+            start, stop, depth = pending.pop()
+            if stop - start <= _MIN_CACHED_RANGE:
+                continue
+            self._top_k[terms[start][:depth]] = array("i", self._rank(start, stop, _CACHED_TOP_K))
+            child = start
+            while child < stop and len(terms[child]) == depth:
+                child += 1
+            while child < stop:
+                child_prefix = terms[child][: depth + 1]
+                child_stop = bisect_left(terms, child_prefix + _PREFIX_SENTINEL, child, stop)
+                pending.append((child, child_stop, depth + 1))
+                child = child_stop
+
+
+class TrigramIndex:
+    """
+    Character-trigram inverted index for fuzzy term lookup.
+
+    Each trigram maps to a compact array('i') of term ids. A query counts how
+    many trigrams every candidate shares with it and ranks candidates by the
+    Jaccard similarity of both trigram sets.
+    """
+
+    def __init__(self, counts: dict[str, int]) -> None:
+        """
+        Build the index from already normalized term frequencies.
+
+        :param counts: Mapping normalized term → frequency
+        :type counts: dict[str, int]
+        """
+        self._terms = sorted(counts)
+        self._counts = array("I", (counts[term] for term in self._terms))
+        self._trigram_sizes = array("I")
+        postings: dict[str, array] = {}
+        for term_id, term in enumerate(self._terms):
+            trigrams = extract_trigrams(term)
+            self._trigram_sizes.append(len(trigrams))
+            for trigram in trigrams:
+                posting = postings.get(trigram)
+                if posting is None:
+                    posting = postings[trigram] = array("i")
+                posting.append(term_id)
+        self._postings = postings
+
+    @classmethod
+    def from_terms(cls, terms: Iterable[str]) -> "TrigramIndex":
+        """
+        Build the index from a stream of raw terms.
+
+        :param terms: Raw terms, normalized with normalize_for_search
+        :type terms: Iterable[str]
+        :return: Trigram index over the normalized terms
+        :rtype: TrigramIndex
+        """
+        return cls(count_normalized_terms(terms))
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def search(
+        self, query: str, k: int = 10, min_similarity: float = 0.3
+    ) -> list[tuple[str, float]]:
+        """
+        Return the k terms most similar to query.
+
+        Ties in similarity are broken by term frequency, then by term order
+        (as in PrefixIndex.complete).
+
+        :param query: Query text (normalized with normalize_for_search)
+        :type query: str
+        :param k: Maximum number of results
+        :type k: int
+        :param min_similarity: Minimum Jaccard similarity (0.0 to 1.0)
+        :type min_similarity: float
+        :return: (term, similarity) pairs, most similar first
+        :rtype: list[tuple[str, float]]
+
+        Example:
+            >>> index = TrigramIndex.from_terms(["python", "pytorch", "java"])
+            >>> [term for term, _ in index.search("pithon")]
+            ['python']
+        """
+        query_trigrams = extract_trigrams(normalize_for_search(query))
+        query_size = len(query_trigrams)
+        postings = sorted(
+            (self._postings.get(trigram, _EMPTY_POSTING) for trigram in query_trigrams), key=len
+        )
+        # Jaccard >= min_similarity exige compartir al menos ceil(min_similarity * q)
+        # trigramas, así que todo candidato aparece en alguna de las q - mínimo + 1
+        # listas más cortas. Las listas largas (trigramas muy comunes) solo se usan
+        # para contar, con búsqueda binaria, los trigramas de esos candidatos.
+        min_shared = max(1, math.ceil(min_similarity * query_size - 1e-9))
+        n_probe = max(0, query_size - min_shared + 1)
+        shared: Counter[int] = Counter()
+        for posting in postings[:n_probe]:
+            shared.update(posting)
+        long_postings = postings[n_probe:]
+        if long_postings:
+            # Solo se verifican los candidatos que aún pueden llegar a min_similarity
+            sizes = self._trigram_sizes
+            n_long = len(long_postings)
+            reachable = []
+            for term_id, common in shared.items():
+                best_common = min(common + n_long, sizes[term_id])
+                if best_common / (query_size + sizes[term_id] - best_common) >= min_similarity:
+                    reachable.append(term_id)
+            for term_id in reachable:
+                for posting in long_postings:
+                    position = bisect_left(posting, term_id)
+                    if position < len(posting) and posting[position] == term_id:
+                        shared[term_id] += 1
+
+        scored = []
+        for term_id, common in shared.items():
+            similarity = common / (query_size + self._trigram_sizes[term_id] - common)
+            if similarity >= min_similarity:
+                scored.append((-similarity, -self._counts[term_id], term_id))
+
+        best = heapq.nsmallest(k, scored)
+        return [(self._terms[term_id], -similarity) for similarity, _, term_id in best]
@@ -38,6 +38,51 @@ Pistas:
 
 import re
 import unicodedata
+from functools import lru_cache
+
+# Categorías Unicode que se conservan en modo unicode: letras, marcas y números
+_KEPT_CATEGORIES = frozenset("LMN")
+# Máximo de code points memorizados por tabla: acota la memoria con textos
+# que usan muchísimos caracteres distintos (p. ej. CJK)
+_MAX_TABLE_ENTRIES = 4096
+
+
+class _UnicodeDeletionTable(dict):
+    """
+    Translation table for str.translate that deletes non-letter characters.
+
+    Entries are computed lazily on first lookup (via __missing__) and stored
+    up to _MAX_TABLE_ENTRIES code points; beyond that, new code points are
+    classified on every lookup instead of growing the table.
+    """
+
+    def __init__(self, keep: str) -> None:
+        super().__init__()
+        self._keep = frozenset(keep)
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        kept = (
+            char in self._keep
+            or char.isspace()
+            or unicodedata.category(char)[0] in _KEPT_CATEGORIES
+        )
+        value = codepoint if kept else None
+        if len(self) < _MAX_TABLE_ENTRIES:
+            self[codepoint] = value
+        return value
+
+
+@lru_cache(maxsize=32)
+def _ascii_special_chars_pattern(keep: str) -> re.Pattern[str]:
+    """Compile (once per keep) the ASCII-only special characters pattern."""
+    return re.compile(f"[^a-zA-Z0-9\\s{re.escape(keep)}]")
+
+
+@lru_cache(maxsize=32)
+def _unicode_deletion_table(keep: str) -> _UnicodeDeletionTable:
+    """Return the shared deletion table for a given keep argument."""
+    return _UnicodeDeletionTable(keep)
 
 
 def remove_accents(text: str) -> str:
@@ -83,16 +128,21 @@ def collapse_whitespace(text: str) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
 
-def remove_special_chars(text: str, keep: str = "-_") -> str:
+def remove_special_chars(text: str, keep: str = "-_", unicode_aware: bool = False) -> str:
     """
     Remove special characters except those specified in 'keep'.
     
     Only keeps alphanumeric characters, spaces, and characters in the keep parameter.
+    By default "alphanumeric" means ASCII letters and digits, so 'ñ', 'ü' or CJK
+    text are removed. With unicode_aware=True, any Unicode letter, mark or number
+    is kept instead, so multilingual text can be cleaned without remove_accents.
     
     :param text: Input text with potential special characters
     :type text: str
     :param keep: Characters to keep (in addition to alphanumeric and spaces)
     :type keep: str
+    :param unicode_aware: Keep non-ASCII letters based on their Unicode category
+    :type unicode_aware: bool
     :return: Text with special characters removed
     :rtype: str
     
@@ -101,9 +151,12 @@ def remove_special_chars(text: str, keep: str = "-_") -> str:
         'helloworld'
         >>> remove_special_chars("hello-world_2024", keep="-_")
         'hello-world_2024'
+        >>> remove_special_chars("¡Año nuevo! 東京", unicode_aware=True)
+        'Año nuevo 東京'
     """
-    pattern = f"[^a-zA-Z0-9\\s{re.escape(keep)}]"
-    return re.sub(pattern, "", text)
+    if unicode_aware:
+        return text.translate(_unicode_deletion_table(keep))
+    return _ascii_special_chars_pattern(keep).sub("", text)
 
 
 def normalize_for_search(text: str) -> str:
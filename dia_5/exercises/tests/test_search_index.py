@@ -0,0 +1,195 @@
+"""
+Tests para search_index.py
+
+Índices de autocompletado (prefijos y trigramas) sobre texto normalizado.
+
+Ejecutar:
+    uv run pytest tests/test_search_index.py -v
+"""
+
+import pytest
+
+from exercises.search_index import (
+    PrefixIndex,
+    TrigramIndex,
+    count_normalized_terms,
+    extract_trigrams,
+)
+
+
+@pytest.fixture
+def search_terms():
+    """Raw terms as they arrive from a query log."""
+    return [
+        "Python",
+        "python",
+        "PYTHON!",
+        "pytorch",
+        "pytorch",
+        "Pandas",
+        "  numpy ",
+        "Café",
+        "",
+        "¿?",
+    ]
+
+
+def test_count_normalized_terms_merges_variants_and_skips_empty(search_terms):
+    """Variants normalize to the same term and empty terms are dropped."""
+    # ACT
+    counts = count_normalized_terms(search_terms)
+
+    # ASSERT
+    assert counts["python"] == 3
+    assert counts["cafe"] == 1
+    assert "" not in counts
+
+
+def test_extract_trigrams_pads_short_terms():
+    """A one-letter term still produces trigrams thanks to padding."""
+    # ACT
+    trigrams = extract_trigrams("a")
+
+    # ASSERT
+    assert trigrams == {"  a", " a ", "a  "}
+
+
+def test_prefix_index_completes_by_frequency(search_terms):
+    """Completions are ranked by frequency, most frequent first."""
+    # ARRANGE
+    index = PrefixIndex.from_terms(search_terms)
+
+    # ACT
+    result = index.complete("py")
+
+    # ASSERT
+    assert result == [("python", 3), ("pytorch", 2)]
+
+
+def test_prefix_index_limits_to_k(search_terms):
+    """Only the k best completions are returned."""
+    # ARRANGE
+    index = PrefixIndex.from_terms(search_terms)
+
+    # ACT
+    result = index.complete("p", k=1)
+
+    # ASSERT
+    assert result == [("python", 3)]
+
+
+def test_prefix_index_normalizes_the_prefix(search_terms):
+    """The query prefix goes through the same normalization as the terms."""
+    # ARRANGE
+    index = PrefixIndex.from_terms(search_terms)
+
+    # ACT
+    result = index.complete("  CAFÉ")
+
+    # ASSERT
+    assert result == [("cafe", 1)]
+
+
+def test_prefix_index_unknown_prefix_returns_empty(search_terms):
+    """A prefix with no matches returns an empty list."""
+    # ARRANGE
+    index = PrefixIndex.from_terms(search_terms)
+
+    # ACT
+    result = index.complete("zz")
+
+    # ASSERT
+    assert result == []
+
+
+def test_trigram_index_finds_term_with_typo(search_terms):
+    """Fuzzy search tolerates a misspelled query."""
+    # ARRANGE
+    index = TrigramIndex.from_terms(search_terms)
+
+    # ACT
+    result = index.search("pyhton", k=1)
+
+    # ASSERT
+    assert result[0][0] == "python"
+
+
+def test_trigram_index_exact_match_has_similarity_one(search_terms):
+    """An exact match has Jaccard similarity 1.0 and ranks first."""
+    # ARRANGE
+    index = TrigramIndex.from_terms(search_terms)
+
+    # ACT
+    result = index.search("pandas")
+
+    # ASSERT
+    assert result[0] == ("pandas", 1.0)
+
+
+def test_trigram_index_respects_min_similarity(search_terms):
+    """Candidates below min_similarity are discarded."""
+    # ARRANGE
+    index = TrigramIndex.from_terms(search_terms)
+
+    # ACT
+    result = index.search("xyz", min_similarity=0.5)
+
+    # ASSERT
+    assert result == []
+
+
+def test_prefix_index_popular_prefix_uses_same_ranking_as_scan():
+    """Precomputed top-k of a popular prefix matches the full scan for larger k."""
+    # ARRANGE
+    counts = {f"term{i:04d}": i % 97 for i in range(1000)}
+    index = PrefixIndex(counts)
+
+    # ACT
+    cached = index.complete("term", k=5)
+    scanned = index.complete("term", k=50)
+
+    # ASSERT
+    assert cached == scanned[:5]
+    assert cached[0] == ("term0096", 96)
+
+
+def test_trigram_index_matches_terms_with_common_trigrams():
+    """Candidates sharing only very common trigrams are still scored exactly."""
+    # ARRANGE
+    counts = {f"ab{i:03d}": 1 for i in range(300)}
+    counts["abcd"] = 1
+    index = TrigramIndex(counts)
+
+    # ACT
+    result = index.search("abcd", k=3, min_similarity=0.1)
+
+    # ASSERT
+    assert result[0] == ("abcd", 1.0)
+    assert all(similarity >= 0.1 for _, similarity in result)
+
+
+def test_trigram_index_accepts_terms_with_many_trigrams():
+    """Terms with more than 65535 distinct trigrams do not overflow their size."""
+    # ARRANGE
+    long_term = "".join(chr(codepoint) for codepoint in range(0x4E00, 0x4E00 + 70_000))
+
+    # ACT
+    index = TrigramIndex({long_term: 1, "python": 1})
+
+    # ASSERT
+    assert len(index) == 2
+    assert index.search("python")[0] == ("python", 1.0)
+
+
+def test_indexes_break_ties_by_term_order():
+    """Equal scores and frequencies rank the alphabetically first term first in both indexes."""
+    # ARRANGE
+    counts = {"catb": 1, "cata": 1}
+
+    # ACT
+    completed = PrefixIndex(counts).complete("cat", k=1)
+    searched = TrigramIndex(counts).search("cat", k=1)
+
+    # ASSERT
+    assert completed == [("cata", 1)]
+    assert [term for term, _ in searched] == ["cata"]
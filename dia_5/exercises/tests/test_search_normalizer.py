@@ -18,6 +18,8 @@ Ejecutar:
 import pytest
 
 from exercises.search_normalizer import (
+    _MAX_TABLE_ENTRIES,
+    _unicode_deletion_table,
     collapse_whitespace,
     normalize_for_search,
     remove_accents,
@@ -91,6 +93,71 @@ def test_remove_special_chars_default_keep():
 # - Mezcla de letras, números y especiales
 
 
+def test_remove_special_chars_ascii_mode_drops_non_ascii_letters():
+    """Default mode only keeps ASCII letters, so ñ is removed."""
+    # ARRANGE
+    input_text = "año"
+
+    # ACT
+    result = remove_special_chars(input_text)
+
+    # ASSERT
+    assert result == "ao"
+
+
+def test_remove_special_chars_unicode_aware_keeps_non_ascii_letters():
+    """Unicode-aware mode keeps ñ, ü and CJK letters but drops punctuation."""
+    # ARRANGE
+    input_text = "¡Año pingüino! 東京, 2024?"
+    expected = "Año pingüino 東京 2024"
+
+    # ACT
+    result = remove_special_chars(input_text, unicode_aware=True)
+
+    # ASSERT
+    assert result == expected
+
+
+def test_remove_special_chars_unicode_aware_respects_keep():
+    """Unicode-aware mode keeps only the characters listed in keep."""
+    # ARRANGE
+    input_text = "niño-feliz_#1"
+
+    # ACT
+    default_keep = remove_special_chars(input_text, unicode_aware=True)
+    empty_keep = remove_special_chars(input_text, keep="", unicode_aware=True)
+
+    # ASSERT
+    assert default_keep == "niño-feliz_1"
+    assert empty_keep == "niñofeliz1"
+
+
+def test_remove_special_chars_unicode_aware_keeps_combining_marks():
+    """Decomposed accents (combining marks) survive unicode-aware mode."""
+    # ARRANGE
+    input_text = "cafe\u0301!"
+
+    # ACT
+    result = remove_special_chars(input_text, unicode_aware=True)
+
+    # ASSERT
+    assert result == "cafe\u0301"
+
+
+def test_remove_special_chars_unicode_aware_table_memory_is_bounded():
+    """The per-keep translation table stops growing at its size limit."""
+    # ARRANGE
+    input_text = "".join(chr(codepoint) for codepoint in range(0x4E00, 0x4E00 + 10_000))
+    keep = "+"
+
+    # ACT
+    result = remove_special_chars(input_text + "!", keep=keep, unicode_aware=True)
+
+    # ASSERT
+    assert result == input_text
+    assert len(_unicode_deletion_table(keep)) <= _MAX_TABLE_ENTRIES
+
+
 # ============================================================================
 # Tests para normalize_for_search
 # ============================================================================